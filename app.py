@@ -5,7 +5,9 @@ Integra captura, inferência e UI em pipeline multi-thread.
 
 import os
 import sys
+import atexit
 import logging
+import logging.handlers
 import threading
 import time
 import queue
@@ -19,7 +21,7 @@ import numpy as np
 import torch
 
 from camera_basler import BaslerCamera
-from infer import YOLODetector
+from infer import YOLODetector, FrameBatcher
 from ui_v2 import YOLODetectionUI  # NOVA UI V2
 from config_manager import ConfigManager
 
@@ -32,14 +34,23 @@ def setup_logging():
     
     log_file = log_dir / f"yolo_detection_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler(log_file, encoding='utf-8'),
+        logging.StreamHandler(sys.stdout)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Arquivo e console escritos por um thread próprio: as threads de UI/inferência só enfileiram
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)  # Esvazia a fila ao sair
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     return logging.getLogger(__name__)
 
@@ -64,6 +75,7 @@ class YOLODetectionApp:
         # Componentes
         self.camera: Optional[BaslerCamera] = None
         self.detector: Optional[YOLODetector] = None
+        self.frame_batcher: Optional[FrameBatcher] = None
         self.ui: Optional[YOLODetectionUI] = None
         
         # Threads
@@ -78,6 +90,9 @@ class YOLODetectionApp:
         # Buffers
         self.frame_queue = queue.Queue(maxsize=8)
         self.processed_queue = queue.Queue(maxsize=4)
+        # Frames a gravar: consumidos pelo writer_thread (cheio = frame descartado da gravação).
+        # Uma fila nova por gravação: uma thread travada de gravação anterior nunca consome estes frames
+        self.record_queue: queue.Queue = queue.Queue(maxsize=8)
         
         # Performance tracking
         self.fps_counter = 0
@@ -122,7 +137,8 @@ class YOLODetectionApp:
             "inference": {
                 "imgsz": 640,
                 "max_det": 100,
-                "device": "cuda"
+                "device": "cuda",
+                "batch_size": 1  # >1 processa N frames por lote (maior throughput, mais latência)
             },
             "models": {
                 "seg": "models/Crop_Fifa_best.pt",
@@ -264,6 +280,12 @@ class YOLODetectionApp:
             self.logger.info("Executando warm-up dos modelos...")
             self.detector.warmup()
             
+            # Inferência em lote entre frames (opcional: troca latência por throughput)
+            batch_size = self.config.get("inference", {}).get("batch_size", 1)
+            if batch_size > 1:
+                self.frame_batcher = FrameBatcher(self.detector, batch_size=batch_size)
+                self.logger.info(f"✓ Inferência em lote ativada: {batch_size} frames por lote")
+            
             self.logger.info(f"✓ Detector inicializado no device: {self.detector.device}")
             
             return True
@@ -537,6 +559,15 @@ class YOLODetectionApp:
     def _on_ui_class_change(self, class_params: Dict[str, Any]):
         """Callback: mudança de classes específicas."""
         try:
+            # Ativar/desativar todas: um único callback com todas as classes
+            if class_params.get('bulk'):
+                enabled = class_params.get('enabled', True)
+                class_controls = self.config.setdefault("class_controls", {})
+                for model_type, class_names in class_params.get('classes', {}).items():
+                    class_controls.setdefault(model_type, {}).update(dict.fromkeys(class_names, enabled))
+                self.logger.info(f"✓ Todas as classes: {'ATIVADAS' if enabled else 'DESATIVADAS'}")
+                return
+            
             model_type = class_params.get('model_type')
             class_name = class_params.get('class_name')
             enabled = class_params.get('enabled', True)
@@ -625,6 +656,12 @@ class YOLODetectionApp:
                     continue
             
             if self.video_writer and self.video_writer.isOpened():
+                # Codificação em thread dedicada: o encoder não atrasa inferência nem preview
+                self.record_queue = queue.Queue(maxsize=8)
+                self.writer_thread = threading.Thread(
+                    target=self._recording_loop, args=(self.video_writer, self.record_queue), daemon=True
+                )
+                self.writer_thread.start()
                 self.recording = True
                 self.logger.info(f"✓ Gravação iniciada: {output_file}")
                 self.logger.info(f"✓ Codec utilizado: {successful_codec}")
@@ -638,9 +675,59 @@ class YOLODetectionApp:
             self.logger.error(f"Erro ao iniciar gravação: {e}")
             self.video_writer = None
     
+    def _recording_loop(self, writer: cv2.VideoWriter, frames: queue.Queue):
+        """
+        Grava os frames da fila desta gravação até receber None (thread de gravação).
+        
+        A thread é dona do writer e o libera ao sair, mesmo que _stop_recording
+        já tenha desistido de esperá-la (encoder travado).
+        """
+        try:
+            while True:
+                frame = frames.get()
+                if frame is None:
+                    break
+                if not writer.isOpened():
+                    self.logger.warning("VideoWriter não está mais aberto, parando gravação")
+                    if frames is self.record_queue:
+                        self.recording = False
+                    break
+                writer.write(frame)
+        except Exception as e:
+            self.logger.error(f"Erro ao gravar frame: {e}")
+            if frames is self.record_queue:
+                self.recording = False
+        finally:
+            try:
+                writer.release()
+                self.logger.info("✓ Gravação finalizada com sucesso")
+            except Exception as e:
+                self.logger.error(f"Erro ao finalizar gravação: {e}")
+    
     def _stop_recording(self):
         """Para gravação de vídeo."""
-        if self.video_writer:
+        self.recording = False
+        if self.writer_thread:
+            # Sinalizar fim (frames já enfileirados são gravados antes) e aguardar o encoder,
+            # que libera o writer ao sair
+            writer_thread, self.writer_thread = self.writer_thread, None
+            if writer_thread.is_alive():
+                try:
+                    self.record_queue.put(None, timeout=5.0)
+                except queue.Full:
+                    # Encoder atrasado demais: descartar os frames pendentes para o sinal de fim entrar
+                    while True:
+                        try:
+                            self.record_queue.get_nowait()
+                        except queue.Empty:
+                            break
+                    self.record_queue.put_nowait(None)
+                writer_thread.join(timeout=5.0)
+            if writer_thread.is_alive():
+                # Encoder travado: não liberar o writer por baixo da thread; ela o libera ao terminar
+                self.logger.warning("⚠ Encoder ainda ocupado: a gravação será finalizada em segundo plano")
+            self.video_writer = None
+        elif self.video_writer:
             try:
                 self.video_writer.release()
                 self.logger.info("✓ Gravação finalizada com sucesso")
@@ -648,7 +735,6 @@ class YOLODetectionApp:
                 self.logger.error(f"Erro ao finalizar gravação: {e}")
             finally:
                 self.video_writer = None
-                self.recording = False
         else:
             self.logger.info("Nenhuma gravação ativa para parar")
     
@@ -669,46 +755,58 @@ class YOLODetectionApp:
                     time.sleep(0.1)
                     continue
                 
-                # Processar frame
-                annotated_frame, stats = self.detector.process_frame(frame)
-                
-                # Calcular FPS
-                self.fps_counter += 1
-                elapsed = time.time() - self.fps_start_time
-                if elapsed >= 1.0:
-                    self.current_fps = self.fps_counter / elapsed
-                    self.fps_counter = 0
-                    self.fps_start_time = time.time()
-                
-                # Atualizar stats com FPS
-                stats["fps"] = self.current_fps
-                stats["inference_ms"] = stats.get("inference_time_ms", 0)
-                stats["capture_fps"] = self.camera.capture_fps if self.camera else 0.0
-                
-                # Atualizar UI
-                if self.ui:
-                    self.ui.update_frame(annotated_frame)
-                    self.ui.update_stats(stats)
+                # Processar frame (ou acumular no lote)
+                if self.frame_batcher:
+                    outputs = self.frame_batcher.submit(frame)
+                else:
+                    # Frame anotado é consumido (UI copia, gravação escreve) antes do próximo:
+                    # pode reutilizar o buffer de anotação do detector
+                    outputs = [self.detector.process_frame(frame, reuse_buffer=True)]
                 
-                # Gravar se habilitado
-                if self.recording and self.video_writer:
-                    try:
-                        # Verificar se o VideoWriter ainda está válido
-                        if self.video_writer.isOpened():
-                            self.video_writer.write(annotated_frame)
-                        else:
-                            self.logger.warning("VideoWriter não está mais aberto, parando gravação")
-                            self._stop_recording()
-                    except Exception as e:
-                        self.logger.error(f"Erro ao gravar frame: {e}")
-                        self._stop_recording()
+                for annotated_frame, stats in outputs:
+                    self._handle_processed_frame(annotated_frame, stats)
                 
             except Exception as e:
                 self.logger.error(f"Erro no loop de inferência: {e}", exc_info=True)
                 time.sleep(0.1)
         
+        # Fim do stream: processar frames que ficaram pendentes no lote
+        if self.frame_batcher:
+            try:
+                for annotated_frame, stats in self.frame_batcher.flush():
+                    self._handle_processed_frame(annotated_frame, stats)
+            except Exception as e:
+                self.logger.error(f"Erro ao processar lote pendente: {e}")
+        
         self.logger.info("Thread de inferência finalizada")
     
+    def _handle_processed_frame(self, annotated_frame: np.ndarray, stats: Dict[str, Any]):
+        """Atualiza FPS, UI e gravação com um frame processado."""
+        # Calcular FPS
+        self.fps_counter += 1
+        elapsed = time.time() - self.fps_start_time
+        if elapsed >= 1.0:
+            self.current_fps = self.fps_counter / elapsed
+            self.fps_counter = 0
+            self.fps_start_time = time.time()
+        
+        # Atualizar stats com FPS
+        stats["fps"] = self.current_fps
+        stats["inference_ms"] = stats.get("inference_time_ms", 0)
+        stats["capture_fps"] = self.camera.capture_fps if self.camera else 0.0
+        
+        # Atualizar UI
+        if self.ui:
+            self.ui.update_frame(annotated_frame)
+            self.ui.update_stats(stats)
+        
+        # Gravar se habilitado (enfileira uma cópia: annotated_frame é um buffer reutilizado)
+        if self.recording:
+            try:
+                self.record_queue.put_nowait(annotated_frame.copy())
+            except queue.Full:
+                pass  # Encoder atrasado: descartar o frame na gravação, sem travar o pipeline
+    
     def start(self):
         """Inicia captura e inferência."""
         if self.running:
@@ -737,8 +835,8 @@ class YOLODetectionApp:
         
         self.running = False
         
-        # Parar gravação se ativa
-        if self.recording:
+        # Parar gravação se ativa (ou interrompida por erro, com o writer ainda aberto)
+        if self.recording or self.video_writer:
             self._stop_recording()
         
         # Aguardar threads
@@ -973,14 +1071,15 @@ class YOLODetectionApp:
             self.logger.info("\n📦 Objetos Detectados por Classe:")
             transfers_by_class = summary["transfers_by_class"]
             
+            # (o sumário sempre preenche todas as chaves: leitura direta, sem .get)
             for class_name, class_stats in transfers_by_class.items():
-                count = class_stats.get("count", 0)
-                total_objects = class_stats.get("total_objects", 0)
+                count = class_stats["count"]
+                total_objects = class_stats["total_objects"]
                 
-                if "ok" in class_stats and "no" in class_stats:
+                if "ok" in class_stats:
                     # Classes com OK/NO (FIFA, Simbolo, String)
-                    ok_count = class_stats.get("ok", 0)
-                    no_count = class_stats.get("no", 0)
+                    ok_count = class_stats["ok"]
+                    no_count = class_stats["no"]
                     self.logger.info(f"  {class_name.upper()}:")
                     self.logger.info(f"    - Transfers com detecção: {count}")
                     self.logger.info(f"    - Total objetos: {total_objects} (OK: {ok_count}, NO: {no_count})")
@@ -1002,16 +1101,15 @@ class YOLODetectionApp:
             if objects_per_transfer:
                 self.logger.info(f"\n📋 Resumo por Transfer (primeiros 5):")
                 for i, transfer_obj in enumerate(objects_per_transfer[:5]):
-                    transfer_id = transfer_obj.get("transfer_id", 0)
-                    self.logger.info(f"  Transfer #{transfer_id}:")
-                    self.logger.info(f"    - Blackdot: {transfer_obj.get('blackdot', 0)}")
-                    self.logger.info(f"    - Smudge: {transfer_obj.get('smudge', 0)}")
-                    fifa = transfer_obj.get('fifa', {})
-                    simbolo = transfer_obj.get('simbolo', {})
-                    string = transfer_obj.get('string', {})
-                    self.logger.info(f"    - FIFA: OK={fifa.get('ok', 0)}, NO={fifa.get('no', 0)}")
-                    self.logger.info(f"    - Simbolo: OK={simbolo.get('ok', 0)}, NO={simbolo.get('no', 0)}")
-                    self.logger.info(f"    - String: OK={string.get('ok', 0)}, NO={string.get('no', 0)}")
+                    self.logger.info(f"  Transfer #{transfer_obj['transfer_id']}:")
+                    self.logger.info(f"    - Blackdot: {transfer_obj['blackdot']}")
+                    self.logger.info(f"    - Smudge: {transfer_obj['smudge']}")
+                    fifa = transfer_obj['fifa']
+                    simbolo = transfer_obj['simbolo']
+                    string = transfer_obj['string']
+                    self.logger.info(f"    - FIFA: OK={fifa['ok']}, NO={fifa['no']}")
+                    self.logger.info(f"    - Simbolo: OK={simbolo['ok']}, NO={simbolo['no']}")
+                    self.logger.info(f"    - String: OK={string['ok']}, NO={string['no']}")
                 
                 if len(objects_per_transfer) > 5:
                     self.logger.info(f"    ... e mais {len(objects_per_transfer) - 5} transfers")
@@ -3,8 +3,14 @@ Módulo de inferência YOLO com segmentação ROI e detecção multi-modelo.
 Implementa lógica de contagem por "transfer" com tracking de IOUs.
 """
 
+import json
 import logging
 import time
+from collections import deque
+from contextlib import nullcontext
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
 from typing import List, Tuple, Optional, Dict, Any
 import numpy as np
 import cv2
@@ -17,6 +23,270 @@ except ImportError:
     ULTRALYTICS_AVAILABLE = False
     logging.warning("Ultralytics não disponível. Instale com: pip install ultralytics")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def _nms_priority_kernel(iou, is_smudge, is_in_sim, blocked, thresh=0.02):
+    """
+    Laço de aceitação da exclusão mútua (detecções já ordenadas por prioridade/confiança).
+    
+    Args:
+        iou: Matriz (N, N) de IOU entre as detecções ordenadas
+        is_smudge: Máscara de FIFA do modelo smudge
+        is_in_sim: Máscara de FIFA do modelo simbolos
+        blocked: Máscara de detecções descartadas de antemão (smudge sobreposto)
+        thresh: Threshold de IOU para sobreposição
+        
+    Returns:
+        Máscara booleana das detecções aceitas
+    """
+    n = iou.shape[0]
+    accepted = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        if blocked[i]:
+            continue
+        overlapping = False
+        for j in range(i):
+            if not accepted[j]:
+                continue
+            # EXCEÇÃO: FIFA do modelo smudge e FIFA do modelo simbolos podem coexistir
+            if (is_smudge[i] and is_in_sim[j]) or (is_in_sim[i] and is_smudge[j]):
+                continue
+            if iou[i, j] > thresh:
+                overlapping = True
+                break
+        accepted[i] = not overlapping
+    return accepted
+
+
+def _mask_apply(img, mask, out):
+    """
+    Copia img para out zerando os pixels fora da máscara (uma passada, paralela por linha).
+    
+    Args:
+        img: Crop (H, W, C) - não é modificado
+        mask: Máscara (H, W), 0 = fora da ROI
+        out: Array de saída (H, W, C) com o mesmo dtype de img
+    """
+    h, w, c = img.shape
+    for y in prange(h):
+        for x in range(w):
+            if mask[y, x] == 0:
+                for ch in range(c):
+                    out[y, x, ch] = 0
+            else:
+                for ch in range(c):
+                    out[y, x, ch] = img[y, x, ch]
+
+
+def _draw_boxes_inplace(frame, xyxys, colors):
+    """
+    Desenha retângulos (traço equivalente ao cv2.rectangle com thickness=2) direto no buffer.
+    
+    Args:
+        frame: Imagem BGR (H, W, 3) modificada in-place
+        xyxys: Array (N, 4) int32 com (x1, y1, x2, y2)
+        colors: Array (N, 3) uint8 com a cor BGR de cada box
+    """
+    h, w = frame.shape[0], frame.shape[1]
+    # Serial sobre as boxes: a ordem de desenho define a cor em sobreposições
+    for k in range(xyxys.shape[0]):
+        x1, y1, x2, y2 = xyxys[k, 0], xyxys[k, 1], xyxys[k, 2], xyxys[k, 3]
+        # Bordas horizontais: linhas y-1..y+1, colunas x1..x2
+        for yc in (y1, y2):
+            for yy in range(max(yc - 1, 0), min(yc + 2, h)):
+                for xx in range(max(x1, 0), min(x2 + 1, w)):
+                    for ch in range(3):
+                        frame[yy, xx, ch] = colors[k, ch]
+        # Bordas verticais: colunas x-1..x+1, linhas y1..y2
+        for xc in (x1, x2):
+            for yy in range(max(y1, 0), min(y2 + 1, h)):
+                for xx in range(max(xc - 1, 0), min(xc + 2, w)):
+                    for ch in range(3):
+                        frame[yy, xx, ch] = colors[k, ch]
+
+
+def _blit_label_inplace(frame, dy, dx, alpha, ox, oy, color):
+    """
+    Aplica um rótulo pré-renderizado (pixels esparsos com alpha) no frame, in-place.
+    
+    Args:
+        frame: Imagem BGR (H, W, 3) modificada in-place
+        dy, dx: Offsets int32 dos pixels do texto em relação à origem (linha de base)
+        alpha: Cobertura int32 (0-255) de cada pixel (texto anti-aliased do cv2.putText)
+        ox, oy: Origem do texto no frame (mesma semântica do org do cv2.putText)
+        color: Array (3,) int32 com a cor BGR
+    """
+    h, w = frame.shape[0], frame.shape[1]
+    for i in range(dy.shape[0]):
+        y = oy + dy[i]
+        x = ox + dx[i]
+        if 0 <= y < h and 0 <= x < w:
+            a = alpha[i]
+            for ch in range(3):
+                frame[y, x, ch] = (frame[y, x, ch] * (255 - a) + color[ch] * a + 127) // 255
+
+
+def _predominant_kernel(history, n, recent):
+    """
+    Classe predominante sobre as últimas n linhas do histórico de contagens por classe.
+    
+    Args:
+        history: Array (janela, C) int64, linha mais recente por último
+        n: Linhas válidas (as últimas n)
+        recent: Quantos frames recentes considerar na confiança
+        
+    Returns:
+        Tuple (índice da maior média - empate: o primeiro, maior média,
+               frames recentes com a classe detectada, frames recentes considerados)
+    """
+    rows = history.shape[0]
+    start = rows - n
+    best = 0
+    best_score = -1.0
+    for c in range(history.shape[1]):
+        total = 0
+        for r in range(start, rows):
+            total += history[r, c]
+        score = total / n
+        if score > best_score:
+            best = c
+            best_score = score
+    first_recent = max(start, rows - recent)
+    hits = 0
+    for r in range(first_recent, rows):
+        if history[r, best] != 0:
+            hits += 1
+    return best, best_score, hits, rows - first_recent
+
+
+# class_id das classes FIFA no modelo simbolos (0=FIFA_NO, 1=FIFA_OK)
+_FIFA_SIMBOLOS_IDS = frozenset({0, 1})
+
+# Classes do modelo simbolos (best.pt) e cor BGR de cada uma: OK (ids ímpares) em verde,
+# NO em vermelho. A última entrada é usada para class_id desconhecido.
+_SIMBOLOS_CLASS_NAMES = ('FIFA_NO', 'FIFA_OK', 'Simbolo_NO', 'Simbolo_OK', 'String_NO', 'String_OK', 'Símbolo')
+_SIMBOLOS_CLASS_COLORS = ((0, 0, 255), (0, 255, 0), (0, 0, 255), (0, 255, 0), (0, 0, 255), (0, 255, 0), (0, 0, 255))
+_SIMBOLOS_UNKNOWN_ID = len(_SIMBOLOS_CLASS_NAMES) - 1
+_SIMBOLOS_LABEL_PREFIXES = tuple(f"{name} " for name in _SIMBOLOS_CLASS_NAMES)
+
+# Ordem fixa das classes para escolher a predominante/dominante (empate: a primeira vence)
+_PREDOMINANT_CLASS_NAMES = ('Smudge', 'Símbolo', 'BlackDot')
+
+# Erros do sumário final, em ordem fixa: chave, nome de exibição e tipo
+_ERROR_KEYS = ('fifa_no', 'simbolo_no', 'string_no', 'smudge', 'blackdot')
+_ERROR_CLASS_NAMES = ('FIFA', 'Simbolo', 'String', 'Smudge', 'BlackDot')
+_ERROR_TYPES = ('NO', 'NO', 'NO', 'Erro', 'Erro')
+_SIMBOLOS_COLORS_LUT = np.array(_SIMBOLOS_CLASS_COLORS, dtype=np.uint8)
+
+
+if NUMBA_AVAILABLE:
+    _nms_priority_kernel = njit(cache=True)(_nms_priority_kernel)
+    _mask_apply = njit(parallel=True, fastmath=True, cache=True)(_mask_apply)
+    _draw_boxes_inplace = njit(cache=True)(_draw_boxes_inplace)
+    _blit_label_inplace = njit(cache=True)(_blit_label_inplace)
+    _predominant_kernel = njit(cache=True)(_predominant_kernel)
+
+
+def _count_mean_variance(detections) -> Tuple[float, float]:
+    """
+    Média e variância (populacional) das contagens 'count' de um histórico, em uma passada.
+    
+    Usa soma e soma dos quadrados inteiras: var = (n*ss - s^2) / n^2, sem o cancelamento
+    numérico de ss/n - média^2. O caso comum de contagens todas iguais (ex.: tudo 0 ou
+    tudo 1) retorna direto, sem a aritmética.
+    """
+    counts = [detection['count'] for detection in detections]
+    lo = min(counts)
+    if lo == max(counts):
+        return float(lo), 0.0
+    n = len(counts)
+    total = sum(counts)
+    total_sq = sum(c * c for c in counts)
+    return total / n, (n * total_sq - total * total) / (n * n)
+
+
+class RunningStats:
+    """
+    Acumulador O(1) de uma série de contagens por frame.
+    
+    Mantém número de frames, soma e frames com contagem > 0, de modo que médias e
+    totais do transfer não exijam percorrer listas ao finalizá-lo.
+    """
+    
+    __slots__ = ("count", "total", "nonzero", "last")
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Zera o acumulador (início de um novo transfer)."""
+        self.count = 0
+        self.total = 0
+        self.nonzero = 0
+        self.last = 0
+    
+    def add(self, value):
+        """Registra a contagem de um novo frame."""
+        self.count += 1
+        self.total += value
+        if value > 0:
+            self.nonzero += 1
+        self.last = value
+    
+    def replace_last(self, value):
+        """Substitui a contagem do último frame registrado (ex.: após filtragem)."""
+        if self.count == 0:
+            self.add(value)
+            return
+        self.total += value - self.last
+        self.nonzero += (value > 0) - (self.last > 0)
+        self.last = value
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    def __len__(self) -> int:
+        return self.count
+
+
+class FrameBatcher:
+    """
+    Acumula frames e os processa em lote com YOLODetector.process_frames.
+    
+    Cada detector roda uma vez por lote em vez de uma vez por frame (menos lançamentos
+    de kernel na GPU), ao custo de até batch_size frames de latência.
+    """
+    
+    def __init__(self, detector: "YOLODetector", batch_size: int = 8):
+        self.detector = detector
+        self.batch_size = max(1, int(batch_size))
+        self._pending: List[np.ndarray] = []
+    
+    def submit(self, frame: np.ndarray) -> List[Tuple[np.ndarray, Dict[str, Any]]]:
+        """Adiciona um frame; retorna os frames processados quando o lote enche (senão lista vazia)."""
+        self._pending.append(frame)
+        if len(self._pending) >= self.batch_size:
+            return self.flush()
+        return []
+    
+    def flush(self) -> List[Tuple[np.ndarray, Dict[str, Any]]]:
+        """Processa imediatamente os frames pendentes (ex.: fim do stream)."""
+        frames, self._pending = self._pending, []
+        return self.detector.process_frames(frames)
+
 
 class YOLODetector:
     """Sistema de detecção YOLO multi-modelo com ROI."""
@@ -57,11 +327,17 @@ class YOLODetector:
                 self.logger.info(f"CUDA version: {torch.version.cuda}")
                 self.logger.info(f"VRAM total: {torch.cuda.get_device_properties(0).total_memory / (1024**3):.1f} GB")
         
+        # Pool de memória CUDA compartilhado pelos 4 modelos (criado em load_models)
+        self._mempool = None
+        
         # Modelos
         self.seg_model = None
         self.smudge_model = None
         self.simbolos_model = None
         self.blackdot_model = None
+        # Modelo unificado opcional (uma única cabeça com as classes dos três detectores)
+        self.unified_model = None
+        self._unified_split = ()  # (classe, ids no modelo unificado, LUT id unificado -> id local)
         
         # Controles de ativação dos modelos
         self.model_enabled = {
@@ -74,11 +350,37 @@ class YOLODetector:
         # Parâmetros de inferência
         self.imgsz = config.get("inference", {}).get("imgsz", 640)
         self.max_det = config.get("inference", {}).get("max_det", 100)
+        # FP16 só compensa em GPU (em CPU a meia precisão é mais lenta)
+        self.enable_fp16 = config.get("inference", {}).get("half", True)
+        self._half = bool(self.enable_fp16) and "cuda" in self.device
+        # TensorRT: exportar os .pt para .engine (FP16 ou INT8 calibrado) e usar no lugar do PyTorch eager
+        inference_cfg = config.get("inference", {})
+        self.use_tensorrt = bool(inference_cfg.get("tensorrt", False)) and "cuda" in self.device
+        self.tensorrt_int8 = bool(inference_cfg.get("tensorrt_int8", False))
+        self.tensorrt_calib_data = inference_cfg.get("tensorrt_calib_data")  # dataset yaml para calibração INT8
+        self.tensorrt_max_batch = max(1, int(inference_cfg.get("batch_size", 1)))
+        # Pré-processamento na GPU: o crop da ROI vira um tensor normalizado uma única vez,
+        # compartilhado pelos detectores (engines TensorRT exigem entrada quadrada fixa)
+        self.gpu_preprocess = (bool(inference_cfg.get("gpu_preprocess", False))
+                               and "cuda" in self.device and not self.use_tensorrt)
+        # Um stream CUDA por detector: os três modelos são enfileirados sem esperar um ao outro
+        # e o stream principal só aguarda todos no ponto de junção (_gather_detections)
+        self._streams = None
+        if inference_cfg.get("cuda_streams", False) and "cuda" in self.device and torch.cuda.is_available():
+            self._streams = tuple(torch.cuda.Stream(device=self.device) for _ in range(3))
         
         # Thresholds - CORRIGIDOS para reduzir conflitos
         self.roi_conf = config.get("roi", {}).get("conf", 0.5)  # Default: 0.5 (50%)
         self.roi_iou = config.get("roi", {}).get("iou", 0.45)
         self.roi_min_pixels = config.get("roi", {}).get("min_pixels", 2000)
+        # Kernel morfológico da máscara ROI (criado uma vez, reutilizado a cada frame)
+        self._morph_kernel3 = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+        # Buffer de anotação reutilizado entre frames (alocado sob demanda)
+        self._annot_buf = None
+        # Rótulos estáticos ("Smudge ", "FIFA_OK ", ...) pré-renderizados sob demanda
+        self._label_sprites = {}
+        # Buffer pinned de host para as 6 contagens OK/NO (criado no primeiro uso em CUDA)
+        self._ok_no_host = None
         
         thresholds = config.get("thresholds", {})
         # Todos os thresholds com default de 0.5 (50%)
@@ -93,6 +395,10 @@ class YOLODetector:
         transfer_cfg = config.get("transfer", {})
         self.ABSENT_TO_NEW = transfer_cfg.get("absent_to_new", 8)
         self.IOU_NEW_THRESH = transfer_cfg.get("iou_new_thresh", 0.30)
+        # Histórico de transfers: últimos N em memória/exportação e, opcionalmente, todos
+        # gravados incrementalmente em NDJSON (uma linha por transfer finalizado)
+        self.transfer_history_size = max(1, int(transfer_cfg.get("history_size", 100)))
+        self.transfer_history_file = transfer_cfg.get("history_ndjson")
         
         # Controle de transfer baseado em ROI
         self.transfer_count = 0
@@ -100,22 +406,25 @@ class YOLODetector:
         self.last_roi_bbox = None
         self.current_transfer_active = False  # Se há um transfer ativo
         
-        # Sistema de estabilização de detecções
-        self.detection_history = {
-            "smudge": [],
-            "simbolos": [],
-            "blackdot": []
-        }
+        # Sistema de estabilização de detecções: buffer SoA (classe x janela) com as contagens
+        # mais recentes à direita e o número de frames válidos por classe
+        self._stab_classes = ("smudge", "simbolos", "blackdot")
+        self._stab_buf = np.zeros((3, 0), dtype=np.float64)
+        self._stab_len = np.zeros(3, dtype=np.int64)
         self.stabilization_window = 8  # Frames para estabilização (aumentado para mais estabilidade)
+        self._rebuild_stabilization_buffers()
         self.min_detection_confidence = 0.5  # Confiança mínima aumentada para reduzir falsos positivos
         
         # Sistema de filtros de sobreposição - OTIMIZADO para reduzir conflitos
         self.overlap_threshold = 0.3  # IOU reduzido para ser mais rigoroso
+        # Chaves fixas dos dicionários de detecções filtradas (reaproveitadas a cada frame)
+        self._result_template_keys = ("smudge", "simbolos", "blackdot")
         # Prioridade de classes: blackdot (0) > simbolos (1) > smudge (2)
         # - blackdot tem prioridade sobre smudge ✓
         # - simbolos (incluindo FIFA, Simbolo, String do modelo) tem prioridade sobre smudge ✓
         # - smudge (FIFA do modelo smudge) tem menor prioridade ✓
         self.class_priority = ["blackdot", "simbolos", "smudge"]
+        self._rebuild_priority_map()
         
         # Cache de parâmetros para persistência
         self.parameter_cache = {
@@ -123,6 +432,7 @@ class YOLODetector:
             "model_enabled": {},
             "inference_params": {}
         }
+        self._last_saved_parameters = None  # (caminho, parâmetros) da última escrita em disco
         self.current_transfer_start_frame = 0  # Frame de início do transfer
         self.current_transfer_frames = 0  # Número de frames do transfer atual
         
@@ -132,8 +442,19 @@ class YOLODetector:
             "total_approved": 0,        # Total de transfers aprovados
             "total_rejected": 0,        # Total de transfers reprovados
             "current_transfer": None,   # Transfer atual em andamento
-            "transfer_history": []      # Histórico de transfers
+            "transfer_history": deque(maxlen=self.transfer_history_size)  # Histórico dos últimos N transfers
         }
+        # Totais por classe mantidos incrementalmente sobre a mesma janela do histórico, a partir
+        # de uma linha compacta por transfer: (transfer_id, blackdot, smudge, fifa_ok, fifa_no,
+        # simbolo_ok, simbolo_no, string_ok, string_no)
+        self._class_totals = {
+            "blackdot": {"count": 0, "total_objects": 0},
+            "smudge": {"count": 0, "total_objects": 0},
+            "fifa": {"count": 0, "total_objects": 0, "ok": 0, "no": 0},
+            "simbolo": {"count": 0, "total_objects": 0, "ok": 0, "no": 0},
+            "string": {"count": 0, "total_objects": 0, "ok": 0, "no": 0}
+        }
+        self._transfer_rows = deque(maxlen=self.transfer_stats["transfer_history"].maxlen)
         
         # Estabilização de bounding boxes
         self.bbox_history = []          # Histórico de bboxes para suavização
@@ -142,15 +463,19 @@ class YOLODetector:
         
         # Estatísticas por transfer
         self.current_transfer_stats = {
-            "smudge": [],  # Lista de contagens por frame
-            "simbolos": [],  # Lista de contagens por frame
-            "blackdot": [],  # Lista de contagens por frame
-            "fifa_ok": [],  # FIFA OK por frame
-            "fifa_no": [],  # FIFA NO por frame
-            "simbolo_ok": [],  # Simbolo OK por frame
-            "simbolo_no": [],  # Simbolo NO por frame
-            "string_ok": [],  # String OK por frame
-            "string_no": []  # String NO por frame
+            "smudge": RunningStats(),  # Acumulador de contagens por frame
+            "simbolos": RunningStats(),  # Acumulador de contagens por frame
+            "blackdot": RunningStats(),  # Acumulador de contagens por frame
+            "fifa_ok": RunningStats(),  # FIFA OK por frame
+            "fifa_no": RunningStats(),  # FIFA NO por frame
+            "simbolo_ok": RunningStats(),  # Simbolo OK por frame
+            "simbolo_no": RunningStats(),  # Simbolo NO por frame
+            "string_ok": RunningStats(),  # String OK por frame
+            "string_no": RunningStats(),  # String NO por frame
+            # OK+NO por frame: nonzero = frames com pelo menos uma detecção do grupo
+            "fifa": RunningStats(),
+            "simbolo": RunningStats(),
+            "string": RunningStats()
         }
         
         self.transfer_averages = {
@@ -158,10 +483,16 @@ class YOLODetector:
             "simbolos": 0.0,
             "blackdot": 0.0
         }
+        # Campos de transfer das estatísticas por frame: só mudam ao finalizar um transfer,
+        # então são calculados uma vez e copiados para cada frame com um único update
+        self._transfer_stats_view = {}
+        self._refresh_transfer_stats_view()
         
         # Sistema de média móvel para estabilizar classe predominante
-        self.class_history = []  # Histórico das últimas 10 frames
         self.moving_average_window = 10  # Janela de média móvel
+        # Histórico das últimas N frames: linhas (smudge, simbolos, blackdot), mais recente por último
+        self._class_hist_arr = np.zeros((self.moving_average_window, 3), dtype=np.int64)
+        self._class_hist_len = 0
         self.predominant_class = "Nenhuma"  # Classe predominante atual
         self.predominant_class_confidence = 0.0  # Confiança da classe predominante
         
@@ -173,28 +504,78 @@ class YOLODetector:
         }
         
         # Estabilização de detecções de smudge
-        self.smudge_history = []  # Histórico de detecções
+        self.smudge_history = deque(maxlen=10)  # Histórico de detecções (últimos 10 frames)
         self.smudge_stability_threshold = 5  # Aumentado para mais estabilidade
         self.smudge_confidence_buffer = []  # Buffer de confianças
         self.smudge_stable_detection = None  # Detecção estável atual
         
         # Estabilização de detecções de símbolos
-        self.symbols_history = []  # Histórico de detecções de símbolos
+        self.symbols_history = deque(maxlen=10)  # Histórico de detecções de símbolos (últimos 10 frames)
         self.symbols_stability_threshold = 5  # Aumentado para mais estabilidade
         self.symbols_confidence_buffer = []  # Buffer de confianças
         self.symbols_stable_detection = None  # Detecção estável atual
         
         # Estabilização de classes específicas
-        self.fifa_history = []  # Histórico de detecções FIFA
-        self.string_history = []  # Histórico de detecções String
-        self.fifa_stable_detection = None  # Detecção estável FIFA
-        self.string_stable_detection = None  # Detecção estável String
+        # (histórico e detecção estável por classe: 'fifa', 'string')
+        self._class_stab = {
+            "fifa": {"history": deque(maxlen=8), "stable": None},
+            "string": {"history": deque(maxlen=8), "stable": None}
+        }
         
         # Performance tracking
         self.last_inference_time = 0.0
         self.avg_inference_time = 0.0
         self.frame_count = 0
+        # Fator da média móvel exponencial do tempo de inferência (janela equivalente)
+        self._ewma_alpha = 2.0 / (self.moving_average_window + 1)
+        # Chaves fixas do dicionário de estatísticas por frame (copiado a cada frame)
+        self._stats_template = {
+            "smudge": 0,
+            "simbolos": 0,
+            "blackdot": 0,
+            "has_roi": False,
+            "roi_confidence": 0.0,
+            "transfer_count": 0,
+            "inference_time_ms": 0.0
+        }
+        
+        # Compilar os kernels numba agora (JIT) para não pesar no primeiro frame
+        if NUMBA_AVAILABLE:
+            _nms_priority_kernel(np.zeros((1, 1)), np.zeros(1, dtype=np.bool_),
+                                 np.zeros(1, dtype=np.bool_), np.zeros(1, dtype=np.bool_))
+            _mask_apply(np.zeros((1, 1, 3), dtype=np.uint8), np.zeros((1, 1), dtype=np.uint8),
+                        np.zeros((1, 1, 3), dtype=np.uint8))
+            _draw_boxes_inplace(np.zeros((1, 1, 3), dtype=np.uint8), np.zeros((1, 4), dtype=np.int32),
+                                np.zeros((1, 3), dtype=np.uint8))
+            _blit_label_inplace(np.zeros((1, 1, 3), dtype=np.uint8), np.zeros(1, dtype=np.int32),
+                                np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.int32), 0, 0,
+                                np.zeros(3, dtype=np.int32))
+            _predominant_kernel(np.zeros((1, 3), dtype=np.int64), 1, 5)
+        
+    def _mempool_context(self):
+        """
+        Retorna o contexto que direciona as alocações CUDA para o pool compartilhado.
         
+        Sem pool (CPU ou PyTorch sem a API MemPool) retorna um contexto nulo.
+        """
+        if self._mempool is None:
+            return nullcontext()
+        return torch.cuda.use_mem_pool(self._mempool)
+    
+    def _create_mempool(self):
+        """Cria um MemPool CUDA privado para os pesos e ativações dos modelos."""
+        if "cuda" not in self.device:
+            return
+        if not (hasattr(torch.cuda, "MemPool") and hasattr(torch.cuda, "use_mem_pool")):
+            self.logger.info("torch.cuda.MemPool indisponível nesta versão do PyTorch, usando alocador padrão")
+            return
+        try:
+            self._mempool = torch.cuda.MemPool()
+            self.logger.info("✓ Pool de memória CUDA compartilhado criado para os modelos")
+        except Exception as e:
+            self._mempool = None
+            self.logger.warning(f"Não foi possível criar pool de memória CUDA: {e}")
+    
     def load_models(self) -> bool:
         """Carrega todos os modelos YOLO."""
         try:
@@ -204,51 +585,21 @@ class YOLODetector:
             self.logger.info("CARREGANDO MODELOS YOLO")
             self.logger.info("="*60)
             
-            # Modelo de segmentação (ROI) - Crop_Fifa_best.pt
-            seg_path = models_cfg.get("seg", "models/Crop_Fifa_best.pt")
-            self.logger.info(f"[1/4] Carregando modelo de SEGMENTAÇÃO ROI: {seg_path}")
-            self.seg_model = YOLO(seg_path)
-            self.seg_model.to(self.device)
-            
-            # Obter informações do modelo de segmentação
-            if hasattr(self.seg_model, 'names'):
-                self.logger.info(f"      ✓ Classes do modelo ROI: {self.seg_model.names}")
-            self.logger.info(f"      ✓ Modelo ROI carregado com SUCESSO")
-            
-            # Modelo de smudge
-            smudge_path = models_cfg.get("smudge", "models/smudge.pt")
-            self.logger.info(f"[2/4] Carregando modelo de SMUDGE: {smudge_path}")
-            self.smudge_model = YOLO(smudge_path)
-            self.smudge_model.to(self.device)
-            
-            if hasattr(self.smudge_model, 'names'):
-                self.logger.info(f"      ✓ Classes do modelo Smudge: {self.smudge_model.names}")
-            self.logger.info(f"      ✓ Modelo Smudge carregado com SUCESSO")
-            
-            # Modelo de símbolos
-            simbolos_path = models_cfg.get("simbolos", "models/simbolos.pt")
-            self.logger.info(f"[3/4] Carregando modelo de SÍMBOLOS: {simbolos_path}")
-            self.simbolos_model = YOLO(simbolos_path)
-            self.simbolos_model.to(self.device)
-            
-            if hasattr(self.simbolos_model, 'names'):
-                self.logger.info(f"      ✓ Classes do modelo Símbolos: {self.simbolos_model.names}")
-            self.logger.info(f"      ✓ Modelo Símbolos carregado com SUCESSO")
-            
-            # Modelo de blackdot
-            blackdot_path = models_cfg.get("blackdot", "models/blackdot.pt")
-            self.logger.info(f"[4/4] Carregando modelo de BLACKDOT: {blackdot_path}")
-            self.blackdot_model = YOLO(blackdot_path)
-            self.blackdot_model.to(self.device)
-            
-            if hasattr(self.blackdot_model, 'names'):
-                self.logger.info(f"      ✓ Classes do modelo BlackDot: {self.blackdot_model.names}")
-            self.logger.info(f"      ✓ Modelo BlackDot carregado com SUCESSO")
+            # Todos os modelos alocam dentro do mesmo pool para evitar fragmentação (4GB VRAM)
+            self._create_mempool()
+            with self._mempool_context():
+                self._load_model_weights(models_cfg)
             
             self.logger.info("="*60)
-            self.logger.info("✓ TODOS OS 4 MODELOS CARREGADOS COM SUCESSO")
+            if self.unified_model is not None:
+                self.logger.info("✓ 2 MODELOS CARREGADOS COM SUCESSO (ROI + modelo unificado)")
+            else:
+                self.logger.info("✓ TODOS OS 4 MODELOS CARREGADOS COM SUCESSO")
             self.logger.info(f"✓ Device: {self.device}")
             self.logger.info(f"✓ ImgSz: {self.imgsz}")
+            self.logger.info(f"✓ FP16: {'ativado' if self._half else 'desativado'}")
+            if self.gpu_preprocess:
+                self.logger.info("✓ Pré-processamento na GPU: ativado")
             self.logger.info("="*60)
             
             return True
@@ -257,6 +608,168 @@ class YOLODetector:
             self.logger.error(f"✗ ERRO ao carregar modelos: {e}", exc_info=True)
             return False
     
+    def _load_model_weights(self, models_cfg: dict):
+        """Instancia os modelos YOLO (ROI + 3 detectores, ou ROI + unificado) e move para o device."""
+        # Modelo de segmentação (ROI) - Crop_Fifa_best.pt
+        seg_path = models_cfg.get("seg", "models/Crop_Fifa_best.pt")
+        unified_path = models_cfg.get("unified")
+        total = 2 if unified_path else 4  # ROI + unificado, ou ROI + 3 detectores
+        self.logger.info(f"[1/{total}] Carregando modelo de SEGMENTAÇÃO ROI: {seg_path}")
+        self.seg_model = self._load_yolo(seg_path)
+        
+        # Obter informações do modelo de segmentação
+        if hasattr(self.seg_model, 'names'):
+            self.logger.info(f"      ✓ Classes do modelo ROI: {self.seg_model.names}")
+        self.logger.info(f"      ✓ Modelo ROI carregado com SUCESSO")
+        
+        # Modelo unificado: substitui os três detectores por um único forward por ROI
+        if unified_path:
+            self._load_unified_model(unified_path, models_cfg.get("unified_classes", {}))
+            return
+        
+        # Modelo de smudge
+        smudge_path = models_cfg.get("smudge", "models/smudge.pt")
+        self.logger.info(f"[2/4] Carregando modelo de SMUDGE: {smudge_path}")
+        self.smudge_model = self._load_yolo(smudge_path)
+        
+        if hasattr(self.smudge_model, 'names'):
+            self.logger.info(f"      ✓ Classes do modelo Smudge: {self.smudge_model.names}")
+        self.logger.info(f"      ✓ Modelo Smudge carregado com SUCESSO")
+        
+        # Modelo de símbolos
+        simbolos_path = models_cfg.get("simbolos", "models/simbolos.pt")
+        self.logger.info(f"[3/4] Carregando modelo de SÍMBOLOS: {simbolos_path}")
+        self.simbolos_model = self._load_yolo(simbolos_path)
+        
+        if hasattr(self.simbolos_model, 'names'):
+            self.logger.info(f"      ✓ Classes do modelo Símbolos: {self.simbolos_model.names}")
+        self.logger.info(f"      ✓ Modelo Símbolos carregado com SUCESSO")
+        
+        # Modelo de blackdot
+        blackdot_path = models_cfg.get("blackdot", "models/blackdot.pt")
+        self.logger.info(f"[4/4] Carregando modelo de BLACKDOT: {blackdot_path}")
+        self.blackdot_model = self._load_yolo(blackdot_path)
+        
+        if hasattr(self.blackdot_model, 'names'):
+            self.logger.info(f"      ✓ Classes do modelo BlackDot: {self.blackdot_model.names}")
+        self.logger.info(f"      ✓ Modelo BlackDot carregado com SUCESSO")
+    
+    def _load_yolo(self, model_path: str):
+        """
+        Carrega um modelo YOLO no device, usando o engine TensorRT quando habilitado.
+        
+        Falhas de export caem de volta para o modelo PyTorch.
+        """
+        if self.use_tensorrt and str(model_path).endswith(".pt"):
+            engine_path = self._export_tensorrt(model_path)
+            if engine_path:
+                self.logger.info(f"      ✓ Usando engine TensorRT: {engine_path}")
+                # Engines não suportam .to(): o device é fixado no export; a task vem dos metadados do engine
+                return YOLO(engine_path)
+        
+        model = YOLO(model_path)
+        model.to(self.device)
+        return model
+    
+    def _export_tensorrt(self, model_path: str) -> Optional[str]:
+        """
+        Exporta o .pt para .engine (reaproveitando o engine se for mais novo que os pesos).
+        
+        Precisão, imgsz e batch máximo fazem parte do nome do engine: mudar qualquer um
+        deles na config gera um novo export em vez de reaproveitar um engine incompatível.
+        
+        Returns:
+            Caminho do engine ou None se o export falhar
+        """
+        pt_path = Path(model_path)
+        precision = "INT8" if self.tensorrt_int8 else "FP16"
+        engine_path = pt_path.with_name(
+            f"{pt_path.stem}.{precision.lower()}-{self.imgsz}-b{self.tensorrt_max_batch}.engine")
+        if engine_path.exists() and engine_path.stat().st_mtime >= pt_path.stat().st_mtime:
+            return str(engine_path)
+        
+        self.logger.info(f"      Exportando {pt_path.name} para TensorRT ({precision}), pode levar alguns minutos...")
+        try:
+            export_args = {
+                "format": "engine",
+                "imgsz": self.imgsz,
+                "half": not self.tensorrt_int8,
+                "int8": self.tensorrt_int8,
+                "dynamic": True,
+                "batch": self.tensorrt_max_batch,
+                "workspace": 4,
+                "device": self.device,
+            }
+            if self.tensorrt_int8 and self.tensorrt_calib_data:
+                export_args["data"] = self.tensorrt_calib_data
+            # O Ultralytics sempre grava <stem>.engine: renomear para o nome com as configurações
+            exported = Path(YOLO(str(pt_path)).export(**export_args))
+            exported.replace(engine_path)
+            return str(engine_path)
+        except Exception as e:
+            self.logger.warning(f"      ⚠ Export TensorRT falhou para {pt_path.name}, usando PyTorch: {e}")
+            return None
+    
+    def _load_unified_model(self, unified_path: str, unified_classes: Dict[str, List[int]]):
+        """
+        Carrega o modelo unificado e monta o mapeamento de classes por detector.
+        
+        Args:
+            unified_path: Caminho do .pt unificado (ex.: models/best_union.pt)
+            unified_classes: {classe: [ids no modelo unificado]}; a posição na lista é o
+                class_id local esperado pelo restante do pipeline (ex.: simbolos 0..5)
+        """
+        self.logger.info(f"[2/2] Carregando modelo UNIFICADO (smudge + simbolos + blackdot): {unified_path}")
+        self.unified_model = self._load_yolo(unified_path)
+        
+        num_classes = len(getattr(self.unified_model, 'names', {})) or 1 + max(
+            (i for ids in unified_classes.values() for i in ids), default=0)
+        split = []
+        for class_name in ("smudge", "simbolos", "blackdot"):
+            ids = unified_classes.get(class_name, [])
+            if not ids:
+                self.logger.warning(f"      ⚠ Nenhuma classe do modelo unificado mapeada para '{class_name}'")
+                continue
+            lut = torch.zeros(num_classes, dtype=torch.float32, device=self.device)
+            for local_id, unified_id in enumerate(ids):
+                lut[unified_id] = local_id
+            split.append((class_name, torch.tensor(ids, device=self.device), lut))
+        self._unified_split = tuple(split)
+        
+        if hasattr(self.unified_model, 'names'):
+            self.logger.info(f"      ✓ Classes do modelo Unificado: {self.unified_model.names}")
+        self.logger.info(f"      ✓ Modelo Unificado carregado com SUCESSO")
+    
+    def _unified_predict_params(self) -> Tuple[float, float]:
+        """conf/iou da chamada única: o mais permissivo entre os detectores ativos (conf por classe é refiltrada)."""
+        specs = [(conf, iou) for name, _, conf, iou, _ in self._detector_specs() if self.model_enabled[name]]
+        if not specs:
+            return self.simbolo_conf, self.simbolo_iou
+        return min(c for c, _ in specs), max(i for _, i in specs)
+    
+    def _split_unified_result(self, result) -> Dict[str, Any]:
+        """
+        Separa o resultado do modelo unificado nos três resultados por detector.
+        
+        Cada parte mantém a API de Results (boxes.conf/cls/xyxyn) com class_id local,
+        então validação, filtros e desenho seguem inalterados.
+        """
+        if result is None or result.boxes is None:
+            return {}
+        
+        class_conf = {"smudge": self.smudge_conf, "simbolos": self.simbolo_conf, "blackdot": self.blackdot_conf}
+        cls = result.boxes.cls
+        conf = result.boxes.conf
+        raw_results = {}
+        for class_name, ids, lut in self._unified_split:
+            if not self.model_enabled[class_name]:
+                continue
+            part = result[torch.isin(cls, ids) & (conf >= class_conf[class_name])]
+            # Remapear id unificado -> id local (a indexação booleana já criou um tensor novo)
+            part.boxes.data[:, -1] = lut[part.boxes.cls.long()].to(part.boxes.data.dtype)
+            raw_results[class_name] = part
+        return raw_results
+    
     def warmup(self):
         """Aquece os modelos com inferência dummy."""
         self.logger.info("Aquecendo modelos...")
@@ -266,14 +779,17 @@ class YOLODetector:
             # Warm-up com imagem dummy
             dummy_np = np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8)
             
-            if self.seg_model:
-                _ = self.seg_model.predict(dummy_np, imgsz=self.imgsz, verbose=False)
-            if self.smudge_model:
-                _ = self.smudge_model.predict(dummy_np, imgsz=self.imgsz, verbose=False)
-            if self.simbolos_model:
-                _ = self.simbolos_model.predict(dummy_np, imgsz=self.imgsz, verbose=False)
-            if self.blackdot_model:
-                _ = self.blackdot_model.predict(dummy_np, imgsz=self.imgsz, verbose=False)
+            with self._mempool_context():
+                if self.seg_model:
+                    _ = self.seg_model.predict(dummy_np, imgsz=self.imgsz, half=self._half, verbose=False)
+                if self.smudge_model:
+                    _ = self.smudge_model.predict(dummy_np, imgsz=self.imgsz, half=self._half, verbose=False)
+                if self.simbolos_model:
+                    _ = self.simbolos_model.predict(dummy_np, imgsz=self.imgsz, half=self._half, verbose=False)
+                if self.blackdot_model:
+                    _ = self.blackdot_model.predict(dummy_np, imgsz=self.imgsz, half=self._half, verbose=False)
+                if self.unified_model:
+                    _ = self.unified_model.predict(dummy_np, imgsz=self.imgsz, half=self._half, verbose=False)
             
             self.logger.info("Warm-up concluído")
             
@@ -285,6 +801,10 @@ class YOLODetector:
         x1_min, y1_min, x1_max, y1_max = box1
         x2_min, y2_min, x2_max, y2_max = box2
         
+        # Early-out: boxes disjuntas em algum eixo (caso mais comum) não precisam de cálculo de área
+        if x1_max <= x2_min or x2_max <= x1_min or y1_max <= y2_min or y2_max <= y1_min:
+            return 0.0
+        
         inter_x_min = max(x1_min, x2_min)
         inter_y_min = max(y1_min, y2_min)
         inter_x_max = min(x1_max, x2_max)
@@ -317,6 +837,10 @@ class YOLODetector:
         x0, y0, w0, h0 = bbox1
         x1, y1, w1, h1 = bbox2
         
+        # Early-out: boxes disjuntas em algum eixo
+        if x0 + w0 <= x1 or x1 + w1 <= x0 or y0 + h0 <= y1 or y1 + h1 <= y0:
+            return 0.0
+        
         a0 = w0 * h0
         a1 = w1 * h1
         xa0, ya0, xa1, ya1 = x0, y0, x0 + w0, y0 + h0
@@ -457,15 +981,16 @@ class YOLODetector:
         x1_1, y1_1, x2_1, y2_1 = box1
         x1_2, y1_2, x2_2, y2_2 = box2
         
+        # Early-out: boxes disjuntas em algum eixo (caso mais comum) - 4 comparações em vez da área
+        if x2_1 <= x1_2 or x2_2 <= x1_1 or y2_1 <= y1_2 or y2_2 <= y1_1:
+            return 0.0
+        
         # Calcular interseção
         x1_i = max(x1_1, x1_2)
         y1_i = max(y1_1, y1_2)
         x2_i = min(x2_1, x2_2)
         y2_i = min(y2_1, y2_2)
         
-        if x2_i <= x1_i or y2_i <= y1_i:
-            return 0.0
-        
         intersection = (x2_i - x1_i) * (y2_i - y1_i)
         
         # Calcular união
@@ -500,6 +1025,60 @@ class YOLODetector:
                 y2_1 <= y1_2 or  # Completamente acima
                 y1_1 >= y2_2)    # Completamente abaixo
     
+    def _smudge_any_overlap(self, smudge_box: Tuple[int, int, int, int], others: np.ndarray) -> bool:
+        """
+        Verifica se a box de smudge NÃO está completamente fora de alguma das outras boxes.
+        
+        Versão vetorizada de _is_box_completely_outside contra todas as boxes de uma vez.
+        
+        Args:
+            smudge_box: (x1, y1, x2, y2) da detecção smudge
+            others: Array (M, 4) com as boxes das outras classes
+            
+        Returns:
+            True se houver qualquer interseção com as outras boxes
+        """
+        if len(others) == 0:
+            return False
+        x1, y1, x2, y2 = smudge_box
+        outside = ((x2 <= others[:, 0]) | (x1 >= others[:, 2]) |
+                   (y2 <= others[:, 1]) | (y1 >= others[:, 3]))
+        return not outside.all()
+    
+    def _pairwise_iou(self, boxes: np.ndarray) -> np.ndarray:
+        """
+        Calcula a matriz de IOU N×N entre todas as bounding boxes de uma vez (broadcasting).
+        
+        Args:
+            boxes: Array (N, 4) com boxes (x1, y1, x2, y2)
+            
+        Returns:
+            Matriz (N, N) com o IOU de cada par (mesma semântica de _calculate_iou)
+        """
+        # Aritmética inteira (int32) até a divisão final
+        tl = np.maximum(boxes[:, None, :2], boxes[None, :, :2])
+        br = np.minimum(boxes[:, None, 2:], boxes[None, :, 2:])
+        wh = np.clip(br - tl, 0, None)
+        inter = wh[..., 0] * wh[..., 1]
+        
+        areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+        union = areas[:, None] + areas[None, :] - inter
+        
+        iou = np.zeros(inter.shape, dtype=np.float64)
+        np.divide(inter, union, out=iou, where=union > 0)
+        return iou
+    
+    def _pairwise_completely_outside(self, boxes: np.ndarray) -> np.ndarray:
+        """
+        Matriz booleana N×N onde [i, j] indica box i COMPLETAMENTE FORA de box j.
+        
+        Versão vetorizada de _is_box_completely_outside para todos os pares.
+        """
+        return ((boxes[:, None, 2] <= boxes[None, :, 0]) |  # Completamente à esquerda
+                (boxes[:, None, 0] >= boxes[None, :, 2]) |  # Completamente à direita
+                (boxes[:, None, 3] <= boxes[None, :, 1]) |  # Completamente acima
+                (boxes[:, None, 1] >= boxes[None, :, 3]))   # Completamente abaixo
+    
     def _filter_overlapping_detections(self, detections_by_class: Dict[str, List]) -> Dict[str, List]:
         """
         Remove detecções sobrepostas entre classes, com exclusão mútua para FIFA, Símbolo e String.
@@ -518,7 +1097,7 @@ class YOLODetector:
         Returns:
             Detecções filtradas (smudge removido se não estiver completamente fora das bounding boxes das outras classes)
         """
-        filtered_detections = {class_name: [] for class_name in detections_by_class.keys()}
+        filtered_detections = {class_name: [] for class_name in self._result_template_keys}
         
         # Classes que têm exclusão mútua (FIFA, Símbolo, String)
         exclusive_classes = ['smudge', 'simbolos', 'blackdot']  # Classes internas
@@ -526,15 +1105,17 @@ class YOLODetector:
         # Coletar todas as detecções com suas classes
         all_detections = []
         for class_name, detections in detections_by_class.items():
+            # Constantes por classe (calculadas uma vez, não por detecção)
+            is_simbolos = (class_name == 'simbolos')
+            is_fifa_smudge = (class_name == 'smudge')  # FIFA do modelo smudge
+            is_exclusive = class_name in exclusive_classes
+            # Calcular prioridade baseada na classe
+            base_priority = self._priority_map.get(class_name, 999)
             for detection in detections:
                 class_id = detection.get('class_id')
                 # Identificar se é FIFA do modelo de símbolos (classes 0-1) ou FIFA (smudge)
                 # No modelo best.pt: 0=FIFA_NO, 1=FIFA_OK, 2=Simbolo_NO, 3=Simbolo_OK, 4=String_NO, 5=String_OK
-                is_fifa_in_simbolos = (class_name == 'simbolos' and class_id is not None and class_id in [0, 1])  # FIFA_NO ou FIFA_OK do modelo simbolos
-                is_fifa_smudge = (class_name == 'smudge')  # FIFA do modelo smudge
-                
-                # Calcular prioridade baseada na classe
-                base_priority = self.class_priority.index(class_name) if class_name in self.class_priority else 999
+                is_fifa_in_simbolos = is_simbolos and class_id in _FIFA_SIMBOLOS_IDS  # FIFA_NO ou FIFA_OK do modelo simbolos
                 
                 # Ajustar prioridade:
                 # - FIFA do modelo simbolos (classes 0-1): prioridade 1 (equivalente a simbolos)
@@ -556,7 +1137,7 @@ class YOLODetector:
                     'confidence': detection['confidence'],
                     'class_id': class_id,  # Preservar class_id (importante para classes OK/NO)
                     'priority': priority,
-                    'is_exclusive': class_name in exclusive_classes,
+                    'is_exclusive': is_exclusive,
                     'is_fifa_in_simbolos': is_fifa_in_simbolos,  # Marcar se é FIFA do modelo simbolos
                     'is_fifa_smudge': is_fifa_smudge  # Marcar se é FIFA do modelo smudge
                 })
@@ -566,36 +1147,31 @@ class YOLODetector:
         # blackdot, FIFA do simbolos, Simbolo e String têm prioridade sobre smudge
         all_detections.sort(key=lambda x: (x['priority'], -x['confidence']))
         
-        # OTIMIZAÇÃO: Criar lista flat de todas as outras detecções (não-smudge) para verificação rápida
-        other_detections_flat = []
-        for other_class_name, other_detections_list in detections_by_class.items():
-            if other_class_name != 'smudge':
-                for other_det in other_detections_list:
-                    other_detections_flat.append(other_det['bbox'])
+        # OTIMIZAÇÃO: Array (M, 4) de todas as outras detecções (não-smudge), montado uma vez por frame
+        other_boxes = np.asarray(
+            [other_det['bbox']
+             for other_class_name, other_detections_list in detections_by_class.items()
+             if other_class_name != 'smudge'
+             for other_det in other_detections_list],
+            dtype=np.int32
+        ).reshape(-1, 4)
         
         # Filtrar sobreposições com exclusão mútua
         # REGRA CRÍTICA: smudge só é exibido se estiver COMPLETAMENTE FORA das bounding boxes de TODAS as outras classes
         for detection in all_detections:
             is_overlapping = False
             
-            # OTIMIZAÇÃO: Verificação rápida para smudge - uma única passada
-            if detection['is_fifa_smudge']:
-                # Verificar contra lista flat de outras detecções (mais rápido que loops aninhados)
-                for other_bbox in other_detections_flat:
-                    if not self._is_box_completely_outside(detection['bbox'], other_bbox):
-                        is_overlapping = True
-                        break
-                
-                # Se smudge foi marcado como overlapping, pular para próxima detecção
-                if is_overlapping:
-                    continue
+            # OTIMIZAÇÃO: Verificação rápida para smudge - uma única passada vetorizada
+            # Se smudge não está completamente fora de todas as outras, pular para próxima detecção
+            if detection['is_fifa_smudge'] and self._smudge_any_overlap(detection['bbox'], other_boxes):
+                continue
             
             # Verificar sobreposição com detecções já aceitas (apenas para classes não-smudge)
             for accepted_class, accepted_detections in filtered_detections.items():
                 for accepted_detection in accepted_detections:
                     # EXCEÇÃO: FIFA do modelo smudge e FIFA do modelo simbolos podem coexistir
                     accepted_class_id = accepted_detection.get('class_id')
-                    accepted_is_fifa_in_simbolos = (accepted_class == 'simbolos' and accepted_class_id is not None and accepted_class_id in [0, 1])
+                    accepted_is_fifa_in_simbolos = (accepted_class == 'simbolos' and accepted_class_id in _FIFA_SIMBOLOS_IDS)
                     
                     fifa_fifa_intersection = (
                         (detection['is_fifa_smudge'] and accepted_is_fifa_in_simbolos) or
@@ -653,19 +1229,25 @@ class YOLODetector:
         # Classes exclusivas (FIFA, Símbolo, String)
         exclusive_classes = ['smudge', 'simbolos', 'blackdot']
         
-        # Coletar todas as detecções exclusivas com informações adicionais
-        exclusive_detections = []
+        # Coletar todas as detecções exclusivas em Struct-of-Arrays (listas paralelas -> np.ndarray)
+        names = []
+        bboxes = []
+        confidences = []
+        class_ids = []
+        priorities = []
+        fifa_in_simbolos_flags = []
+        fifa_smudge_flags = []
         for class_name in exclusive_classes:
             if class_name in detections_by_class:
+                # Calcular prioridade baseada na classe
+                base_priority = self._priority_map.get(class_name, 999)
+                is_simbolos = (class_name == 'simbolos')
+                is_fifa_smudge = (class_name == 'smudge')  # FIFA do modelo smudge
                 for detection in detections_by_class[class_name]:
                     class_id = detection.get('class_id')
                     # Identificar se é FIFA do modelo de símbolos (classes 0-1) ou FIFA (smudge)
                     # No modelo best.pt: 0=FIFA_NO, 1=FIFA_OK, 2=Simbolo_NO, 3=Simbolo_OK, 4=String_NO, 5=String_OK
-                    is_fifa_in_simbolos = (class_name == 'simbolos' and class_id is not None and class_id in [0, 1])  # FIFA_NO ou FIFA_OK do modelo simbolos
-                    is_fifa_smudge = (class_name == 'smudge')  # FIFA do modelo smudge
-                    
-                    # Calcular prioridade baseada na classe
-                    base_priority = self.class_priority.index(class_name) if class_name in self.class_priority else 999
+                    is_fifa_in_simbolos = is_simbolos and class_id in _FIFA_SIMBOLOS_IDS  # FIFA_NO ou FIFA_OK do modelo simbolos
                     
                     # Ajustar prioridade:
                     # - FIFA do modelo simbolos (classes 0-1): prioridade 1 (equivalente a simbolos)
@@ -675,121 +1257,112 @@ class YOLODetector:
                     if is_fifa_in_simbolos:
                         # FIFA do modelo simbolos tem prioridade equivalente a simbolos (índice 1)
                         priority = 1
-                    elif is_fifa_smudge:
-                        # FIFA do modelo smudge mantém prioridade de smudge (menor)
-                        priority = base_priority  # Será 2 (smudge)
                     else:
+                        # FIFA do modelo smudge mantém prioridade de smudge (menor), demais a da classe
                         priority = base_priority
                     
-                    exclusive_detections.append({
-                        'class': class_name,
-                        'bbox': detection['bbox'],
-                        'confidence': detection['confidence'],
-                        'class_id': class_id,  # Preservar class_id (importante para classes OK/NO)
-                        'priority': priority,
-                        'is_fifa_in_simbolos': is_fifa_in_simbolos,  # Marcar se é FIFA do modelo simbolos
-                        'is_fifa_smudge': is_fifa_smudge  # Marcar se é FIFA do modelo smudge
-                    })
-        
-        # Ordenar por prioridade PRIMEIRO, depois por confiança
+                    names.append(class_name)
+                    bboxes.append(detection['bbox'])
+                    confidences.append(detection['confidence'])
+                    class_ids.append(class_id)  # Preservar class_id (importante para classes OK/NO)
+                    priorities.append(priority)
+                    fifa_in_simbolos_flags.append(is_fifa_in_simbolos)
+                    fifa_smudge_flags.append(is_fifa_smudge)
+        
+        # Ordenar por prioridade PRIMEIRO, depois por confiança (lexsort estável, última chave é a primária)
         # Prioridade: blackdot (0) > simbolos/FIFA do simbolos (1) > smudge/FIFA do smudge (2)
         # blackdot, FIFA do simbolos, Simbolo e String têm prioridade sobre smudge
-        exclusive_detections.sort(key=lambda x: (x['priority'], -x['confidence']))
+        conf_arr = np.asarray(confidences, dtype=np.float64)
+        order = np.lexsort((-conf_arr, np.asarray(priorities, dtype=np.int16)))
         
-        # OTIMIZAÇÃO: Criar lista flat de outras detecções (não-smudge) para verificação rápida
-        other_exclusive_flat = []
-        for other_det in exclusive_detections:
-            if not other_det.get('is_fifa_smudge', False):
-                other_exclusive_flat.append(other_det['bbox'])
+        # OTIMIZAÇÃO: Matrizes de IOU e de separação total calculadas uma única vez (vetorizado)
+        boxes = np.asarray(bboxes, dtype=np.int32).reshape(-1, 4)[order]
+        is_fifa_smudge = np.asarray(fifa_smudge_flags, dtype=bool)[order]
+        is_fifa_in_simbolos = np.asarray(fifa_in_simbolos_flags, dtype=bool)[order]
+        iou_matrix = self._pairwise_iou(boxes)
+        outside_matrix = self._pairwise_completely_outside(boxes)
         
-        # Aplicar exclusão mútua com threshold rigoroso
         # REGRA CRÍTICA: smudge só é exibido se estiver COMPLETAMENTE FORA das bounding boxes de TODAS as outras classes
-        filtered_exclusive = []
-        for detection in exclusive_detections:
-            is_overlapping = False
-            
-            # OTIMIZAÇÃO: Verificação rápida para smudge
-            if detection['is_fifa_smudge']:
-                # Verificar contra lista flat (mais rápido)
-                for other_bbox in other_exclusive_flat:
-                    if not self._is_box_completely_outside(detection['bbox'], other_bbox):
-                        is_overlapping = True
-                        break
-                
-                if is_overlapping:
-                    continue
-            
-            # Verificar sobreposição com detecções já aceitas
-            for accepted in filtered_exclusive:
-                # EXCEÇÃO: FIFA do modelo smudge e FIFA do modelo simbolos podem coexistir
-                fifa_fifa_intersection = (
-                    (detection['is_fifa_smudge'] and accepted.get('is_fifa_in_simbolos')) or
-                    (detection.get('is_fifa_in_simbolos') and accepted.get('is_fifa_smudge'))
-                )
-                
-                if fifa_fifa_intersection:
-                    continue
-                
-                # Para outras classes, usar threshold de IOU
-                iou = self._calculate_iou(detection['bbox'], accepted['bbox'])
-                if iou > 0.02:
-                    is_overlapping = True
-                    break
-            
-            if not is_overlapping:
-                filtered_exclusive.append(detection)
+        smudge_blocked = is_fifa_smudge & ~outside_matrix[:, ~is_fifa_smudge].all(axis=1)
         
-        # Reconstruir dicionário de detecções
-        result = {class_name: [] for class_name in detections_by_class.keys()}
+        # Aplicar exclusão mútua com threshold rigoroso (kernel compilado com numba quando disponível)
+        accepted = _nms_priority_kernel(iou_matrix, is_fifa_smudge, is_fifa_in_simbolos, smudge_blocked)
+        
+        # Reconstruir dicionário de detecções (dicts criados apenas para as detecções aceitas)
+        result = {class_name: [] for class_name in self._result_template_keys}
         
         # Adicionar detecções exclusivas filtradas (preservar class_id se existir)
-        for detection in filtered_exclusive:
+        for idx in order[accepted].tolist():
             filtered_detection = {
-                'bbox': detection['bbox'],
-                'confidence': detection['confidence']
+                'bbox': bboxes[idx],
+                'confidence': confidences[idx]
             }
             # Preservar class_id se existir (para classes do modelo simbolos como R_OK e R_NO)
-            if detection.get('class_id') is not None:
-                filtered_detection['class_id'] = detection['class_id']
-            result[detection['class']].append(filtered_detection)
+            if class_ids[idx] is not None:
+                filtered_detection['class_id'] = class_ids[idx]
+            result[names[idx]].append(filtered_detection)
         
         return result
     
-    def _stabilize_detection_count(self, class_name: str, current_count: int) -> int:
+    def _rebuild_priority_map(self):
+        """Recria o mapa classe -> índice de prioridade (lookup O(1) no filtro de exclusão)."""
+        self._priority_map = {name: i for i, name in enumerate(self.class_priority)}
+    
+    def _rebuild_stabilization_buffers(self):
+        """
+        (Re)cria o buffer de estabilização com stabilization_window colunas (preservando
+        os frames mais recentes) e a soma dos pesos da média móvel ponderada (1..N).
+        """
+        window = max(1, int(self.stabilization_window))
+        old_buf = self._stab_buf
+        keep = min(window, old_buf.shape[1])
+        self._stab_buf = np.zeros((len(self._stab_classes), window), dtype=np.float64)
+        if keep:
+            self._stab_buf[:, window - keep:] = old_buf[:, old_buf.shape[1] - keep:]
+        np.minimum(self._stab_len, window, out=self._stab_len)
+        self._stabilization_positions = np.arange(1, window + 1, dtype=np.float64)
+        # Soma dos pesos para cada tamanho de histórico (evita sum() por frame)
+        self._stabilization_weight_sums = np.cumsum(self._stabilization_positions)
+    
+    def _stabilize_counts(self, counts: Tuple[int, int, int], active: Tuple[bool, bool, bool]) -> Tuple[int, int, int]:
         """
-        Aplica estabilização temporal no contador de detecções com filtro mais robusto.
+        Aplica estabilização temporal nas contagens das três classes de uma vez.
+        
+        Média móvel ponderada por classe (frames mais recentes têm mais peso) seguida do
+        filtro de mudança brusca (máximo 50% de mudança por frame).
         
         Args:
-            class_name: Nome da classe
-            current_count: Contagem atual
+            counts: Contagens atuais (smudge, simbolos, blackdot)
+            active: Classes cujo histórico deve ser atualizado (modelo ativado)
             
         Returns:
-            Contagem estabilizada
+            Contagens estabilizadas (classes inativas retornam a contagem recebida)
         """
-        # Adicionar contagem atual ao histórico
-        self.detection_history[class_name].append(current_count)
-        
-        # Manter apenas os últimos N frames
-        if len(self.detection_history[class_name]) > self.stabilization_window:
-            self.detection_history[class_name] = self.detection_history[class_name][-self.stabilization_window:]
-        
-        # Calcular média móvel ponderada (frames mais recentes têm mais peso)
-        if len(self.detection_history[class_name]) > 0:
-            weights = [i + 1 for i in range(len(self.detection_history[class_name]))]
-            weighted_sum = sum(count * weight for count, weight in zip(self.detection_history[class_name], weights))
-            total_weight = sum(weights)
-            stabilized_count = weighted_sum / total_weight
-            
-            # Aplicar filtro de mudança brusca (máximo 50% de mudança por frame)
-            if len(self.detection_history[class_name]) > 1:
-                previous_count = self.detection_history[class_name][-2]
-                max_change = max(1, previous_count * 0.5)  # Máximo 50% de mudança
-                if abs(stabilized_count - previous_count) > max_change:
-                    stabilized_count = previous_count + (1 if stabilized_count > previous_count else -1)
-            
-            return int(round(stabilized_count))
-        
-        return current_count
+        active = np.asarray(active, dtype=bool)
+        if not active.any():
+            return tuple(counts)
+        
+        buf = self._stab_buf
+        window = buf.shape[1]
+        # Deslocar à esquerda e gravar o frame atual na última coluna (só classes ativas)
+        buf[active, :-1] = buf[active, 1:]
+        buf[active, -1] = np.asarray(counts, dtype=np.float64)[active]
+        n = self._stab_len
+        n[active] = np.minimum(n[active] + 1, window)
+        
+        # Pesos 1..n alinhados à direita (zero nas colunas ainda sem histórico)
+        weights = np.maximum(self._stabilization_positions - (window - n)[:, None], 0.0)
+        stabilized = (buf * weights).sum(axis=1) / self._stabilization_weight_sums[np.maximum(n, 1) - 1]
+        
+        # Filtro de mudança brusca em relação ao frame anterior
+        if window > 1:
+            previous = buf[:, -2]
+            max_change = np.maximum(1.0, previous * 0.5)
+            abrupt = (n > 1) & (np.abs(stabilized - previous) > max_change)
+            stabilized = np.where(abrupt, previous + np.where(stabilized > previous, 1.0, -1.0), stabilized)
+        
+        stabilized = np.rint(stabilized).astype(np.int64)
+        return tuple(int(stabilized[i]) if active[i] else counts[i] for i in range(len(counts)))
     
     def _validate_detection_quality(self, result, min_confidence: float) -> bool:
         """
@@ -808,9 +1381,8 @@ class YOLODetector:
         if len(result.boxes) == 0:
             return False
         
-        # Verificar se pelo menos uma detecção tem confiança suficiente
-        confidences = result.boxes.conf.cpu().numpy()
-        return np.max(confidences) >= min_confidence
+        # Verificar se pelo menos uma detecção tem confiança suficiente (redução no device, 1 escalar)
+        return result.boxes.conf.max().item() >= min_confidence
     
     def _validate_fifa_detection(self, result, min_confidence: float = 0.7) -> bool:
         """
@@ -830,42 +1402,31 @@ class YOLODetector:
             return False
         
         # Verificar confiança mínima AUMENTADA para reduzir conflitos
-        confidences = result.boxes.conf.cpu().numpy()
-        max_conf = np.max(confidences)
+        # (redução no device: só um escalar é sincronizado antes do short-circuit)
+        max_conf = result.boxes.conf.max().item()
         if max_conf < min_confidence:
             return False
         
-        # Verificar tamanho das bounding boxes com critérios mais rigorosos
+        # Verificar tamanho das bounding boxes com critérios mais rigorosos (uma única passada vetorizada)
         boxes = result.boxes.xyxy.cpu().numpy()
-        valid_boxes = 0
-        
-        for box in boxes:
-            x1, y1, x2, y2 = box
-            width = x2 - x1
-            height = y2 - y1
-            
-            # Critérios mais rigorosos para evitar conflitos
-            # Rejeitar bounding boxes muito pequenas (aumentado de 20 para 25)
-            if width < 25 or height < 25:
-                continue
-            
-            # Rejeitar bounding boxes muito grandes (reduzido de 200 para 150)
-            if width > 150 or height > 150:
-                continue
-            
-            # Verificar proporção da bounding box (evitar formas muito alongadas)
-            aspect_ratio = width / height
-            if aspect_ratio < 0.3 or aspect_ratio > 3.0:
-                continue
-            
-            valid_boxes += 1
+        width = boxes[:, 2] - boxes[:, 0]
+        height = boxes[:, 3] - boxes[:, 1]
+        aspect_ratio = width / np.maximum(height, 1)
+        
+        # - Rejeitar bounding boxes muito pequenas (aumentado de 20 para 25)
+        # - Rejeitar bounding boxes muito grandes (reduzido de 200 para 150)
+        # - Verificar proporção da bounding box (evitar formas muito alongadas)
+        valid = ((width >= 25) & (height >= 25) &
+                 (width <= 150) & (height <= 150) &
+                 (aspect_ratio >= 0.3) & (aspect_ratio <= 3.0))
+        valid_boxes = int(valid.sum())
         
         # Pelo menos uma bounding box deve ser válida
         if valid_boxes == 0:
             return False
         
         # Log de validação a cada 120 frames com informações de conflito
-        if self.frame_count % 120 == 0:
+        if self.frame_count % 120 == 0 and self.logger.isEnabledFor(logging.INFO):
             self.logger.info(f"🔍 FIFA Validation: {len(boxes)} total, {valid_boxes} valid, max_conf={max_conf:.3f}")
         
         return True
@@ -904,25 +1465,32 @@ class YOLODetector:
         
         return True
     
-    def _filter_valid_bboxes(self, bboxes: List[Tuple[int, int, int, int]], frame_shape: Tuple[int, int]) -> List[Tuple[int, int, int, int]]:
+    def _filter_valid_bboxes(self, bboxes: np.ndarray, frame_shape: Tuple[int, int]) -> np.ndarray:
         """
-        Filtra bounding boxes válidas.
+        Filtra bounding boxes válidas (mesmos critérios de _validate_bbox, vetorizado).
         
         Args:
-            bboxes: Lista de bounding boxes
+            bboxes: Array (N, 4) de bounding boxes (x1, y1, x2, y2)
             frame_shape: (height, width, channels)
             
         Returns:
-            Lista de bounding boxes válidas
+            Array (M, 4) com as bounding boxes válidas
         """
-        valid_bboxes = []
-        for bbox in bboxes:
-            if self._validate_bbox(bbox, frame_shape):
-                valid_bboxes.append(bbox)
-            else:
-                self.logger.debug(f"Bbox inválida removida: {bbox}")
+        bboxes = np.asarray(bboxes).reshape(-1, 4)
+        height, width = frame_shape[:2]
+        x1, y1, x2, y2 = bboxes[:, 0], bboxes[:, 1], bboxes[:, 2], bboxes[:, 3]
+        bw = x2 - x1
+        bh = y2 - y1
         
-        return valid_bboxes
+        valid = ((x1 >= 0) & (y1 >= 0) & (x2 < width) & (y2 < height) &  # Limites do frame
+                 (bw >= 10) & (bh >= 10) &                                # Tamanho mínimo (implica x2 > x1, y2 > y1)
+                 (bw <= width * 0.8) & (bh <= height * 0.8))              # Máximo 80% do frame
+        
+        if not valid.all():
+            for bbox in bboxes[~valid]:
+                self.logger.debug("Bbox inválida removida: %s", tuple(bbox))
+        
+        return bboxes[valid]
     
     def save_parameters(self, config_path: str = "config/last_settings.yaml"):
         """
@@ -933,7 +1501,6 @@ class YOLODetector:
         """
         try:
             import yaml
-            from pathlib import Path
             
             # Criar diretório se não existir
             Path(config_path).parent.mkdir(exist_ok=True)
@@ -965,9 +1532,15 @@ class YOLODetector:
                 }
             }
             
-            # Salvar arquivo
+            # Nada mudou desde a última escrita (ex.: slider parado no mesmo valor): evitar I/O
+            if self._last_saved_parameters == (config_path, parameters):
+                return
+            
+            # Salvar arquivo (CSafeDumper usa o backend C libyaml quando disponível)
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
             with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(parameters, f, default_flow_style=False, allow_unicode=True)
+                yaml.dump(parameters, f, Dumper=dumper, default_flow_style=False, allow_unicode=True)
+            self._last_saved_parameters = (config_path, parameters)
             
             self.logger.info(f"✓ Parâmetros salvos em: {config_path}")
             
@@ -986,7 +1559,6 @@ class YOLODetector:
         """
         try:
             import yaml
-            from pathlib import Path
             
             if not Path(config_path).exists():
                 self.logger.info("Arquivo de parâmetros não encontrado, usando padrões")
@@ -1018,10 +1590,14 @@ class YOLODetector:
             # Aplicar parâmetros de inferência
             if "inference_params" in parameters:
                 inf_params = parameters["inference_params"]
-                self.stabilization_window = inf_params.get("stabilization_window", self.stabilization_window)
+                stabilization_window = inf_params.get("stabilization_window", self.stabilization_window)
+                if stabilization_window != self.stabilization_window:
+                    self.stabilization_window = stabilization_window
+                    self._rebuild_stabilization_buffers()
                 self.min_detection_confidence = inf_params.get("min_detection_confidence", self.min_detection_confidence)
                 self.overlap_threshold = inf_params.get("overlap_threshold", self.overlap_threshold)
                 self.class_priority = inf_params.get("class_priority", self.class_priority)
+                self._rebuild_priority_map()
             
             # Aplicar parâmetros de transfer
             if "transfer_params" in parameters:
@@ -1075,31 +1651,34 @@ class YOLODetector:
         if mask_list is None or len(mask_list) == 0:
             return None
         
-        # Converter para numpy se necessário
         m = mask_list
-        if hasattr(m, 'cpu'):
-            m = m.cpu().numpy()
-        
-        # Combinar máscaras com threshold 0.5
-        comb = (np.max(m, axis=0) > 0.5).astype(np.uint8) * 255
+        if isinstance(m, torch.Tensor):
+            # Reduzir no device: só a máscara combinada uint8 (1/N do volume, 1/4 dos bytes) vai para o host
+            comb_small = m.amax(dim=0) if m.dim() == 3 else m
+            comb = comb_small.gt(0.5).to(torch.uint8).mul_(255).cpu().numpy()
+        else:
+            # Combinar máscaras com threshold 0.5 na resolução da máscara (antes do upsample)
+            comb_small = m.max(axis=0) if m.ndim == 3 else m
+            comb = (comb_small > 0.5).astype(np.uint8) * 255
         H, W = full_shape[:2]
         comb = cv2.resize(comb, (W, H), interpolation=cv2.INTER_NEAREST)
         
         # Operações morfológicas para limpar a máscara
-        kernel = np.ones((3, 3), np.uint8)
-        comb = cv2.morphologyEx(comb, cv2.MORPH_CLOSE, kernel, iterations=1)
+        comb = cv2.morphologyEx(comb, cv2.MORPH_CLOSE, self._morph_kernel3, iterations=1)
         
         return comb
 
     def largest_bbox_from_mask(self, mask, margin, frame_shape):
         """Encontra o maior bounding box da máscara (baseado no código MacBook)."""
         h, w = frame_shape[:2]
-        cnts, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        if not cnts:
+        # Uma única passada de rotulagem já devolve bbox e área de cada componente
+        num, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+        if num <= 1:
             return None
         
-        c = max(cnts, key=cv2.contourArea)
-        x, y, bw, bh = cv2.boundingRect(c)
+        # Componente 0 é o fundo; escolher o de maior área
+        k = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+        x, y, bw, bh = (int(v) for v in stats[k, :4])
         x = max(0, x - margin)
         y = max(0, y - margin)
         bw = min(w - x, bw + 2 * margin)
@@ -1129,16 +1708,18 @@ class YOLODetector:
             orig_h, orig_w = frame.shape[:2]
             
             # Log a cada 60 frames para não poluir
-            if self.frame_count % 60 == 0:
+            if self.frame_count % 60 == 0 and self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"Executando segmentação ROI no frame {orig_w}x{orig_h} com conf={self.roi_conf:.2f}")
             
-            results = self.seg_model.predict(
-                frame,
-                imgsz=self.imgsz,
-                conf=self.roi_conf,
-                iou=self.roi_iou,
-                verbose=False
-            )
+            with self._mempool_context():
+                results = self.seg_model.predict(
+                    frame,
+                    imgsz=self.imgsz,
+                    conf=self.roi_conf,
+                    iou=self.roi_iou,
+                    half=self._half,
+                    verbose=False
+                )
             
             if len(results) == 0 or results[0].masks is None:
                 if self.frame_count % 60 == 0:
@@ -1152,7 +1733,7 @@ class YOLODetector:
                     self.logger.warning(f"⚠ Lista de máscaras vazia")
                 return None, None, None, None
             
-            if self.frame_count % 60 == 0:
+            if self.frame_count % 60 == 0 and self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"✓ Encontradas {len(masks)} máscaras ROI")
             
             # Capturar confiança da detecção
@@ -1167,7 +1748,7 @@ class YOLODetector:
             # Verificar área mínima
             area = np.count_nonzero(combined_mask)
             if area < self.roi_min_pixels:
-                if self.frame_count % 60 == 0:
+                if self.frame_count % 60 == 0 and self.logger.isEnabledFor(logging.DEBUG):
                     self.logger.debug(f"⚠ ROI muito pequeno: {area}px < {self.roi_min_pixels}px")
                 return None, None, None, None
             
@@ -1180,17 +1761,23 @@ class YOLODetector:
             
             x, y, w, h = bbox
             
-            # Extrair crop e aplicar máscara para limitar a ROI
-            roi_crop = frame[y:y+h, x:x+w].copy()
+            # Extrair crop (view, sem cópia) e aplicar máscara para limitar a ROI
+            frame_crop = frame[y:y+h, x:x+w]
             
             # Aplicar máscara à ROI para limitar a área de detecção
             roi_mask = combined_mask[y:y+h, x:x+w]
-            if roi_mask is not None and roi_mask.shape[:2] == roi_crop.shape[:2]:
-                # Aplicar máscara aos canais de cor
-                for c in range(roi_crop.shape[2]):
-                    roi_crop[:, :, c] = np.where(roi_mask > 0, roi_crop[:, :, c], 0)
+            if roi_mask is not None and roi_mask.shape[:2] == frame_crop.shape[:2]:
+                if NUMBA_AVAILABLE and frame_crop.ndim == 3:
+                    # Kernel numba paralelo por linha (libera a GIL, qualquer número de canais)
+                    roi_crop = np.empty_like(frame_crop)
+                    _mask_apply(frame_crop, roi_mask, roi_crop)
+                else:
+                    # combined_mask já é uint8 0/255: bitwise_and aloca a saída e zera fora da máscara em uma passada
+                    roi_crop = cv2.bitwise_and(frame_crop, frame_crop, mask=roi_mask)
+            else:
+                roi_crop = frame_crop.copy()
             
-            if self.frame_count % 60 == 0:
+            if self.frame_count % 60 == 0 and self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"✓ ROI extraído: posição=({x},{y}) tamanho={w}x{h} área={area}px confiança={confidence:.3f}")
             
             return roi_crop, bbox, combined_mask, confidence
@@ -1217,54 +1804,123 @@ class YOLODetector:
         Hc, Wc = crop_shape[:2]
         
         # EXATAMENTE como no código MacBook: usar xyxyn (normalizado 0-1)
-        b = result.boxes.xyxyn.cpu().numpy().astype(float)
+        xyxyn = result.boxes.xyxyn.cpu().numpy()
         
-        if debug and len(b) > 0:
+        if debug and len(xyxyn) > 0:
             self.logger.debug(f"   🔄 Conversão bbox: frame={Wf}x{Hf}, crop={Wc}x{Hc}, offset=({x0},{y0})")
-            self.logger.debug(f"      Antes (norm): {b[0]}")
-        
-        # Escalar para o tamanho do crop
-        b[:, [0, 2]] *= Wc  # Largura do crop
-        b[:, [1, 3]] *= Hc  # Altura do crop
-        
-        if debug and len(b) > 0:
-            self.logger.debug(f"      Após escala crop: {b[0]}")
-        
-        # Adicionar offset do ROI no frame original
-        b[:, [0, 2]] += x0  # Offset X
-        b[:, [1, 3]] += y0  # Offset Y
+            self.logger.debug(f"      Antes (norm): {xyxyn[0]}")
         
-        if debug and len(b) > 0:
-            self.logger.debug(f"      Após offset: {b[0]}")
+        # Transformação afim (N, 4) inteira em float64: escala do crop + offset do ROI no frame
+        b = np.multiply(xyxyn, np.array([Wc, Hc, Wc, Hc], dtype=np.float64), dtype=np.float64)
+        b += np.array([x0, y0, x0, y0], dtype=np.float64)
         
-        # Clipping para limites do frame
-        b[:, [0, 2]] = np.clip(b[:, [0, 2]], 0, Wf - 1)
-        b[:, [1, 3]] = np.clip(b[:, [1, 3]], 0, Hf - 1)
+        # Pixels inteiros a partir daqui (truncamento comuta com o clipping em limites inteiros)
+        b = b.astype(np.int32)
+        np.clip(b, 0, np.array([Wf - 1, Hf - 1, Wf - 1, Hf - 1], dtype=np.int32), out=b)
         
-        # Garantir que x1 < x2 e y1 < y2
-        x1, y1, x2, y2 = b[:, 0], b[:, 1], b[:, 2], b[:, 3]
-        fix = x2 < x1
-        b[fix, 0], b[fix, 2] = x2[fix], x1[fix]
-        fix = y2 < y1
-        b[fix, 1], b[fix, 3] = y2[fix], y1[fix]
+        # Garantir que x1 < x2 e y1 < y2: ordenar in-place os pares (x1, x2) e (y1, y2)
+        b.reshape(-1, 2, 2).sort(axis=1)
         
         if debug and len(b) > 0:
-            self.logger.debug(f"      Final (frame): {b[0].astype(int)}")
+            self.logger.debug(f"      Final (frame): {b[0]}")
         
         # Validar e filtrar bounding boxes
-        valid_bboxes = self._filter_valid_bboxes(b.astype(int), frame_shape)
+        valid_bboxes = self._filter_valid_bboxes(b, frame_shape)
         
         if len(valid_bboxes) == 0:
             return np.array([], dtype=np.int32)
         
-        return np.array(valid_bboxes, dtype=np.int32)
+        return valid_bboxes
 
+    def _gather_detections(self, class_results: List[Tuple[str, Any]], x0, y0, crop_shape, frame_shape,
+                           roi_mask: Optional[np.ndarray], roi_bbox: Optional[Tuple[int, int, int, int]]) -> Dict[str, List[Dict]]:
+        """
+        Converte as boxes de todas as classes para o frame e mantém apenas as válidas dentro da ROI.
+        
+        Mesma conversão de boxes_from_result_in_frame e mesmos critérios de _filter_valid_bboxes
+        e is_detection_inside_roi, mas executados em bloco no device: as boxes das três classes
+        são concatenadas, a máscara da ROI é enviada uma vez por frame e consultada nos centros,
+        e só as candidatas são transferidas, em uma única cópia.
+        
+        Args:
+            class_results: Lista de (classe, resultado YOLO) com pelo menos uma box
+            
+        Returns:
+            Dict classe -> lista de dicts {'bbox', 'confidence'[, 'class_id']}
+        """
+        detections_by_class = {class_name: [] for class_name, _ in class_results}
+        if roi_bbox is None or not class_results:
+            return detections_by_class
+        
+        Hf, Wf = frame_shape[:2]
+        Hc, Wc = crop_shape[:2]
+        
+        # Concatenar as classes (coluna de índice da classe para separar depois)
+        xyxyn = torch.cat([result.boxes.xyxyn for _, result in class_results]).double()
+        device = xyxyn.device
+        conf = torch.cat([result.boxes.conf for _, result in class_results]).double()
+        cls = torch.cat([result.boxes.cls for _, result in class_results]).double()
+        owner = torch.cat([torch.full((len(result.boxes),), k, dtype=torch.float64, device=device)
+                           for k, (_, result) in enumerate(class_results)])
+        
+        # Mesma aritmética do caminho NumPy (float64 -> truncamento -> clipping)
+        b = xyxyn * xyxyn.new_tensor([Wc, Hc, Wc, Hc]) + xyxyn.new_tensor([x0, y0, x0, y0])
+        b = b.long()
+        b = torch.minimum(b.clamp(min=0), b.new_tensor([Wf - 1, Hf - 1, Wf - 1, Hf - 1]))
+        x1 = torch.minimum(b[:, 0], b[:, 2])
+        x2 = torch.maximum(b[:, 0], b[:, 2])
+        y1 = torch.minimum(b[:, 1], b[:, 3])
+        y2 = torch.maximum(b[:, 1], b[:, 3])
+        bw = x2 - x1
+        bh = y2 - y1
+        
+        # Critérios de _filter_valid_bboxes (limites já garantidos pelo clipping)
+        keep = (bw >= 10) & (bh >= 10) & (bw <= Wf * 0.8) & (bh <= Hf * 0.8)
+        
+        # VERIFICAÇÃO RÁPIDA 1: centro dentro do bbox da ROI
+        cx = (x1 + x2) // 2
+        cy = (y1 + y2) // 2
+        roi_x, roi_y, roi_w, roi_h = roi_bbox
+        keep &= (cx >= roi_x) & (cx <= roi_x + roi_w) & (cy >= roi_y) & (cy <= roi_y + roi_h)
+        
+        # VERIFICAÇÃO RÁPIDA 2: centro na máscara (máscara enviada ao device uma vez por frame)
+        if roi_mask is not None:
+            roi_mask_gpu = torch.from_numpy(np.ascontiguousarray(roi_mask)).to(device, non_blocking=True)
+            in_mask = roi_mask_gpu[cy, cx] > 0
+        else:
+            in_mask = torch.ones_like(keep)
+        
+        # Uma única transferência device -> host com as candidatas de todas as classes
+        packed = torch.stack((x1, y1, x2, y2), dim=1).double()
+        packed = torch.cat((packed, conf[:, None], cls[:, None], owner[:, None], in_mask.double()[:, None]), dim=1)
+        candidates = packed[keep].cpu().numpy()
+        if len(candidates) == 0:
+            return detections_by_class
+        
+        coords = candidates[:, :4].astype(np.int32)
+        inside = candidates[:, 7] > 0
+        # Centro fora da máscara: verificação de área de is_detection_inside_roi (caminho raro)
+        for i in np.flatnonzero(~inside):
+            inside[i] = self.is_detection_inside_roi(tuple(coords[i]), roi_mask, roi_bbox)
+        
+        for row, box in zip(candidates[inside], coords[inside]):
+            class_name = class_results[int(row[6])][0]
+            detection = {
+                'bbox': tuple(int(v) for v in box),
+                'confidence': float(row[4])
+            }
+            if class_name == "simbolos":
+                # Preservar class_id para classes OK/NO (FIFA, Simbolo, String)
+                detection['class_id'] = int(row[5])
+            detections_by_class[class_name].append(detection)
+        return detections_by_class
+    
     def detect_in_roi(self, roi_crop: np.ndarray, model: YOLO, conf: float, iou: float, model_name: str = "Unknown"):
         """
         Executa detecção em um crop ROI (baseado no código MacBook estável).
         
         Args:
-            roi_crop: Imagem crop do ROI
+            roi_crop: Imagem crop do ROI (ou tensor já pré-processado por _roi_tensor)
             model: Modelo YOLO para detecção
             conf: Confiança mínima
             iou: IOU threshold
@@ -1277,22 +1933,24 @@ class YOLODetector:
             self.logger.error(f"✗ Modelo {model_name} não está carregado!")
             return None
         
-        if roi_crop is None or roi_crop.size == 0:
+        if roi_crop is None or 0 in roi_crop.shape:
             return None
         
         try:
             # Log tamanho do crop para debug
-            if self.frame_count % 60 == 0:
+            if self.frame_count % 60 == 0 and self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"🔍 {model_name}: crop={roi_crop.shape}, conf={conf:.2f}, imgsz={self.imgsz}")
             
-            results = model.predict(
-                roi_crop,
-                imgsz=self.imgsz,
-                conf=conf,
-                iou=iou,
-                max_det=self.max_det,
-                verbose=False
-            )
+            with self._mempool_context():
+                results = model.predict(
+                    roi_crop,
+                    imgsz=self.imgsz,
+                    conf=conf,
+                    iou=iou,
+                    max_det=self.max_det,
+                    half=self._half,
+                    verbose=False
+                )
             
             if len(results) > 0:
                 result = results[0]
@@ -1301,7 +1959,7 @@ class YOLODetector:
                 # (Removido para evitar erros e melhorar performance)
                 
                 # Log detalhado a cada 120 frames (reduzido para melhor performance)
-                if self.frame_count % 120 == 0:
+                if self.frame_count % 120 == 0 and self.logger.isEnabledFor(logging.INFO):
                     # Verificar se há detecções de forma segura
                     try:
                         if result.boxes is not None and hasattr(result.boxes, 'shape') and len(result.boxes.shape) > 0:
@@ -1313,10 +1971,12 @@ class YOLODetector:
                     if n_boxes > 0:
                         self.logger.info(f"✓ {model_name}: {n_boxes} detecções")
                         # Mostrar primeira bbox em coordenadas normalizadas E absolutas
-                        first_box_norm = result.boxes.xyxyn[0].cpu().numpy()
-                        first_box_abs = result.boxes.xyxy[0].cpu().numpy()
-                        first_conf = float(result.boxes.conf[0].cpu().numpy())
-                        self.logger.debug(f"   📐 bbox_norm={first_box_norm}, bbox_abs={first_box_abs}, conf={first_conf:.3f}")
+                        # (só com DEBUG ativo; uma única sincronização GPU→CPU para os três valores)
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            boxes = result.boxes
+                            first = torch.cat([boxes.xyxyn[:1], boxes.xyxy[:1], boxes.conf[:1, None]], dim=1).cpu().numpy()[0]
+                            first_box_norm, first_box_abs, first_conf = first[0:4], first[4:8], float(first[8])
+                            self.logger.debug(f"   📐 bbox_norm={first_box_norm}, bbox_abs={first_box_abs}, conf={first_conf:.3f}")
                 return result
             
             return None
@@ -1325,13 +1985,50 @@ class YOLODetector:
             self.logger.error(f"✗ Erro na detecção {model_name}: {e}")
             return None
     
+    def detect_in_roi_batch(self, roi_crops: List[np.ndarray], model: YOLO, conf: float, iou: float, model_name: str = "Unknown") -> List:
+        """
+        Executa detecção em vários crops ROI com uma única chamada batched ao modelo.
+        
+        Returns:
+            Lista de resultados YOLO (um por crop, None em caso de erro)
+        """
+        if model is None:
+            self.logger.error(f"✗ Modelo {model_name} não está carregado!")
+            return [None] * len(roi_crops)
+        
+        try:
+            with self._mempool_context():
+                results = model.predict(
+                    roi_crops,
+                    imgsz=self.imgsz,
+                    conf=conf,
+                    iou=iou,
+                    max_det=self.max_det,
+                    half=self._half,
+                    batch=len(roi_crops),
+                    verbose=False
+                )
+            return list(results)
+            
+        except Exception as e:
+            self.logger.error(f"✗ Erro na detecção em lote {model_name}: {e}")
+            return [None] * len(roi_crops)
+    
     # Método _improve_symbol_bboxes removido para otimizar performance
     # e evitar erros de "len() of unsized object"
     
-    def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+    def process_frame(self, frame: np.ndarray, draw: bool = True,
+                      reuse_buffer: bool = False) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
         Processa um frame completo: ROI + detecções.
         
+        Args:
+            frame: Frame BGR
+            draw: Se False, não copia nem anota o frame (apenas estatísticas); o frame
+                  devolvido é o próprio frame de entrada e não deve ser modificado
+            reuse_buffer: Anota em um buffer persistente em vez de alocar uma cópia; o frame
+                          devolvido é sobrescrito na próxima chamada e deve ser consumido antes
+        
         Returns:
             Tuple (frame_anotado, estatísticas)
         """
@@ -1339,18 +2036,211 @@ class YOLODetector:
         
         # Extrair ROI
         # Extrair ROI (agora com máscara - código MacBook)
-        roi_crop, roi_bbox, roi_mask, roi_confidence = self.extract_roi_from_segmentation(frame)
+        roi = self.extract_roi_from_segmentation(frame)
+        roi_crop, roi_bbox = roi[0], roi[1]
         
-        annotated_frame = frame.copy()
-        stats = {
-            "smudge": 0,
-            "simbolos": 0,
-            "blackdot": 0,
-            "has_roi": roi_bbox is not None,
-            "roi_confidence": roi_confidence if roi_confidence is not None else 0.0,
-            "transfer_count": self.transfer_count,
-            "inference_time_ms": 0.0
-        }
+        # Executar os três detectores no crop da ROI
+        raw_results = self._detect_all_in_roi(roi_crop) if roi_bbox is not None else {}
+        
+        return self._finish_frame(frame, roi, raw_results, start_time, draw=draw,
+                                  reuse_buffer=reuse_buffer)
+    
+    def process_frames(self, frames: List[np.ndarray], draw: bool = True) -> List[Tuple[np.ndarray, Dict[str, Any]]]:
+        """
+        Processa um lote de frames: ROI por frame e cada detector UMA vez para todos os crops.
+        
+        Os resultados são pós-processados na ordem dos frames, então tracking de transfer,
+        estabilização e estatísticas ficam idênticos ao processamento frame a frame.
+        
+        Returns:
+            Lista de tuplas (frame_anotado, estatísticas), uma por frame
+        """
+        if not frames:
+            return []
+        
+        start_time = time.time()
+        rois = [self.extract_roi_from_segmentation(frame) for frame in frames]
+        
+        # Apenas frames com ROI vão para os detectores
+        roi_indices = [i for i, roi in enumerate(rois) if roi[1] is not None]
+        crops = [rois[i][0] for i in roi_indices]
+        raw_results = [{} for _ in frames]
+        
+        if crops and self.unified_model is not None:
+            conf, iou = self._unified_predict_params()
+            batch_results = self.detect_in_roi_batch(crops, self.unified_model, conf, iou, "Unificado")
+            for i, result in zip(roi_indices, batch_results):
+                raw_results[i] = self._split_unified_result(result)
+        elif crops:
+            for name, model, conf, iou, label in self._detector_specs():
+                if not self.model_enabled[name]:
+                    continue
+                batch_results = self.detect_in_roi_batch(crops, model, conf, iou, label)
+                for i, result in zip(roi_indices, batch_results):
+                    raw_results[i][name] = result
+        
+        # ROI + detecção em lote medidas uma vez e divididas entre os frames; cada frame soma
+        # apenas o próprio pós-processamento (medido a partir do início do seu _finish_frame)
+        shared_ms = (time.time() - start_time) * 1000 / len(frames)
+        return [self._finish_frame(frame, roi, raw, time.time(), shared_ms=shared_ms, draw=draw)
+                for frame, roi, raw in zip(frames, rois, raw_results)]
+    
+    def _draw_boxes(self, frame: np.ndarray, detections: List[Dict], colors):
+        """
+        Desenha as bounding boxes de uma classe (retângulos de espessura 2).
+        
+        Args:
+            frame: Frame anotado (modificado in-place)
+            detections: Detecções com 'bbox' (x1, y1, x2, y2)
+            colors: Cor BGR única (tupla) ou array (N, 3) uint8 com uma cor por detecção
+        """
+        if not detections:
+            return
+        
+        if NUMBA_AVAILABLE and frame.ndim == 3 and frame.dtype == np.uint8:
+            xyxys = np.asarray([d['bbox'] for d in detections], dtype=np.int32).reshape(-1, 4)
+            colors_arr = np.broadcast_to(np.asarray(colors, dtype=np.uint8), (len(detections), 3))
+            _draw_boxes_inplace(frame, xyxys, np.ascontiguousarray(colors_arr))
+            return
+        
+        for i, detection in enumerate(detections):
+            x1, y1, x2, y2 = detection['bbox']
+            color = colors if isinstance(colors, tuple) else tuple(int(c) for c in colors[i])
+            cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
+    
+    def _label_sprite(self, prefix: str, scale: float, color: Tuple[int, int, int], thickness: int):
+        """
+        Retorna (e guarda em cache) o rótulo pré-renderizado: offsets dos pixels, alpha,
+        cor e avanço horizontal até onde o texto seguinte (confiança) começa.
+        """
+        key = (prefix, scale, color, thickness)
+        sprite = self._label_sprites.get(key)
+        if sprite is None:
+            font = cv2.FONT_HERSHEY_SIMPLEX
+            (text_w, text_h), baseline = cv2.getTextSize(prefix, font, scale, thickness)
+            pad = thickness + 2
+            canvas = np.zeros((text_h + baseline + 2 * pad, text_w + 2 * pad), dtype=np.uint8)
+            cv2.putText(canvas, prefix, (pad, pad + text_h), font, scale, 255, thickness)
+            ys, xs = np.nonzero(canvas)
+            # Avanço do prefixo (getTextSize inclui a espessura, que se cancela na diferença)
+            advance = (cv2.getTextSize(prefix + "0.00", font, scale, thickness)[0][0]
+                       - cv2.getTextSize("0.00", font, scale, thickness)[0][0])
+            sprite = ((ys - pad - text_h).astype(np.int32), (xs - pad).astype(np.int32),
+                      canvas[ys, xs].astype(np.int32), np.array(color, dtype=np.int32), advance)
+            self._label_sprites[key] = sprite
+        return sprite
+    
+    def _put_label(self, frame: np.ndarray, prefix: str, confidence: float, org: Tuple[int, int],
+                   scale: float, color: Tuple[int, int, int], thickness: int):
+        """
+        Desenha f"{prefix}{confidence:.2f}": prefixo estático a partir do cache de rótulos
+        e apenas a confiança rasterizada com cv2.putText.
+        """
+        if not (NUMBA_AVAILABLE and frame.ndim == 3 and frame.dtype == np.uint8):
+            cv2.putText(frame, f"{prefix}{confidence:.2f}", org, cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness)
+            return
+        
+        dy, dx, alpha, color_arr, advance = self._label_sprite(prefix, scale, color, thickness)
+        _blit_label_inplace(frame, dy, dx, alpha, int(org[0]), int(org[1]), color_arr)
+        cv2.putText(frame, f"{confidence:.2f}", (org[0] + advance, org[1]),
+                    cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness)
+    
+    def _detector_specs(self):
+        """Retorna (classe, modelo, conf, iou, nome para log) de cada detector com os thresholds atuais."""
+        return (
+            ("smudge", self.smudge_model, self.smudge_conf, self.smudge_iou, "FIFA"),
+            ("simbolos", self.simbolos_model, self.simbolo_conf, self.simbolo_iou, "Símbolos"),
+            ("blackdot", self.blackdot_model, self.blackdot_conf, self.blackdot_iou, "BlackDot"),
+        )
+    
+    def _roi_tensor(self, roi_crop: np.ndarray) -> torch.Tensor:
+        """
+        Converte o crop BGR da ROI em tensor RGB [1, 3, h, w] normalizado (0-1) no device.
+        
+        Redimensiona mantendo a proporção (lado maior = imgsz, lados múltiplos de 32, como a
+        inferência retangular do Ultralytics). O Results usa o próprio tensor como imagem
+        original, então xyxyn continua relativo ao crop.
+        """
+        h, w = roi_crop.shape[:2]
+        scale = self.imgsz / max(h, w)
+        new_h = max(32, int(round(h * scale / 32)) * 32)
+        new_w = max(32, int(round(w * scale / 32)) * 32)
+        
+        t = torch.from_numpy(np.ascontiguousarray(roi_crop)).to(self.device, non_blocking=True)
+        t = t.permute(2, 0, 1).flip(0).unsqueeze(0)  # HWC BGR -> 1CHW RGB
+        t = t.half() if self._half else t.float()
+        t = torch.nn.functional.interpolate(t, size=(new_h, new_w), mode='bilinear', align_corners=False)
+        return t.div_(255.0).clamp_(0.0, 1.0)
+    
+    def _detect_all_in_roi(self, roi_crop: np.ndarray) -> Dict[str, Any]:
+        """Executa os detectores ativados no crop da ROI e retorna os resultados por classe."""
+        source = roi_crop
+        if self.gpu_preprocess and roi_crop is not None and roi_crop.size > 0:
+            # Upload, resize e normalização uma vez para todos os detectores
+            source = self._roi_tensor(roi_crop)
+        
+        if self.unified_model is not None:
+            conf, iou = self._unified_predict_params()
+            return self._split_unified_result(self.detect_in_roi(source, self.unified_model, conf, iou, "Unificado"))
+        
+        raw_results = {}
+        if self._streams is None:
+            for name, model, conf, iou, label in self._detector_specs():
+                if self.model_enabled[name]:
+                    raw_results[name] = self.detect_in_roi(source, model, conf, iou, label)
+            return raw_results
+        
+        # Cada detector no seu stream (após o upload do crop no stream principal)
+        main_stream = torch.cuda.current_stream(self.device)
+        for stream, (name, model, conf, iou, label) in zip(self._streams, self._detector_specs()):
+            if not self.model_enabled[name]:
+                continue
+            stream.wait_stream(main_stream)
+            with torch.cuda.stream(stream):
+                raw_results[name] = self.detect_in_roi(source, model, conf, iou, label)
+        # Junção: o stream principal espera os três antes de consumir as boxes
+        for stream in self._streams:
+            main_stream.wait_stream(stream)
+        return raw_results
+    
+    def _annotation_buffer(self, frame: np.ndarray) -> np.ndarray:
+        """Copia o frame para o buffer de anotação persistente, realocando só se o formato mudar."""
+        if self._annot_buf is None or self._annot_buf.shape != frame.shape or self._annot_buf.dtype != frame.dtype:
+            self._annot_buf = np.empty_like(frame)
+        np.copyto(self._annot_buf, frame)
+        return self._annot_buf
+    
+    def _finish_frame(self, frame: np.ndarray, roi: Tuple, raw_results: Dict[str, Any],
+                      start_time: float, shared_ms: float = 0.0,
+                      draw: bool = True, reuse_buffer: bool = False) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Pós-processamento de um frame: validação, estabilização, filtros, desenho e estatísticas.
+        
+        Args:
+            frame: Frame original
+            roi: Tupla retornada por extract_roi_from_segmentation
+            raw_results: Resultados YOLO por classe (apenas modelos ativados)
+            start_time: Início do processamento do frame (em lote: início do seu pós-processamento)
+            shared_ms: Parcela do frame no tempo do lote (ROI + detecção em lote / N)
+            draw: Se False, pula cópia e desenho (frame de entrada devolvido sem anotações)
+            reuse_buffer: Copia o frame para o buffer persistente de anotação (self._annot_buf)
+            
+        Returns:
+            Tuple (frame_anotado, estatísticas)
+        """
+        roi_crop, roi_bbox, roi_mask, roi_confidence = roi
+        
+        # Copy-on-write: todo desenho acontece apenas com ROI; sem ROI o próprio frame é devolvido
+        if not draw or roi_bbox is None:
+            annotated_frame = frame
+        elif reuse_buffer:
+            annotated_frame = self._annotation_buffer(frame)
+        else:
+            annotated_frame = frame.copy()
+        stats = self._stats_template.copy()
+        stats["has_roi"] = roi_bbox is not None
+        stats["roi_confidence"] = roi_confidence if roi_confidence is not None else 0.0
+        stats["transfer_count"] = self.transfer_count
         
         # Tracking de transfer baseado em ROI
         if roi_bbox is not None:
@@ -1371,21 +2261,22 @@ class YOLODetector:
             smoothed_bbox = self._smooth_bbox(roi_bbox, roi_confidence)
             x, y, w, h = smoothed_bbox
             
-            # Desenhar ROI suavizada
-            cv2.rectangle(annotated_frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
-            
-            # Label do ROI com tamanho e confiança
-            roi_label = f"ROI {w}x{h} (conf:{roi_confidence:.2f})"
-            cv2.putText(annotated_frame, roi_label, (x, y-10), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+            if draw:
+                # Desenhar ROI suavizada
+                cv2.rectangle(annotated_frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
+                
+                # Label do ROI com tamanho e confiança
+                roi_label = f"ROI {w}x{h} (conf:{roi_confidence:.2f})"
+                cv2.putText(annotated_frame, roi_label, (x, y-10), 
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
             
             # Debug: Log ROI a cada 120 frames (otimizado)
-            if self.frame_count % 120 == 0:
+            if self.frame_count % 120 == 0 and self.logger.isEnabledFor(logging.INFO):
                 self.logger.info(f"📦 ROI: pos=({x},{y}), tamanho={w}x{h}, crop_shape={roi_crop.shape}, confiança={roi_confidence:.3f}")
             
             # Detectar smudge com validação e estabilização (apenas se modelo ativado)
             if self.model_enabled["smudge"]:
-                smudge_result = self.detect_in_roi(roi_crop, self.smudge_model, self.smudge_conf, self.smudge_iou, "FIFA")
+                smudge_result = raw_results.get("smudge")
                 
                 # Validar qualidade da detecção FIFA com critérios RIGOROSOS para evitar conflitos
                 if self._validate_fifa_detection(smudge_result, min_confidence=0.7):
@@ -1393,18 +2284,13 @@ class YOLODetector:
                 else:
                     smudge_result = None
                     smudge_count = 0
-                
-                # Aplicar estabilização temporal
-                smudge_count = self._stabilize_detection_count("smudge", smudge_count)
             else:
                 smudge_result = None
                 smudge_count = 0
-            stats["smudge"] = smudge_count
-            self.current_transfer_stats["smudge"].append(smudge_count)
             
             # Detectar símbolos com validação e estabilização (apenas se modelo ativado)
             if self.model_enabled["simbolos"]:
-                simbolos_result = self.detect_in_roi(roi_crop, self.simbolos_model, self.simbolo_conf, self.simbolo_iou, "Símbolos")
+                simbolos_result = raw_results.get("simbolos")
                 
                 # Validar qualidade da detecção
                 if self._validate_detection_quality(simbolos_result, self.min_detection_confidence):
@@ -1412,18 +2298,13 @@ class YOLODetector:
                 else:
                     simbolos_result = None
                     simbolos_count = 0
-                
-                # Aplicar estabilização temporal
-                simbolos_count = self._stabilize_detection_count("simbolos", simbolos_count)
             else:
                 simbolos_result = None
                 simbolos_count = 0
-            stats["simbolos"] = simbolos_count
-            self.current_transfer_stats["simbolos"].append(simbolos_count)
             
             # Detectar blackdot com validação e estabilização (apenas se modelo ativado)
             if self.model_enabled["blackdot"]:
-                blackdot_result = self.detect_in_roi(roi_crop, self.blackdot_model, self.blackdot_conf, self.blackdot_iou, "BlackDot")
+                blackdot_result = raw_results.get("blackdot")
                 
                 # Validar qualidade da detecção
                 if self._validate_detection_quality(blackdot_result, self.min_detection_confidence):
@@ -1431,60 +2312,36 @@ class YOLODetector:
                 else:
                     blackdot_result = None
                     blackdot_count = 0
-                
-                # Aplicar estabilização temporal
-                blackdot_count = self._stabilize_detection_count("blackdot", blackdot_count)
             else:
                 blackdot_result = None
                 blackdot_count = 0
+            
+            # Aplicar estabilização temporal (as três classes em uma chamada)
+            smudge_count, simbolos_count, blackdot_count = self._stabilize_counts(
+                (smudge_count, simbolos_count, blackdot_count),
+                (self.model_enabled["smudge"], self.model_enabled["simbolos"], self.model_enabled["blackdot"])
+            )
+            stats["smudge"] = smudge_count
+            stats["simbolos"] = simbolos_count
             stats["blackdot"] = blackdot_count
-            self.current_transfer_stats["blackdot"].append(blackdot_count)
+            self.current_transfer_stats["smudge"].add(smudge_count)
+            self.current_transfer_stats["simbolos"].add(simbolos_count)
+            self.current_transfer_stats["blackdot"].add(blackdot_count)
             
             # Aplicar filtros de sobreposição entre classes com exclusão mútua
             detections_by_class = {}
             
             # Coletar detecções válidas e filtrar apenas as que estão dentro da ROI
-            # OTIMIZAÇÃO: Converter confianças uma vez em vez de uma por uma
-            if smudge_result and smudge_result.boxes is not None and len(smudge_result.boxes) > 0:
-                detections_by_class["smudge"] = []
-                boxes_coords = self.boxes_from_result_in_frame(smudge_result, x, y, roi_crop.shape, frame.shape, debug=False)
-                # Converter todas as confianças de uma vez (mais eficiente)
-                confidences = smudge_result.boxes.conf.cpu().numpy()
-                for i, coords in enumerate(boxes_coords):
-                    # Verificar se a detecção está dentro da ROI
-                    if self.is_detection_inside_roi(coords, roi_mask, roi_bbox):
-                        detections_by_class["smudge"].append({
-                            'bbox': coords,
-                            'confidence': float(confidences[i])
-                        })
-            
-            if simbolos_result and simbolos_result.boxes is not None and len(simbolos_result.boxes) > 0:
-                detections_by_class["simbolos"] = []
-                boxes_coords = self.boxes_from_result_in_frame(simbolos_result, x, y, roi_crop.shape, frame.shape, debug=False)
-                # Converter todas as confianças e classes de uma vez (mais eficiente)
-                confidences = simbolos_result.boxes.conf.cpu().numpy()
-                class_ids = simbolos_result.boxes.cls.cpu().numpy()
-                for i, coords in enumerate(boxes_coords):
-                    # Verificar se a detecção está dentro da ROI
-                    if self.is_detection_inside_roi(coords, roi_mask, roi_bbox):
-                        detections_by_class["simbolos"].append({
-                            'bbox': coords,
-                            'confidence': float(confidences[i]),
-                            'class_id': int(class_ids[i])  # Preservar class_id para classes OK/NO (FIFA, Simbolo, String)
-                        })
-            
-            if blackdot_result and blackdot_result.boxes is not None and len(blackdot_result.boxes) > 0:
-                detections_by_class["blackdot"] = []
-                boxes_coords = self.boxes_from_result_in_frame(blackdot_result, x, y, roi_crop.shape, frame.shape, debug=False)
-                # Converter todas as confianças de uma vez (mais eficiente)
-                confidences = blackdot_result.boxes.conf.cpu().numpy()
-                for i, coords in enumerate(boxes_coords):
-                    # Verificar se a detecção está dentro da ROI
-                    if self.is_detection_inside_roi(coords, roi_mask, roi_bbox):
-                        detections_by_class["blackdot"].append({
-                            'bbox': coords,
-                            'confidence': float(confidences[i])
-                        })
+            # OTIMIZAÇÃO: conversão, validação e teste de ROI no device; só as sobreviventes vão para a CPU
+            class_results = [
+                (class_name, class_result)
+                for class_name, class_result in (("smudge", smudge_result), ("simbolos", simbolos_result), ("blackdot", blackdot_result))
+                if class_result and class_result.boxes is not None and len(class_result.boxes) > 0
+            ]
+            if class_results:
+                detections_by_class = self._gather_detections(
+                    class_results, x, y, roi_crop.shape, frame.shape, roi_mask, roi_bbox
+                )
             
             # Aplicar filtros de sobreposição entre classes com exclusão mútua
             if detections_by_class:
@@ -1495,7 +2352,8 @@ class YOLODetector:
                 filtered_detections = self._filter_overlapping_detections(filtered_detections)
                 
                 # Log de exclusão mútua a cada 120 frames com detalhes de conflitos
-                if self.frame_count % 120 == 0:
+                # (contagens e dict de classes só montados com INFO ativo)
+                if self.frame_count % 120 == 0 and self.logger.isEnabledFor(logging.INFO):
                     total_before = sum(len(detections) for detections in detections_by_class.values())
                     total_after = sum(len(detections) for detections in filtered_detections.values())
                     if total_before > total_after:
@@ -1514,59 +2372,44 @@ class YOLODetector:
                 stats["blackdot"] = len(filtered_detections.get("blackdot", []))
                 
                 # Atualizar estatísticas do transfer
-                self.current_transfer_stats["smudge"][-1] = stats["smudge"]
-                self.current_transfer_stats["simbolos"][-1] = stats["simbolos"]
-                self.current_transfer_stats["blackdot"][-1] = stats["blackdot"]
+                self.current_transfer_stats["smudge"].replace_last(stats["smudge"])
+                self.current_transfer_stats["simbolos"].replace_last(stats["simbolos"])
+                self.current_transfer_stats["blackdot"].replace_last(stats["blackdot"])
             
             # Desenhar detecções filtradas (já aplicado exclusão mútua acima)
-            if detections_by_class:
+            if draw and detections_by_class:
                 
                 # Desenhar FIFA filtrado
-                for detection in filtered_detections.get("smudge", []):
-                    x1, y1, x2, y2 = detection['bbox']
-                    conf_val = detection['confidence']
-                    cv2.rectangle(annotated_frame, (x1, y1), (x2, y2), (0, 0, 255), 2)
-                    label = f"Smudge {conf_val:.2f}"
-                    cv2.putText(annotated_frame, label, (x1, max(y1-5, 10)),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 0, 255), 1)
+                smudge_detections = filtered_detections.get("smudge", [])
+                self._draw_boxes(annotated_frame, smudge_detections, (0, 0, 255))
+                for detection in smudge_detections:
+                    x1, y1 = detection['bbox'][:2]
+                    self._put_label(annotated_frame, "Smudge ", detection['confidence'], (x1, max(y1-5, 10)),
+                                    0.4, (0, 0, 255), 1)
                 
                 # Desenhar símbolos filtrados com nomes corretos das classes
-                for detection in filtered_detections.get("simbolos", []):
-                    x1, y1, x2, y2 = detection['bbox']
-                    conf_val = detection['confidence']
-                    
-                    # Obter nome da classe usando class_id preservado
-                    class_name = "Símbolo"  # Padrão
-                    class_id = detection.get('class_id', -1)  # Usar class_id preservado
-                    # Classes do modelo best.pt: ['FIFA_NO', 'FIFA_OK', 'Simbolo_NO', 'Simbolo_OK', 'String_NO', 'String_OK'] - 6 classes
-                    class_names = ['FIFA_NO', 'FIFA_OK', 'Simbolo_NO', 'Simbolo_OK', 'String_NO', 'String_OK']
-                    if 0 <= class_id < len(class_names):
-                        class_name = class_names[class_id]
-                    
-                    # Cor baseada no tipo de classe - cores destacadas
-                    # NO: Vermelho destacado (0, 0, 255) em BGR
-                    # OK: Verde destacado (0, 255, 0) em BGR
-                    if 'OK' in class_name:
-                        color = (0, 255, 0)  # Verde destacado para OK (BGR)
-                    else:
-                        color = (0, 0, 255)  # Vermelho destacado para NO (BGR)
-                    
-                    cv2.rectangle(annotated_frame, (x1, y1), (x2, y2), color, 2)
+                simbolos_detections = filtered_detections.get("simbolos", [])
+                # Índice nas tabelas de nome/cor por classe (ids fora do modelo -> "Símbolo", vermelho)
+                class_ids = np.fromiter((d.get('class_id', -1) for d in simbolos_detections),
+                                        dtype=np.int32, count=len(simbolos_detections))
+                class_ids[(class_ids < 0) | (class_ids >= _SIMBOLOS_UNKNOWN_ID)] = _SIMBOLOS_UNKNOWN_ID
+                self._draw_boxes(annotated_frame, simbolos_detections, _SIMBOLOS_COLORS_LUT[class_ids])
+                for detection, class_id in zip(simbolos_detections, class_ids.tolist()):
+                    x1, y1 = detection['bbox'][:2]
+                    color = _SIMBOLOS_CLASS_COLORS[class_id]
                     
                     # Label com nome correto da classe - cores destacadas
-                    label = f"{class_name} {conf_val:.2f}"
                     # Usar espessura maior para destacar (2 em vez de 1)
-                    cv2.putText(annotated_frame, label, (x1, max(y1-5, 10)),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+                    self._put_label(annotated_frame, _SIMBOLOS_LABEL_PREFIXES[class_id], detection['confidence'],
+                                    (x1, max(y1-5, 10)), 0.5, color, 2)
                 
                 # Desenhar String filtrado
-                for detection in filtered_detections.get("blackdot", []):
-                    x1, y1, x2, y2 = detection['bbox']
-                    conf_val = detection['confidence']
-                    cv2.rectangle(annotated_frame, (x1, y1), (x2, y2), (0, 255, 255), 2)
-                    label = f"BlackDot {conf_val:.2f}"
-                    cv2.putText(annotated_frame, label, (x1, max(y1-5, 10)),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 255, 255), 1)
+                blackdot_detections = filtered_detections.get("blackdot", [])
+                self._draw_boxes(annotated_frame, blackdot_detections, (0, 255, 255))
+                for detection in blackdot_detections:
+                    x1, y1 = detection['bbox'][:2]
+                    self._put_label(annotated_frame, "BlackDot ", detection['confidence'], (x1, max(y1-5, 10)),
+                                    0.4, (0, 255, 255), 1)
         else:
             # ROI não detectado
             self.frames_without_roi += 1
@@ -1580,37 +2423,17 @@ class YOLODetector:
                 self.current_transfer_frames = 0
                 self.last_roi_bbox = None
         
-        # Calcular tempo de inferência
-        inference_time = (time.time() - start_time) * 1000
-        stats["inference_time_ms"] = inference_time
+        # Calcular tempo de inferência (em lote: parcela do lote + pós-processamento do frame)
+        inference_time = shared_ms + (time.time() - start_time) * 1000
         
-        # Atualizar média
+        # Atualizar média (EWMA com alpha pré-calculado)
         self.frame_count += 1
-        alpha = 0.1
-        self.avg_inference_time = alpha * inference_time + (1 - alpha) * self.avg_inference_time
+        self.avg_inference_time += self._ewma_alpha * (inference_time - self.avg_inference_time)
         self.last_inference_time = inference_time
         
-        # Adicionar médias ao stats
-        stats["avg_smudge"] = self.transfer_averages["smudge"]
-        stats["avg_simbolos"] = self.transfer_averages["simbolos"]
-        stats["avg_blackdot"] = self.transfer_averages["blackdot"]
-        
-        # Adicionar estatísticas de transfer
-        stats["total_evaluated"] = self.transfer_stats["total_evaluated"]
-        stats["total_approved"] = self.transfer_stats["total_approved"]
-        stats["total_rejected"] = self.transfer_stats["total_rejected"]
-        
-        # Calcular taxa de aprovação
-        total_evaluated = self.transfer_stats["total_evaluated"]
-        if total_evaluated > 0:
-            stats["approval_rate"] = (self.transfer_stats["total_approved"] / total_evaluated) * 100
-        else:
-            stats["approval_rate"] = 0.0
-        
-        # Adicionar estatísticas de classes detectadas médias
-        stats["avg_smudge_detected"] = self.transfer_averages.get("smudge", 0.0) * 100  # Em percentual
-        stats["avg_simbolos_detected"] = self.transfer_averages.get("simbolos", 0.0) * 100  # Em percentual
-        stats["avg_blackdot_detected"] = self.transfer_averages.get("blackdot", 0.0) * 100  # Em percentual
+        # Médias do transfer, estatísticas de transfer e taxa de aprovação (pré-calculadas)
+        stats["inference_time_ms"] = inference_time
+        stats.update(self._transfer_stats_view)
         
         # Calcular classe predominante baseada na média móvel
         predominant_class, predominant_confidence = self._calculate_predominant_class(stats)
@@ -1627,50 +2450,69 @@ class YOLODetector:
             ok_no_stats = self._analyze_ok_no_classes(simbolos_result)
             stats.update(ok_no_stats)
             
-            # Acumular contagens OK/NO por transfer
-            if self.current_transfer_active:
-                self.current_transfer_stats["fifa_ok"].append(ok_no_stats.get("fifa_ok", 0))
-                self.current_transfer_stats["fifa_no"].append(ok_no_stats.get("fifa_no", 0))
-                self.current_transfer_stats["simbolo_ok"].append(ok_no_stats.get("simbolo_ok", 0))
-                self.current_transfer_stats["simbolo_no"].append(ok_no_stats.get("simbolo_no", 0))
-                self.current_transfer_stats["string_ok"].append(ok_no_stats.get("string_ok", 0))
-                self.current_transfer_stats["string_no"].append(ok_no_stats.get("string_no", 0))
-        else:
-            # Se não há detecções, adicionar zeros
-            if self.current_transfer_active:
-                self.current_transfer_stats["fifa_ok"].append(0)
-                self.current_transfer_stats["fifa_no"].append(0)
-                self.current_transfer_stats["simbolo_ok"].append(0)
-                self.current_transfer_stats["simbolo_no"].append(0)
-                self.current_transfer_stats["string_ok"].append(0)
-                self.current_transfer_stats["string_no"].append(0)
+        
+        # Acumular contagens OK/NO por transfer (zeros se não há detecções)
+        if self.current_transfer_active:
+            self._accumulate_ok_no(ok_no_stats)
         
         # Log da classe predominante a cada 60 frames para não poluir
-        if self.frame_count % 60 == 0 and predominant_class != "Nenhuma":
+        if (self.frame_count % 60 == 0 and predominant_class != "Nenhuma"
+                and self.logger.isEnabledFor(logging.INFO)):
             self.logger.info(f"🎯 Classe Predominante: {predominant_class} (confiança: {predominant_confidence:.2f})")
         
         return annotated_frame, stats
     
+    def _refresh_transfer_stats_view(self):
+        """Recalcula os campos de transfer copiados para as estatísticas de cada frame."""
+        averages = self.transfer_averages
+        avg_smudge = averages["smudge"]
+        avg_simbolos = averages["simbolos"]
+        avg_blackdot = averages["blackdot"]
+        transfer_stats = self.transfer_stats
+        total_evaluated = transfer_stats["total_evaluated"]
+        total_approved = transfer_stats["total_approved"]
+        self._transfer_stats_view = {
+            "avg_smudge": avg_smudge,
+            "avg_simbolos": avg_simbolos,
+            "avg_blackdot": avg_blackdot,
+            "total_evaluated": total_evaluated,
+            "total_approved": total_approved,
+            "total_rejected": transfer_stats["total_rejected"],
+            "approval_rate": (total_approved / total_evaluated) * 100 if total_evaluated > 0 else 0.0,
+            # Classes detectadas médias (em percentual)
+            "avg_smudge_detected": avg_smudge * 100,
+            "avg_simbolos_detected": avg_simbolos * 100,
+            "avg_blackdot_detected": avg_blackdot * 100
+        }
+    
+    def _accumulate_ok_no(self, ok_no_stats: Dict[str, int]):
+        """Acumula as contagens OK/NO de um frame no transfer atual."""
+        stats = self.current_transfer_stats
+        for group in ("fifa", "simbolo", "string"):
+            ok = ok_no_stats.get(f"{group}_ok", 0)
+            no = ok_no_stats.get(f"{group}_no", 0)
+            stats[f"{group}_ok"].add(ok)
+            stats[f"{group}_no"].add(no)
+            stats[group].add(ok + no)
+    
     def _finalize_transfer(self):
         """Finaliza um transfer e calcula médias e status de aprovação."""
         # Calcular médias e totais
+        # (acumuladores mantidos frame a frame: custo constante por transfer)
         for key in ["smudge", "simbolos", "blackdot"]:
-            if len(self.current_transfer_stats[key]) > 0:
-                self.transfer_averages[key] = np.mean(self.current_transfer_stats[key])
-            else:
-                self.transfer_averages[key] = 0.0
+            self.transfer_averages[key] = self.current_transfer_stats[key].mean
         
         # Calcular totais de objetos detectados por classe
-        smudge_total = sum(self.current_transfer_stats["smudge"]) if self.current_transfer_stats["smudge"] else 0
-        blackdot_total = sum(self.current_transfer_stats["blackdot"]) if self.current_transfer_stats["blackdot"] else 0
+        smudge_total = self.current_transfer_stats["smudge"].total
+        blackdot_total = self.current_transfer_stats["blackdot"].total
         
         # Calcular totais de OK/NO
-        fifa_ok_total = sum(self.current_transfer_stats["fifa_ok"]) if self.current_transfer_stats["fifa_ok"] else 0
-        fifa_no_total = sum(self.current_transfer_stats["fifa_no"]) if self.current_transfer_stats["fifa_no"] else 0
-        simbolo_ok_total = sum(self.current_transfer_stats["simbolo_ok"]) if self.current_transfer_stats["simbolo_ok"] else 0
-        simbolo_no_total = sum(self.current_transfer_stats["simbolo_no"]) if self.current_transfer_stats["simbolo_no"] else 0
-        string_ok_total = sum(self.current_transfer_stats["string_ok"]) if self.current_transfer_stats["string_ok"] else 0
-        string_no_total = sum(self.current_transfer_stats["string_no"]) if self.current_transfer_stats["string_no"] else 0
+        fifa_ok_total = self.current_transfer_stats["fifa_ok"].total
+        fifa_no_total = self.current_transfer_stats["fifa_no"].total
+        simbolo_ok_total = self.current_transfer_stats["simbolo_ok"].total
+        simbolo_no_total = self.current_transfer_stats["simbolo_no"].total
+        string_ok_total = self.current_transfer_stats["string_ok"].total
+        string_no_total = self.current_transfer_stats["string_no"].total
         
         # Totais para FIFA, Simbolo e String
         fifa_total = fifa_ok_total + fifa_no_total
@@ -1678,11 +2520,11 @@ class YOLODetector:
         string_total = string_ok_total + string_no_total
         
         # Calcular frames com detecção (pelo menos 1 objeto detectado)
-        smudge_frames = sum(1 for count in self.current_transfer_stats["smudge"] if count > 0)
-        blackdot_frames = sum(1 for count in self.current_transfer_stats["blackdot"] if count > 0)
-        fifa_frames = sum(1 for ok, no in zip(self.current_transfer_stats["fifa_ok"], self.current_transfer_stats["fifa_no"]) if ok > 0 or no > 0)
-        simbolo_frames = sum(1 for ok, no in zip(self.current_transfer_stats["simbolo_ok"], self.current_transfer_stats["simbolo_no"]) if ok > 0 or no > 0)
-        string_frames = sum(1 for ok, no in zip(self.current_transfer_stats["string_ok"], self.current_transfer_stats["string_no"]) if ok > 0 or no > 0)
+        smudge_frames = self.current_transfer_stats["smudge"].nonzero
+        blackdot_frames = self.current_transfer_stats["blackdot"].nonzero
+        fifa_frames = self.current_transfer_stats["fifa"].nonzero
+        simbolo_frames = self.current_transfer_stats["simbolo"].nonzero
+        string_frames = self.current_transfer_stats["string"].nonzero
         
         # Informações do transfer finalizado
         transfer_duration = self.current_transfer_frames
@@ -1712,6 +2554,7 @@ class YOLODetector:
         else:
             self.transfer_stats["total_rejected"] += 1
             status = "REPROVADO"
+        self._refresh_transfer_stats_view()
         
         # Adicionar ao histórico com informações detalhadas de objetos detectados
         transfer_record = {
@@ -1763,13 +2606,13 @@ class YOLODetector:
         }
         
         # Limpar estatísticas do transfer atual
-        for key in self.current_transfer_stats:
-            self.current_transfer_stats[key] = []
-        self.transfer_stats["transfer_history"].append(transfer_record)
-        
-        # Manter apenas os últimos 100 transfers no histórico
-        if len(self.transfer_stats["transfer_history"]) > 100:
-            self.transfer_stats["transfer_history"].pop(0)
+        for series in self.current_transfer_stats.values():
+            series.reset()
+        self._record_transfer(transfer_record, (
+            self.transfer_count, blackdot_total, smudge_total,
+            fifa_ok_total, fifa_no_total, simbolo_ok_total, simbolo_no_total,
+            string_ok_total, string_no_total
+        ))
         
         # Log detalhado com razões de reprovação
         rejection_details = []
@@ -1838,6 +2681,56 @@ class YOLODetector:
             "blackdot_detection_rate": (blackdot_detected / total_transfers) * 100
         }
     
+    def _record_transfer(self, transfer_record: dict, row: tuple):
+        """
+        Adiciona um transfer ao histórico (deque(maxlen=transfer_history_size)) e atualiza os
+        totais por classe a partir da linha compacta do transfer, descontando a linha mais
+        antiga quando ela sai da janela.
+        """
+        history = self.transfer_stats["transfer_history"]
+        if len(self._transfer_rows) == self._transfer_rows.maxlen:
+            self._accumulate_class_totals(self._transfer_rows[0], -1)
+        history.append(transfer_record)
+        self._transfer_rows.append(row)
+        self._accumulate_class_totals(row, 1)
+        
+        if self.transfer_history_file:
+            self._append_transfer_ndjson(transfer_record)
+    
+    def _append_transfer_ndjson(self, transfer_record: dict):
+        """Acrescenta o transfer finalizado como uma linha JSON em transfer_history_file."""
+        try:
+            path = Path(self.transfer_history_file)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if ORJSON_AVAILABLE:
+                line = orjson.dumps(transfer_record, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+            else:
+                line = (json.dumps(transfer_record, ensure_ascii=False) + "\n").encode('utf-8')
+            with open(path, 'ab') as f:
+                f.write(line)
+        except Exception as e:
+            self.logger.warning(f"Erro ao gravar histórico de transfers: {e}")
+    
+    def _accumulate_class_totals(self, row: tuple, sign: int):
+        """Soma (sign=1) ou desconta (sign=-1) a linha de um transfer nos totais por classe."""
+        _, blackdot, smudge, fifa_ok, fifa_no, simbolo_ok, simbolo_no, string_ok, string_no = row
+        class_totals = self._class_totals
+        for class_name, transfer_total in (("blackdot", blackdot), ("smudge", smudge)):
+            totals = class_totals[class_name]
+            totals["total_objects"] += sign * transfer_total
+            if transfer_total > 0:
+                totals["count"] += sign
+        for class_name, ok, no in (("fifa", fifa_ok, fifa_no),
+                                   ("simbolo", simbolo_ok, simbolo_no),
+                                   ("string", string_ok, string_no)):
+            totals = class_totals[class_name]
+            transfer_total = ok + no
+            totals["total_objects"] += sign * transfer_total
+            if transfer_total > 0:
+                totals["count"] += sign
+            totals["ok"] += sign * ok
+            totals["no"] += sign * no
+    
     def get_final_statistics_summary(self) -> dict:
         """
         Gera sumário final de estatísticas de todos os transfers avaliados.
@@ -1861,159 +2754,30 @@ class YOLODetector:
                 "objects_per_transfer": []
             }
         
-        # Contabilizar totais por classe
-        blackdot_total = 0
-        smudge_total = 0
-        fifa_total = 0
-        fifa_ok_total = 0
-        fifa_no_total = 0
-        simbolo_total = 0
-        simbolo_ok_total = 0
-        simbolo_no_total = 0
-        string_total = 0
-        string_ok_total = 0
-        string_no_total = 0
-        
-        # Contabilizar quantos transfers tiveram cada classe
-        blackdot_count = 0
-        smudge_count = 0
-        fifa_count = 0
-        simbolo_count = 0
-        string_count = 0
-        
-        # Lista de objetos por transfer
-        objects_per_transfer = []
-        
-        # Processar cada transfer no histórico
-        for transfer in transfer_history:
-            objects_detected = transfer.get("objects_detected", {})
-            
-            # Blackdot
-            blackdot_obj = objects_detected.get("blackdot", {})
-            blackdot_transfer_total = blackdot_obj.get("total", 0)
-            blackdot_total += blackdot_transfer_total
-            if blackdot_transfer_total > 0:
-                blackdot_count += 1
-            
-            # Smudge
-            smudge_obj = objects_detected.get("smudge", {})
-            smudge_transfer_total = smudge_obj.get("total", 0)
-            smudge_total += smudge_transfer_total
-            if smudge_transfer_total > 0:
-                smudge_count += 1
-            
-            # FIFA
-            fifa_obj = objects_detected.get("fifa", {})
-            fifa_transfer_total = fifa_obj.get("total", 0)
-            fifa_transfer_ok = fifa_obj.get("ok", 0)
-            fifa_transfer_no = fifa_obj.get("no", 0)
-            fifa_total += fifa_transfer_total
-            fifa_ok_total += fifa_transfer_ok
-            fifa_no_total += fifa_transfer_no
-            if fifa_transfer_total > 0:
-                fifa_count += 1
-            
-            # Simbolo
-            simbolo_obj = objects_detected.get("simbolo", {})
-            simbolo_transfer_total = simbolo_obj.get("total", 0)
-            simbolo_transfer_ok = simbolo_obj.get("ok", 0)
-            simbolo_transfer_no = simbolo_obj.get("no", 0)
-            simbolo_total += simbolo_transfer_total
-            simbolo_ok_total += simbolo_transfer_ok
-            simbolo_no_total += simbolo_transfer_no
-            if simbolo_transfer_total > 0:
-                simbolo_count += 1
-            
-            # String
-            string_obj = objects_detected.get("string", {})
-            string_transfer_total = string_obj.get("total", 0)
-            string_transfer_ok = string_obj.get("ok", 0)
-            string_transfer_no = string_obj.get("no", 0)
-            string_total += string_transfer_total
-            string_ok_total += string_transfer_ok
-            string_no_total += string_transfer_no
-            if string_transfer_total > 0:
-                string_count += 1
-            
-            # Adicionar à lista de objetos por transfer
-            objects_per_transfer.append({
-                "transfer_id": transfer.get("transfer_id", 0),
-                "blackdot": blackdot_transfer_total,
-                "smudge": smudge_transfer_total,
-                "fifa": {
-                    "ok": fifa_transfer_ok,
-                    "no": fifa_transfer_no
-                },
-                "simbolo": {
-                    "ok": simbolo_transfer_ok,
-                    "no": simbolo_transfer_no
-                },
-                "string": {
-                    "ok": string_transfer_ok,
-                    "no": string_transfer_no
-                }
-            })
-        
-        # Construir sumário por classe
-        transfers_by_class = {
-            "blackdot": {
-                "count": blackdot_count,
-                "total_objects": blackdot_total
-            },
-            "smudge": {
-                "count": smudge_count,
-                "total_objects": smudge_total
-            },
-            "fifa": {
-                "count": fifa_count,
-                "total_objects": fifa_total,
-                "ok": fifa_ok_total,
-                "no": fifa_no_total
-            },
-            "simbolo": {
-                "count": simbolo_count,
-                "total_objects": simbolo_total,
-                "ok": simbolo_ok_total,
-                "no": simbolo_no_total
-            },
-            "string": {
-                "count": string_count,
-                "total_objects": string_total,
-                "ok": string_ok_total,
-                "no": string_no_total
-            }
-        }
+        # Totais por classe mantidos incrementalmente por _record_transfer
+        transfers_by_class = {class_name: dict(totals) for class_name, totals in self._class_totals.items()}
+        fifa_no_total = transfers_by_class["fifa"]["no"]
+        simbolo_no_total = transfers_by_class["simbolo"]["no"]
+        string_no_total = transfers_by_class["string"]["no"]
+        smudge_total = transfers_by_class["smudge"]["total_objects"]
+        blackdot_total = transfers_by_class["blackdot"]["total_objects"]
         
         # Determinar erro mais frequente
-        # Erros são classes NO (FIFA_NO, Simbolo_NO, String_NO) ou classes sem OK/NO quando detectadas (smudge, blackdot)
-        error_counts = {
-            "fifa_no": fifa_no_total,
-            "simbolo_no": simbolo_no_total,
-            "string_no": string_no_total,
-            "smudge": smudge_total,  # Smudge sempre é considerado erro se detectado
-            "blackdot": blackdot_total  # Blackdot sempre é considerado erro se detectado
-        }
+        # Erros são classes NO (FIFA_NO, Simbolo_NO, String_NO) ou classes sem OK/NO quando detectadas
+        # (smudge e blackdot sempre são considerados erro se detectados); ordem fixa de _ERROR_KEYS
+        error_counts = (fifa_no_total, simbolo_no_total, string_no_total, smudge_total, blackdot_total)
         
-        # Encontrar o erro mais frequente
-        most_frequent_error_class = max(error_counts, key=error_counts.get)
-        most_frequent_error_count = error_counts[most_frequent_error_class]
+        # Encontrar o erro mais frequente (primeiro máximo, como max() sobre o dict)
+        most_frequent_error_count = max(error_counts)
+        error_index = error_counts.index(most_frequent_error_count)
         
         # Calcular percentual
-        total_errors = sum(error_counts.values())
+        total_errors = sum(error_counts)
         most_frequent_error_percentage = (most_frequent_error_count / total_errors * 100) if total_errors > 0 else 0.0
         
-        # Mapear nome da classe para exibição
-        class_name_map = {
-            "fifa_no": "FIFA",
-            "simbolo_no": "Simbolo",
-            "string_no": "String",
-            "smudge": "Smudge",
-            "blackdot": "BlackDot"
-        }
-        
         most_frequent_error = {
-            "class": class_name_map.get(most_frequent_error_class, most_frequent_error_class),
-            "type": "NO" if "_no" in most_frequent_error_class else "Erro",
+            "class": _ERROR_CLASS_NAMES[error_index],
+            "type": _ERROR_TYPES[error_index],
             "count": most_frequent_error_count,
             "percentage": most_frequent_error_percentage
         }
@@ -2022,7 +2786,18 @@ class YOLODetector:
             "total_transfers_evaluated": total_transfers,
             "transfers_by_class": transfers_by_class,
             "most_frequent_error": most_frequent_error,
-            "objects_per_transfer": objects_per_transfer
+            "objects_per_transfer": [
+                {
+                    "transfer_id": transfer_id,
+                    "blackdot": blackdot,
+                    "smudge": smudge,
+                    "fifa": {"ok": fifa_ok, "no": fifa_no},
+                    "simbolo": {"ok": simbolo_ok, "no": simbolo_no},
+                    "string": {"ok": string_ok, "no": string_no}
+                }
+                for (transfer_id, blackdot, smudge, fifa_ok, fifa_no,
+                     simbolo_ok, simbolo_no, string_ok, string_no) in self._transfer_rows
+            ]
         }
     
     def export_statistics_to_file(self, output_dir: str = "logs") -> Optional[str]:
@@ -2036,10 +2811,6 @@ class YOLODetector:
             Caminho do arquivo criado ou None em caso de erro
         """
         try:
-            from pathlib import Path
-            import json
-            from datetime import datetime
-            
             # Criar diretório se não existir
             output_path = Path(output_dir)
             output_path.mkdir(exist_ok=True)
@@ -2061,17 +2832,28 @@ class YOLODetector:
                     "total_rejected": self.transfer_stats["total_rejected"],
                     "approval_rate": (self.transfer_stats["total_approved"] / self.transfer_stats["total_evaluated"] * 100) if self.transfer_stats["total_evaluated"] > 0 else 0.0
                 },
-                "summary": summary,
-                "transfer_history": self.transfer_stats["transfer_history"]
+                "summary": summary
             }
+            # Histórico completo em NDJSON (gravado a cada transfer): só referenciar o arquivo;
+            # senão embutir os últimos transfer_history_size transfers
+            if self.transfer_history_file:
+                full_stats["transfer_history_file"] = str(self.transfer_history_file)
+            else:
+                full_stats["transfer_history"] = list(self.transfer_stats["transfer_history"])
             
             # Nome do arquivo fixo (sobrescrever a cada processamento)
             filename = "statistics.json"
             filepath = output_path / filename
             
-            # Salvar arquivo JSON
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(full_stats, f, indent=2, ensure_ascii=False)
+            # Salvar arquivo JSON (orjson quando disponível: UTF-8 direto e escalares NumPy nativos)
+            if ORJSON_AVAILABLE:
+                filepath.write_bytes(orjson.dumps(
+                    full_stats,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+            else:
+                # Codificar uma vez e gravar em uma única escrita (json.dump faz muitas escritas pequenas)
+                filepath.write_bytes(json.dumps(full_stats, indent=2, ensure_ascii=False).encode('utf-8'))
             
             self.logger.info(f"✓ Estatísticas exportadas para: {filepath}")
             return str(filepath)
@@ -2084,9 +2866,9 @@ class YOLODetector:
         """Ativa/desativa um modelo específico."""
         if model_name in self.model_enabled:
             self.model_enabled[model_name] = enabled
-            self.logger.info(f"Modelo {model_name}: {'ATIVADO' if enabled else 'DESATIVADO'}")
+            self.logger.info("Modelo %s: %s", model_name, "ATIVADO" if enabled else "DESATIVADO")
         else:
-            self.logger.warning(f"Modelo {model_name} não encontrado")
+            self.logger.warning("Modelo %s não encontrado", model_name)
     
     def get_model_status(self) -> dict:
         """Retorna status de ativação dos modelos."""
@@ -2115,56 +2897,46 @@ class YOLODetector:
         Returns:
             Tuple (resultado_estabilizado, count_estabilizado)
         """
-        try:
-            # Adicionar detecção atual ao histórico
-            self.smudge_history.append({
-                'result': smudge_result,
-                'count': smudge_count,
-                'frame': self.frame_count
-            })
-            
-            # Manter apenas os últimos N frames
-            max_history = 10
-            if len(self.smudge_history) > max_history:
-                self.smudge_history = self.smudge_history[-max_history:]
-            
-            # Se não há detecções suficientes para estabilizar
-            if len(self.smudge_history) < self.smudge_stability_threshold:
-                return smudge_result, smudge_count
-            
-            # Analisar padrão de detecções recentes
-            recent_detections = self.smudge_history[-self.smudge_stability_threshold:]
-            detection_counts = [d['count'] for d in recent_detections]
-            
-            # Calcular estabilidade
-            avg_count = sum(detection_counts) / len(detection_counts)
-            variance = sum((c - avg_count) ** 2 for c in detection_counts) / len(detection_counts)
-            
-            # Se a variância é baixa (detecções estáveis)
-            if variance < 0.5:  # Threshold de estabilidade
-                # Usar detecção mais recente se há consenso
-                if avg_count > 0.5:  # Maioria dos frames tem detecção
-                    # Retornar a detecção mais recente com confiança
-                    latest_detection = recent_detections[-1]
-                    self.smudge_stable_detection = latest_detection['result']
-                    return latest_detection['result'], int(avg_count + 0.5)
-                else:
-                    # Consenso de não detecção
-                    self.smudge_stable_detection = None
-                    return None, 0
+        # Adicionar detecção atual ao histórico
+        self.smudge_history.append({
+            'result': smudge_result,
+            'count': smudge_count,
+            'frame': self.frame_count
+        })
+        # (deque com maxlen mantém apenas os últimos N frames)
+        
+        # Se não há detecções suficientes para estabilizar
+        if len(self.smudge_history) < self.smudge_stability_threshold:
+            return smudge_result, smudge_count
+        
+        # Analisar padrão de detecções recentes
+        history = self.smudge_history
+        recent_detections = list(islice(history, max(0, len(history) - self.smudge_stability_threshold), None))
+        
+        # Calcular estabilidade (média e variância em uma passada)
+        avg_count, variance = _count_mean_variance(recent_detections)
+        
+        # Se a variância é baixa (detecções estáveis)
+        if variance < 0.5:  # Threshold de estabilidade
+            # Usar detecção mais recente se há consenso
+            if avg_count > 0.5:  # Maioria dos frames tem detecção
+                # Retornar a detecção mais recente com confiança
+                latest_detection = recent_detections[-1]
+                self.smudge_stable_detection = latest_detection['result']
+                return latest_detection['result'], int(avg_count + 0.5)
             else:
-                # Detecções instáveis - manter detecção estável anterior
-                if self.smudge_stable_detection is not None:
-                    # Verificar se a detecção estável ainda é válida
-                    stable_age = self.frame_count - (self.smudge_history[-1]['frame'] if self.smudge_history else 0)
-                    if stable_age < 5:  # Detecção estável ainda recente
-                        return self.smudge_stable_detection, 1
-                
-                # Se não há detecção estável ou é muito antiga, usar atual
-                return smudge_result, smudge_count
-                
-        except Exception as e:
-            self.logger.warning(f"Erro na estabilização de smudge: {e}")
+                # Consenso de não detecção
+                self.smudge_stable_detection = None
+                return None, 0
+        else:
+            # Detecções instáveis - manter detecção estável anterior
+            if self.smudge_stable_detection is not None:
+                # Verificar se a detecção estável ainda é válida
+                stable_age = self.frame_count - (self.smudge_history[-1]['frame'] if self.smudge_history else 0)
+                if stable_age < 5:  # Detecção estável ainda recente
+                    return self.smudge_stable_detection, 1
+            
+            # Se não há detecção estável ou é muito antiga, usar atual
             return smudge_result, smudge_count
     
     def _stabilize_symbols_detection(self, symbols_result, symbols_count):
@@ -2178,126 +2950,104 @@ class YOLODetector:
         Returns:
             Tuple (resultado_estabilizado, count_estabilizado)
         """
-        try:
-            # Adicionar detecção atual ao histórico
-            self.symbols_history.append({
-                'result': symbols_result,
-                'count': symbols_count,
-                'frame': self.frame_count
-            })
-            
-            # Manter apenas os últimos N frames
-            max_history = 10
-            if len(self.symbols_history) > max_history:
-                self.symbols_history = self.symbols_history[-max_history:]
-            
-            # Se não há detecções suficientes para estabilizar
-            if len(self.symbols_history) < self.symbols_stability_threshold:
-                return symbols_result, symbols_count
-            
-            # Analisar padrão de detecções recentes
-            recent_detections = self.symbols_history[-self.symbols_stability_threshold:]
-            detection_counts = [d['count'] for d in recent_detections]
-            
-            # Calcular estabilidade
-            avg_count = sum(detection_counts) / len(detection_counts)
-            variance = sum((c - avg_count) ** 2 for c in detection_counts) / len(detection_counts)
-            
-            # Se a variância é baixa (detecções estáveis)
-            if variance < 0.5:  # Threshold de estabilidade
-                # Usar detecção mais recente se há consenso
-                if avg_count > 0.5:  # Maioria dos frames tem detecção
-                    # Retornar a detecção mais recente com confiança
-                    latest_detection = recent_detections[-1]
-                    self.symbols_stable_detection = latest_detection['result']
-                    return latest_detection['result'], int(avg_count + 0.5)
-                else:
-                    # Consenso de não detecção
-                    self.symbols_stable_detection = None
-                    return None, 0
+        # Adicionar detecção atual ao histórico
+        self.symbols_history.append({
+            'result': symbols_result,
+            'count': symbols_count,
+            'frame': self.frame_count
+        })
+        # (deque com maxlen mantém apenas os últimos N frames)
+        
+        # Se não há detecções suficientes para estabilizar
+        if len(self.symbols_history) < self.symbols_stability_threshold:
+            return symbols_result, symbols_count
+        
+        # Analisar padrão de detecções recentes
+        history = self.symbols_history
+        recent_detections = list(islice(history, max(0, len(history) - self.symbols_stability_threshold), None))
+        
+        # Calcular estabilidade (média e variância em uma passada)
+        avg_count, variance = _count_mean_variance(recent_detections)
+        
+        # Se a variância é baixa (detecções estáveis)
+        if variance < 0.5:  # Threshold de estabilidade
+            # Usar detecção mais recente se há consenso
+            if avg_count > 0.5:  # Maioria dos frames tem detecção
+                # Retornar a detecção mais recente com confiança
+                latest_detection = recent_detections[-1]
+                self.symbols_stable_detection = latest_detection['result']
+                return latest_detection['result'], int(avg_count + 0.5)
             else:
-                # Detecções instáveis - manter detecção estável anterior
-                if self.symbols_stable_detection is not None:
-                    # Verificar se a detecção estável ainda é válida
-                    stable_age = self.frame_count - (self.symbols_history[-1]['frame'] if self.symbols_history else 0)
-                    if stable_age < 5:  # Detecção estável ainda recente
-                        return self.symbols_stable_detection, 1
-                
-                # Se não há detecção estável ou é muito antiga, usar atual
-                return symbols_result, symbols_count
-                
-        except Exception as e:
-            self.logger.warning(f"Erro na estabilização de símbolos: {e}")
+                # Consenso de não detecção
+                self.symbols_stable_detection = None
+                return None, 0
+        else:
+            # Detecções instáveis - manter detecção estável anterior
+            if self.symbols_stable_detection is not None:
+                # Verificar se a detecção estável ainda é válida
+                stable_age = self.frame_count - (self.symbols_history[-1]['frame'] if self.symbols_history else 0)
+                if stable_age < 5:  # Detecção estável ainda recente
+                    return self.symbols_stable_detection, 1
+            
+            # Se não há detecção estável ou é muito antiga, usar atual
             return symbols_result, symbols_count
     
-    def _stabilize_class_detection(self, result, class_name, history_key):
+    def _stabilize_class_detection(self, result, key):
         """
         Estabiliza detecções de classes específicas (FIFA, String).
         
         Args:
             result: Resultado da detecção atual
-            class_name: Nome da classe (FIFA, String)
-            history_key: Chave do histórico (fifa_history, string_history)
+            key: Classe em self._class_stab ('fifa' ou 'string')
             
         Returns:
             Tuple (resultado_estabilizado, count_estabilizado)
         """
-        try:
-            history = getattr(self, history_key)
-            stable_detection_key = f"{class_name.lower()}_stable_detection"
-            stable_detection = getattr(self, stable_detection_key)
-            
-            # Adicionar detecção atual ao histórico
-            history.append({
-                'result': result,
-                'count': len(result.boxes) if result and result.boxes is not None else 0,
-                'frame': self.frame_count
-            })
-            
-            # Manter apenas os últimos N frames
-            max_history = 8
-            if len(history) > max_history:
-                history = history[-max_history:]
-                setattr(self, history_key, history)
-            
-            # Se não há detecções suficientes para estabilizar
-            if len(history) < 3:
-                return result, len(result.boxes) if result and result.boxes is not None else 0
-            
-            # Analisar padrão de detecções recentes
-            recent_detections = history[-3:]
-            detection_counts = [d['count'] for d in recent_detections]
-            
-            # Calcular estabilidade
-            avg_count = sum(detection_counts) / len(detection_counts)
-            variance = sum((c - avg_count) ** 2 for c in detection_counts) / len(detection_counts)
-            
-            # Se a variância é baixa (detecções estáveis)
-            if variance < 0.3:  # Threshold mais rigoroso para classes específicas
-                # Usar detecção mais recente se há consenso
-                if avg_count > 0.3:  # Maioria dos frames tem detecção
-                    # Retornar a detecção mais recente com confiança
-                    latest_detection = recent_detections[-1]
-                    setattr(self, stable_detection_key, latest_detection['result'])
-                    return latest_detection['result'], int(avg_count + 0.5)
-                else:
-                    # Consenso de não detecção
-                    setattr(self, stable_detection_key, None)
-                    return None, 0
+        state = self._class_stab[key]
+        history = state['history']
+        stable_detection = state['stable']
+        count = len(result.boxes) if result and result.boxes is not None else 0
+        
+        # Adicionar detecção atual ao histórico
+        history.append({
+            'result': result,
+            'count': count,
+            'frame': self.frame_count
+        })
+        # (deque com maxlen mantém apenas os últimos N frames)
+        
+        # Se não há detecções suficientes para estabilizar
+        if len(history) < 3:
+            return result, count
+        
+        # Analisar padrão de detecções recentes
+        recent_detections = list(islice(history, max(0, len(history) - 3), None))
+        
+        # Calcular estabilidade (média e variância em uma passada)
+        avg_count, variance = _count_mean_variance(recent_detections)
+        
+        # Se a variância é baixa (detecções estáveis)
+        if variance < 0.3:  # Threshold mais rigoroso para classes específicas
+            # Usar detecção mais recente se há consenso
+            if avg_count > 0.3:  # Maioria dos frames tem detecção
+                # Retornar a detecção mais recente com confiança
+                latest_detection = recent_detections[-1]
+                state['stable'] = latest_detection['result']
+                return latest_detection['result'], int(avg_count + 0.5)
             else:
-                # Detecções instáveis - manter detecção estável anterior
-                if stable_detection is not None:
-                    # Verificar se a detecção estável ainda é válida
-                    stable_age = self.frame_count - (history[-1]['frame'] if history else 0)
-                    if stable_age < 3:  # Detecção estável ainda recente
-                        return stable_detection, 1
-                
-                # Se não há detecção estável ou é muito antiga, usar atual
-                return result, len(result.boxes) if result and result.boxes is not None else 0
-                
-        except Exception as e:
-            self.logger.warning(f"Erro na estabilização de {class_name}: {e}")
-            return result, len(result.boxes) if result and result.boxes is not None else 0
+                # Consenso de não detecção
+                state['stable'] = None
+                return None, 0
+        else:
+            # Detecções instáveis - manter detecção estável anterior
+            if stable_detection is not None:
+                # Verificar se a detecção estável ainda é válida
+                stable_age = self.frame_count - (history[-1]['frame'] if history else 0)
+                if stable_age < 3:  # Detecção estável ainda recente
+                    return stable_detection, 1
+            
+            # Se não há detecção estável ou é muito antiga, usar atual
+            return result, count
     
     def _calculate_predominant_class(self, stats: dict) -> tuple:
         """
@@ -2309,67 +3059,34 @@ class YOLODetector:
         Returns:
             Tuple (classe_predominante, confiança)
         """
-        try:
-            # Adicionar estatísticas do frame atual ao histórico
-            frame_data = {
-                'smudge': stats.get('smudge', 0),
-                'simbolos': stats.get('simbolos', 0),
-                'blackdot': stats.get('blackdot', 0),
-                'frame': self.frame_count
-            }
-            
-            self.class_history.append(frame_data)
-            
-            # Manter apenas os últimos N frames
-            if len(self.class_history) > self.moving_average_window:
-                self.class_history = self.class_history[-self.moving_average_window:]
-            
-            # Se não há histórico suficiente, retornar classe atual
-            if len(self.class_history) < 3:
-                return self._get_current_dominant_class(stats)
-            
-            # Calcular médias móveis para cada classe
-            smudge_avg = sum(f['smudge'] for f in self.class_history) / len(self.class_history)
-            simbolos_avg = sum(f['simbolos'] for f in self.class_history) / len(self.class_history)
-            blackdot_avg = sum(f['blackdot'] for f in self.class_history) / len(self.class_history)
-            
-            # Determinar classe predominante baseada nas médias móveis
-            class_scores = {
-                'Smudge': smudge_avg,
-                'Símbolo': simbolos_avg,
-                'BlackDot': blackdot_avg
-            }
-            
-            # Encontrar a classe com maior média móvel
-            predominant_class = max(class_scores, key=class_scores.get)
-            max_score = class_scores[predominant_class]
-            
-            # Se nenhuma classe tem detecção significativa, retornar "Nenhuma"
-            if max_score < 0.1:  # Threshold mínimo para considerar uma classe predominante
-                return "Nenhuma", 0.0
-            
-            # Calcular confiança baseada na estabilidade da detecção
-            # Confiança aumenta com a consistência da detecção ao longo dos frames
-            recent_frames = self.class_history[-5:] if len(self.class_history) >= 5 else self.class_history
-            
-            # Contar quantos frames recentes têm a classe predominante detectada
-            predominant_detections = 0
-            for frame in recent_frames:
-                if frame[predominant_class.lower().replace('í', 'i').replace('ó', 'o')] > 0:
-                    predominant_detections += 1
-            
-            # Confiança baseada na frequência de detecção nos frames recentes
-            confidence = predominant_detections / len(recent_frames)
-            
-            # Ajustar confiança baseada na intensidade da detecção
-            intensity_factor = min(max_score / 2.0, 1.0)  # Normalizar para 0-1
-            final_confidence = confidence * intensity_factor
-            
-            return predominant_class, final_confidence
-            
-        except Exception as e:
-            self.logger.warning(f"Erro ao calcular classe predominante: {e}")
+        # Adicionar contagens do frame atual ao histórico (desloca e descarta o mais antigo)
+        history = self._class_hist_arr
+        history[:-1] = history[1:]
+        history[-1] = (stats.get('smudge', 0), stats.get('simbolos', 0), stats.get('blackdot', 0))
+        n = self._class_hist_len = min(self._class_hist_len + 1, len(history))
+        
+        # Se não há histórico suficiente, retornar classe atual
+        if n < 3:
             return self._get_current_dominant_class(stats)
+        
+        # Médias móveis das três classes, maior média (ordem fixa) e detecções nos últimos
+        # 5 frames da predominante, em uma única passada (kernel numba quando disponível)
+        predominant_index, max_score, predominant_detections, recent_count = _predominant_kernel(history, n, 5)
+        predominant_class = _PREDOMINANT_CLASS_NAMES[predominant_index]
+        
+        # Se nenhuma classe tem detecção significativa, retornar "Nenhuma"
+        if max_score < 0.1:  # Threshold mínimo para considerar uma classe predominante
+            return "Nenhuma", 0.0
+        
+        # Calcular confiança baseada na estabilidade da detecção
+        # Confiança baseada na frequência de detecção nos frames recentes
+        confidence = predominant_detections / recent_count
+        
+        # Ajustar confiança baseada na intensidade da detecção
+        intensity_factor = min(max_score / 2.0, 1.0)  # Normalizar para 0-1
+        final_confidence = confidence * intensity_factor
+        
+        return predominant_class, final_confidence
     
     def _get_current_dominant_class(self, stats: dict) -> tuple:
         """
@@ -2389,18 +3106,13 @@ class YOLODetector:
         if smudge_count == 0 and simbolos_count == 0 and blackdot_count == 0:
             return "Nenhuma", 0.0
         
-        # Encontrar a classe com maior contagem
-        counts = {
-            'Smudge': smudge_count,
-            'Símbolo': simbolos_count,
-            'BlackDot': blackdot_count
-        }
-        
-        dominant_class = max(counts, key=counts.get)
-        max_count = counts[dominant_class]
+        # Encontrar a classe com maior contagem (ordem fixa de _PREDOMINANT_CLASS_NAMES)
+        counts = (smudge_count, simbolos_count, blackdot_count)
+        max_count = max(counts)
+        dominant_class = _PREDOMINANT_CLASS_NAMES[counts.index(max_count)]
         
         # Calcular confiança baseada na contagem
-        total_detections = sum(counts.values())
+        total_detections = sum(counts)
         confidence = max_count / total_detections if total_detections > 0 else 0.0
         
         return dominant_class, confidence
@@ -2415,60 +3127,50 @@ class YOLODetector:
         Returns:
             Dicionário com estatísticas das classes OK/NO
         """
-        try:
-            if not simbolos_result or not simbolos_result.boxes:
-                return {
-                    "fifa_ok": 0, "fifa_no": 0,
-                    "simbolo_ok": 0, "simbolo_no": 0,
-                    "string_ok": 0, "string_no": 0,
-                    "r_ok": 0, "r_no": 0,  # Mantido para compatibilidade, mas não será usado
-                    "total_ok": 0, "total_no": 0
-                }
-            
-            # Obter classes detectadas
-            classes = simbolos_result.boxes.cls.cpu().numpy()
-            
-            # Contar cada classe específica (baseado no modelo best.pt)
-            # ['FIFA_NO', 'FIFA_OK', 'Simbolo_NO', 'Simbolo_OK', 'String_NO', 'String_OK'] - 6 classes
-            fifa_no = np.sum(classes == 0)    # FIFA_NO
-            fifa_ok = np.sum(classes == 1)     # FIFA_OK
-            simbolo_no = np.sum(classes == 2)  # Simbolo_NO
-            simbolo_ok = np.sum(classes == 3)  # Simbolo_OK
-            string_no = np.sum(classes == 4)   # String_NO
-            string_ok = np.sum(classes == 5)   # String_OK
-            
-            # Totais
-            total_ok = fifa_ok + simbolo_ok + string_ok
-            total_no = fifa_no + simbolo_no + string_no
-            
-            return {
-                "fifa_ok": int(fifa_ok),
-                "fifa_no": int(fifa_no),
-                "simbolo_ok": int(simbolo_ok),
-                "simbolo_no": int(simbolo_no),
-                "string_ok": int(string_ok),
-                "string_no": int(string_no),
-                # Compatibilidade com código existente
-                "smudge_ok": int(fifa_ok),  # FIFA é mapeado como smudge
-                "smudge_no": int(fifa_no),  # FIFA é mapeado como smudge
-                "blackdot_ok": int(string_ok),  # String é mapeado como blackdot
-                "blackdot_no": int(string_no),  # String é mapeado como blackdot
-                "r_ok": 0,  # Não há mais R no modelo
-                "r_no": 0,  # Não há mais R no modelo
-                "total_ok": int(total_ok),
-                "total_no": int(total_no)
-            }
-            
-        except Exception as e:
-            self.logger.warning(f"Erro ao analisar classes OK/NO: {e}")
+        if not simbolos_result or not simbolos_result.boxes:
             return {
                 "fifa_ok": 0, "fifa_no": 0,
                 "simbolo_ok": 0, "simbolo_no": 0,
                 "string_ok": 0, "string_no": 0,
                 "r_ok": 0, "r_no": 0,  # Mantido para compatibilidade, mas não será usado
-                # Compatibilidade
-                "smudge_ok": 0, "smudge_no": 0,
-                "blackdot_ok": 0, "blackdot_no": 0,
                 "total_ok": 0, "total_no": 0
             }
+        
+        # Contar cada classe específica (baseado no modelo best.pt) com um único histograma
+        # ['FIFA_NO', 'FIFA_OK', 'Simbolo_NO', 'Simbolo_OK', 'String_NO', 'String_OK'] - 6 classes
+        cls = simbolos_result.boxes.cls
+        if isinstance(cls, torch.Tensor) and cls.is_cuda:
+            # Histograma na GPU: só as 6 contagens atravessam para o host, em um buffer
+            # pinned persistente (sem alocar um tensor de host por frame)
+            if self._ok_no_host is None:
+                self._ok_no_host = torch.empty(6, dtype=torch.int64, pin_memory=True)
+            self._ok_no_host.copy_(torch.bincount(cls.long(), minlength=6)[:6])
+            counts = self._ok_no_host.tolist()
+        else:
+            # Tensor em CPU: .numpy() compartilha a memória (sem cópia)
+            classes = cls.numpy() if isinstance(cls, torch.Tensor) else np.asarray(cls)
+            counts = np.bincount(classes.astype(np.int64), minlength=6)[:6].tolist()
+        fifa_no, fifa_ok, simbolo_no, simbolo_ok, string_no, string_ok = counts
+        
+        # Totais
+        total_ok = fifa_ok + simbolo_ok + string_ok
+        total_no = fifa_no + simbolo_no + string_no
+        
+        return {
+            "fifa_ok": fifa_ok,
+            "fifa_no": fifa_no,
+            "simbolo_ok": simbolo_ok,
+            "simbolo_no": simbolo_no,
+            "string_ok": string_ok,
+            "string_no": string_no,
+            # Compatibilidade com código existente
+            "smudge_ok": fifa_ok,  # FIFA é mapeado como smudge
+            "smudge_no": fifa_no,  # FIFA é mapeado como smudge
+            "blackdot_ok": string_ok,  # String é mapeado como blackdot
+            "blackdot_no": string_no,  # String é mapeado como blackdot
+            "r_ok": 0,  # Não há mais R no modelo
+            "r_no": 0,  # Não há mais R no modelo
+            "total_ok": total_ok,
+            "total_no": total_no
+        }
 
@@ -2,12 +2,30 @@
 # -*- coding: utf-8 -*-
 """
 Script de diagnóstico completo para identificar problemas
+
+Por padrão as janelas de teste abrem e fecham sozinhas (uso headless/CI);
+com --interactive aguarda o usuário fechar cada janela.
 """
 
 import sys
 import os
+import argparse
 import traceback
 
+parser = argparse.ArgumentParser(description="Diagnóstico do YOLO Detection System")
+parser.add_argument("--interactive", action="store_true",
+                    help="Aguardar o usuário fechar as janelas de teste")
+args = parser.parse_args()
+
+
+def run_window(root):
+    """Executa o mainloop; sem --interactive fecha a janela após 100 ms."""
+    if not args.interactive:
+        root.update()
+        root.after(100, root.destroy)
+    root.mainloop()
+
+
 print("="*70)
 print("DIAGNOSTICO - YOLO Detection System")
 print("="*70)
@@ -65,10 +83,11 @@ try:
     button.pack()
     
     print("    ✓ Janela Tkinter criada")
-    print("    NOTA: Uma janela de teste deve aparecer!")
-    print("    Feche a janela para continuar o diagnostico...")
-    root.mainloop()
-    print("    ✓ Janela fechada pelo usuario")
+    if args.interactive:
+        print("    NOTA: Uma janela de teste deve aparecer!")
+        print("    Feche a janela para continuar o diagnostico...")
+    run_window(root)
+    print("    ✓ Janela fechada")
 except Exception as e:
     print(f"    ✗ Erro ao criar janela: {e}")
     traceback.print_exc()
@@ -98,9 +117,10 @@ try:
     print(f"    ✓ Titulo: {ui.root.title()}")
     print(f"    ✓ Geometria: {ui.root.geometry()}")
     print()
-    print("    NOTA: A janela da UI deve aparecer agora!")
-    print("    Feche a janela para finalizar o diagnostico...")
-    ui.run()
+    if args.interactive:
+        print("    NOTA: A janela da UI deve aparecer agora!")
+        print("    Feche a janela para finalizar o diagnostico...")
+    run_window(ui.root)
     print("    ✓ UI finalizada normalmente")
 except Exception as e:
     print(f"    ✗ Erro ao criar/executar UI: {e}")
@@ -117,5 +137,6 @@ print("- Inicializacao da camera")
 print("- Inicializacao do detector")
 print("- Execucao do app.py")
 print()
-input("Pressione ENTER para sair...")
+if args.interactive:
+    input("Pressione ENTER para sair...")
 
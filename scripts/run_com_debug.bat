@@ -29,7 +29,7 @@ echo Executando diagnostico completo...
 echo.
 
 REM Executar diagnostico
-python diagnostico.py
+python diagnostico.py --interactive
 
 if errorlevel 1 (
     echo.
@@ -4,14 +4,90 @@ Versão 2.0: Layout profissional com controles à esquerda e preview maximizado.
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk
-import threading
 import time
+import queue
+import logging
+import threading
+import traceback
 from typing import Optional, Callable, Dict, Any
 import numpy as np
-from PIL import Image, ImageTk
 import cv2
 
+# Beeps de foco/nitidez (só Windows)
+try:
+    import winsound
+    WINSOUND_AVAILABLE = True
+except ImportError:
+    WINSOUND_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Pontos "ótimos" dos beeps de foco/nitidez e distância mínima a eles para cada valor inteiro 0-100
+_FOCUS_OPTIMAL_POINTS = (25, 50, 75)
+_SHARPNESS_OPTIMAL_POINTS = (30, 60, 90)
+_FOCUS_MIN_DIST = tuple(min(abs(v - p) for p in _FOCUS_OPTIMAL_POINTS) for v in range(101))
+_SHARPNESS_MIN_DIST = tuple(min(abs(v - p) for p in _SHARPNESS_OPTIMAL_POINTS) for v in range(101))
+
+
+def _min_distance(table, points, value):
+    """Distância de value ao ponto ótimo mais próximo (tabela para inteiros 0-100, cálculo direto no resto)."""
+    if type(value) is int and 0 <= value <= 100:
+        return table[value]
+    return min(abs(value - p) for p in points)
+
+# Checkboxes de modelos: (chave do modelo, texto, linha, coluna)
+_MODEL_CHECK_SPECS = (
+    ("seg", "ROI", 0, 0),
+    ("smudge", "Smudge", 0, 1),
+    ("simbolos", "Símbolos", 1, 0),
+    ("blackdot", "BlackDot", 1, 1),
+)
+
+# Labels de estatística atualizados a cada ciclo: (atributo do label, chave em stats, formato)
+_STATS_LABEL_FORMATS = (
+    ("fps_label", "fps", "{:.1f}"),
+    ("capture_fps_label", "capture_fps", "{:.1f}"),
+    ("infer_label", "inference_ms", "{:.1f} ms"),
+    ("smudge_label", "smudge", "{}"),
+    ("simbolos_label", "simbolos", "{}"),
+    ("blackdot_label", "blackdot", "{}"),
+    ("transfer_label", "transfer_count", "{}"),
+    ("avg_smudge_label", "avg_smudge", "{:.1f}"),
+    ("avg_simbolos_label", "avg_simbolos", "{:.1f}"),
+    ("avg_blackdot_label", "avg_blackdot", "{:.1f}"),
+    ("evaluated_label", "total_evaluated", "{}"),
+    ("approved_label", "total_approved", "{}"),
+    ("rejected_label", "total_rejected", "{}"),
+    ("approval_rate_label", "approval_rate", "{:.1f}%"),
+    ("avg_smudge_detected_label", "avg_smudge_detected", "{:.1f}%"),
+    ("avg_simbolos_detected_label", "avg_simbolos_detected", "{:.1f}%"),
+    ("avg_blackdot_detected_label", "avg_blackdot_detected", "{:.1f}%"),
+)
+
+# Labels da janela detalhada: (nome em detailed_labels, chave em stats, padrão, formato)
+_DETAILED_LABEL_FORMATS = (
+    ("fps", "fps", 0, "FPS: {:.1f}"),
+    ("capture_fps", "capture_fps", 0, "FPS Captura: {:.1f}"),
+    ("inference_time", "inference_ms", 0, "Tempo de Inferência: {:.1f} ms"),
+    ("device", "device", 'N/A', "Device: {}"),
+    ("smudge", "smudge", 0, "FIFA: {}"),
+    ("simbolos", "simbolos", 0, "Símbolos: {}"),
+    ("blackdot", "blackdot", 0, "BlackDot: {}"),
+    ("transfer_count", "transfer_count", 0, "Transfer #: {}"),
+    ("total_evaluated", "total_evaluated", 0, "Total Avaliados: {}"),
+    ("total_approved", "total_approved", 0, "Total Aprovados: {}"),
+    ("total_rejected", "total_rejected", 0, "Total Reprovados: {}"),
+    ("approval_rate", "approval_rate", 0, "Taxa Aprovação: {:.1f}%"),
+    ("avg_smudge", "avg_smudge", 0, "Smudge Médio: {:.1f}"),
+    ("avg_simbolos", "avg_simbolos", 0, "Símbolo Médio: {:.1f}"),
+    ("avg_blackdot", "avg_blackdot", 0, "BlackDot Médio: {:.1f}"),
+    ("avg_smudge_detected", "avg_smudge_detected", 0, "Smudge Detectado: {:.1f}%"),
+    ("avg_simbolos_detected", "avg_simbolos_detected", 0, "Símbolo Detectado: {:.1f}%"),
+    ("avg_blackdot_detected", "avg_blackdot_detected", 0, "BlackDot Detectado: {:.1f}%"),
+)
+
 
 class YOLODetectionUI:
     """GUI Tkinter para sistema de detecção YOLO - Versão 2.0 Profissional."""
@@ -43,6 +119,9 @@ class YOLODetectionUI:
         # Debounce para parâmetros da câmera (evitar mudanças muito rápidas)
         self.camera_param_timer = None
         self.pending_camera_params = None
+        self._cam_labels_pending = False  # _flush_cam_labels já agendado via after_idle
+        # Debounce genérico dos demais sliders: um timer pendente por chave
+        self._pending_timers: Dict[str, str] = {}
         
         # Callbacks (serão definidos externamente)
         self.on_start: Optional[Callable] = None
@@ -56,10 +135,41 @@ class YOLODetectionUI:
         # Controle de som contínuo
         self.continuous_sound_active = False
         self.sound_timer = None
-        
-        # Frame atual
-        self.current_frame: Optional[np.ndarray] = None
-        self.frame_lock = threading.Lock()
+        self._last_continuous_focus = None  # Foco do último beep contínuo
+        self._focus_still_ticks = 0  # Beeps seguidos com o foco parado (backoff do intervalo)
+        self.continuous_sound_btn: Optional[ttk.Button] = None  # Botão 🔁/🔴 do som contínuo, se criado
+        self._beep_queue: Optional[queue.Queue] = None  # Criada no primeiro beep (_play_beeps)
+        self._last_beep_ts = 0.0
+        
+        # Frame atual: buffer triplo reutilizado. O thread de processamento copia para um slot
+        # livre e publica o índice; a UI reserva e lê o slot publicado. Sem lock: trocar um
+        # índice inteiro é atômico sob o GIL, e o slot reservado nunca é sobrescrito.
+        self._frame_bufs: list = [None, None, None]
+        self._front_idx = -1    # Último slot publicado (-1: nenhum frame ainda)
+        self._reading_idx = -1  # Slot em uso pela UI
+        self._frame_seq = 0     # Frames publicados (o mais recente sempre substitui os anteriores)
+        self._drawn_seq = 0     # Último frame desenhado no preview
+        self._ui_dirty = False  # Frame/estatística nova ainda não desenhada (gravado pelo processamento)
+        self._redraw_interval_ms = 33  # Intervalo do laço de redesenho (~30 fps)
+        # PhotoImage persistente do preview (recriado só quando o tamanho muda)
+        self._photo: Optional[tk.PhotoImage] = None
+        self._photo_size = None
+        self._img_item = None
+        self._placeholder_item = None
+        self._ppm_buf: Optional[bytearray] = None   # Cabeçalho P6 + pixels RGB do preview
+        self._rgb_buf: Optional[np.ndarray] = None  # View dos pixels de _ppm_buf (destino BGR->RGB)
+        self._resize_buf: Optional[np.ndarray] = None   # Destino do redimensionamento
+        self._display_buf: Optional[np.ndarray] = None  # Fundo preto do tamanho do preview
+        self._display_rect = None  # Posição da imagem no canvas (bordas válidas enquanto igual)
+        self._preview_size = (0, 0)  # (largura, altura) do canvas de preview, atualizado em <Configure>
+        self._preview_geom = None      # (largura, altura, x_offset, y_offset, interpolação)
+        self._preview_geom_key = None  # ((altura, largura) do frame, tamanho do preview) de _preview_geom
+        self._last_text: Dict[Any, str] = {}  # Último texto exibido por label de estatística
+        self._last_values: Dict[Any, tuple] = {}  # (valor bruto, formato, texto) por label (_set_value)
+        self._last_classes_key = None  # Contagens exibidas em "Classes"/"Quantidades"
+        self._last_pred_key = None  # Classe, confiança e OK/NO exibidos em "Predominante"
+        self._widget_states: Dict[Any, str] = {}  # Último state aplicado por botão/slider
+        self._stats_window_visible = False  # Janela de estatísticas detalhadas aberta
         
         # Estatísticas
         self.stats = {
@@ -77,37 +187,44 @@ class YOLODetectionUI:
         
         # Sumário de estatísticas finais
         self.statistics_summary: Optional[Dict[str, Any]] = None
+        self._rendered_summary: Optional[Dict[str, Any]] = None  # Sumário exibido em summary_text
+        self._last_summary_text: Optional[str] = None  # Texto atualmente em summary_text
+        self._last_trace_ts = 0.0  # time.monotonic() do último stack trace de _update_detailed_stats
         
         self._build_ui()
+        # Labels de estatística resolvidos uma vez (o laço de _update_ui não faz getattr)
+        self._stat_bindings = [(getattr(self, attr), key, fmt) for attr, key, fmt in _STATS_LABEL_FORMATS]
         self._start_update_loop()
         
     def _create_tooltip(self, widget, text):
-        """Cria um tooltip simples para o widget."""
+        """Cria um tooltip simples para o widget (Toplevel criado no primeiro hover e reutilizado)."""
         def on_enter(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
+            tooltip = getattr(widget, 'tooltip', None)
+            if tooltip is None:
+                tooltip = tk.Toplevel()
+                tooltip.wm_overrideredirect(True)
+                label = tk.Label(tooltip, text=text, background="#ffffe0", 
+                               relief="solid", borderwidth=1, justify=tk.LEFT,
+                               font=("Arial", 9))
+                label.pack()
+                widget.tooltip = tooltip
             tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = tk.Label(tooltip, text=text, background="#ffffe0", 
-                           relief="solid", borderwidth=1, justify=tk.LEFT,
-                           font=("Arial", 9))
-            label.pack()
-            widget.tooltip = tooltip
+            tooltip.wm_deiconify()
             
         def on_leave(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                del widget.tooltip
+            tooltip = getattr(widget, 'tooltip', None)
+            if tooltip is not None:
+                tooltip.wm_withdraw()
                 
         widget.bind('<Enter>', on_enter)
         widget.bind('<Leave>', on_leave)
     
-    def _build_ui(self):
-        """Constrói a interface gráfica com layout profissional."""
-        # TEMA: Verde Pastel Degradê
-        self.root.configure(bg="#E8F5E9")
+    def _configure_styles(self):
+        """Configura o tema ttk uma única vez por interpretador Tk (os estilos são globais a ele)."""
+        if getattr(self.root, '_styles_configured', False):
+            return
         
-        # Estilo
-        style = ttk.Style()
+        style = ttk.Style(self.root)
         style.theme_use('clam')
         
         # Cores Verde Pastel
@@ -119,6 +236,13 @@ class YOLODetectionUI:
         style.map('TButton', background=[('active', '#66BB6A'), ('pressed', '#4CAF50')])
         style.configure('TCheckbutton', background='#E8F5E9', foreground='#1B5E20')
         style.configure('TScale', background='#E8F5E9', troughcolor='#A5D6A7')
+        self.root._styles_configured = True
+    
+    def _build_ui(self):
+        """Constrói a interface gráfica com layout profissional."""
+        # TEMA: Verde Pastel Degradê
+        self.root.configure(bg="#E8F5E9")
+        self._configure_styles()
         
         # Configurar grid principal - 2 colunas: controles esquerda, vídeo centro
         self.root.columnconfigure(0, weight=0, minsize=220)  # Painel esquerdo
@@ -134,11 +258,14 @@ class YOLODetectionUI:
         center_panel = ttk.Frame(self.root, padding="5", relief="sunken", borderwidth=2)
         center_panel.grid(row=0, column=1, sticky=(tk.N, tk.S, tk.E, tk.W))
         
-        # Preview maximizado - usando tk.Label como no código de referência
-        self.preview_label = tk.Label(center_panel, text="Aguardando câmera...", 
-                                       background="black", foreground="white",
-                                       font=('Arial', 16))
-        self.preview_label.pack(fill=tk.BOTH, expand=True)
+        # Preview maximizado - Canvas com um único item de imagem (trocar o conteúdo do item
+        # não dispara o gerenciamento de geometria como o tk.Label)
+        self.preview_canvas = tk.Canvas(center_panel, background="black", highlightthickness=0, borderwidth=0)
+        self.preview_canvas.pack(fill=tk.BOTH, expand=True)
+        self._img_item = self.preview_canvas.create_image(0, 0, anchor=tk.NW)
+        self._placeholder_item = self.preview_canvas.create_text(0, 0, text="Aguardando câmera...",
+                                                                 fill="white", font=('Arial', 16))
+        self.preview_canvas.bind('<Configure>', self._on_preview_configure)
         
         # === CONSTRUIR PAINEL ===
         self._build_left_panel(left_panel)
@@ -382,36 +509,15 @@ class YOLODetectionUI:
         models_frame = ttk.LabelFrame(parent, text="🤖 Controles de Modelos", padding="10")
         models_frame.pack(fill=tk.X, pady=(0, 8))
         
-        # Checkboxes para ativar/desativar modelos - Layout melhorado
+        # Checkboxes para ativar/desativar modelos - Layout melhorado (uma por linha da tabela)
         self.model_vars = {}
-        
-        # ROI (Segmentação)
-        self.model_vars["seg"] = tk.BooleanVar(value=True)
-        seg_check = ttk.Checkbutton(models_frame, text="ROI", 
-                                   variable=self.model_vars["seg"],
-                                   command=lambda: self._on_model_toggle("seg", self.model_vars["seg"].get()))
-        seg_check.grid(row=0, column=0, sticky=tk.W, pady=(0, 4))
-        
-        # Smudge
-        self.model_vars["smudge"] = tk.BooleanVar(value=True)
-        smudge_check = ttk.Checkbutton(models_frame, text="Smudge", 
-                                      variable=self.model_vars["smudge"],
-                                      command=lambda: self._on_model_toggle("smudge", self.model_vars["smudge"].get()))
-        smudge_check.grid(row=0, column=1, sticky=tk.W, pady=(0, 4))
-        
-        # Símbolos
-        self.model_vars["simbolos"] = tk.BooleanVar(value=True)
-        simbolos_check = ttk.Checkbutton(models_frame, text="Símbolos", 
-                                        variable=self.model_vars["simbolos"],
-                                        command=lambda: self._on_model_toggle("simbolos", self.model_vars["simbolos"].get()))
-        simbolos_check.grid(row=1, column=0, sticky=tk.W, pady=(0, 4))
-        
-        # BlackDot
-        self.model_vars["blackdot"] = tk.BooleanVar(value=True)
-        blackdot_check = ttk.Checkbutton(models_frame, text="BlackDot", 
-                                        variable=self.model_vars["blackdot"],
-                                        command=lambda: self._on_model_toggle("blackdot", self.model_vars["blackdot"].get()))
-        blackdot_check.grid(row=1, column=1, sticky=tk.W, pady=(0, 4))
+        self.model_checks = {}
+        for key, text, row, column in _MODEL_CHECK_SPECS:
+            self.model_vars[key] = tk.BooleanVar(value=True)
+            check = ttk.Checkbutton(models_frame, text=text, variable=self.model_vars[key],
+                                    command=lambda k=key: self._on_model_toggle(k, self.model_vars[k].get()))
+            check.grid(row=row, column=column, sticky=tk.W, pady=(0, 4))
+            self.model_checks[key] = check
         
         # Botões de controle rápido - Layout melhorado
         btn_frame = ttk.Frame(models_frame)
@@ -578,10 +684,10 @@ class YOLODetectionUI:
         if self.on_start:
             self.on_start()
         self.running = True
-        self.btn_start.config(state=tk.DISABLED)
-        self.btn_stop.config(state=tk.NORMAL)
-        self.btn_record.config(state=tk.NORMAL)
-        self.btn_pause.config(state=tk.NORMAL)
+        self._set_state(self.btn_start, tk.DISABLED)
+        self._set_state(self.btn_stop, tk.NORMAL)
+        self._set_state(self.btn_record, tk.NORMAL)
+        self._set_state(self.btn_pause, tk.NORMAL)
         self.set_status("● Executando", "green")
     
     def _on_stop_click(self):
@@ -590,10 +696,10 @@ class YOLODetectionUI:
             self.on_stop()
         self.running = False
         self.recording = False
-        self.btn_start.config(state=tk.NORMAL)
-        self.btn_stop.config(state=tk.DISABLED)
-        self.btn_record.config(state=tk.DISABLED)
-        self.btn_pause.config(state=tk.DISABLED)
+        self._set_state(self.btn_start, tk.NORMAL)
+        self._set_state(self.btn_stop, tk.DISABLED)
+        self._set_state(self.btn_record, tk.DISABLED)
+        self._set_state(self.btn_pause, tk.DISABLED)
         self.btn_record.config(text="🔴 Iniciar Gravação")
         self.set_status("● Parado", "red")
     
@@ -628,28 +734,44 @@ class YOLODetectionUI:
         simbolos_val = self.simbolos_conf_var.get() / 100.0
         blackdot_val = self.blackdot_conf_var.get() / 100.0
         
-        # Atualizar labels com valores convertidos
-        self.roi_conf_label.config(text=f"{roi_val:.2f}")
-        self.smudge_conf_label.config(text=f"{smudge_val:.2f}")
-        self.simbolos_conf_label.config(text=f"{simbolos_val:.2f}")
-        self.blackdot_conf_label.config(text=f"{blackdot_val:.2f}")
+        # Atualizar labels com valores convertidos (só o do slider movido muda de fato)
+        self._set_text(self.roi_conf_label, f"{roi_val:.2f}")
+        self._set_text(self.smudge_conf_label, f"{smudge_val:.2f}")
+        self._set_text(self.simbolos_conf_label, f"{simbolos_val:.2f}")
+        self._set_text(self.blackdot_conf_label, f"{blackdot_val:.2f}")
         
-        # Callback
+        # Callback com debounce: durante o arraste só o último valor chega ao detector
+        self._debounce("thresholds", 50, self._commit_thresholds)
+    
+    def _commit_thresholds(self):
+        """Envia os thresholds atuais ao callback (chamado pelo debounce)."""
         if self.on_threshold_change:
             thresholds = {
-                "roi_conf": roi_val,
-                "smudge_conf": smudge_val,
-                "simbolo_conf": simbolos_val,
-                "blackdot_conf": blackdot_val
+                "roi_conf": self.roi_conf_var.get() / 100.0,
+                "smudge_conf": self.smudge_conf_var.get() / 100.0,
+                "simbolo_conf": self.simbolos_conf_var.get() / 100.0,
+                "blackdot_conf": self.blackdot_conf_var.get() / 100.0
             }
             self.on_threshold_change(thresholds)
     
+    def _debounce(self, key: str, delay_ms: int, callback: Callable[[], None]):
+        """Agenda callback após delay_ms, cancelando o agendamento pendente da mesma chave."""
+        pending = self._pending_timers.get(key)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        
+        def run():
+            self._pending_timers.pop(key, None)
+            callback()
+        
+        self._pending_timers[key] = self.root.after(delay_ms, run)
+    
     def _on_camera_param_change(self, _=None):
         """Handler de mudança nos parâmetros da câmera com debounce."""
-        # Atualizar labels imediatamente para feedback visual
-        self.cam_fps_label.config(text=str(int(self.cam_fps_var.get())))
-        self.cam_exposure_label.config(text=str(int(self.cam_exposure_var.get())))
-        self.cam_gain_label.config(text=f"{self.cam_gain_var.get():.1f}")
+        # Atualizar labels no próximo ciclo ocioso do Tk (vários movimentos viram uma atualização)
+        if not self._cam_labels_pending:
+            self._cam_labels_pending = True
+            self.root.after_idle(self._flush_cam_labels)
         
         # Mostrar status de aguardando
         self.camera_apply_status.config(text="⏳ Aguardando aplicação...")
@@ -668,6 +790,13 @@ class YOLODetectionUI:
         # Agendar aplicação após 500ms (debounce)
         self.camera_param_timer = self.root.after(500, self._apply_camera_params)
     
+    def _flush_cam_labels(self):
+        """Exibe os valores atuais dos sliders da câmera (agendado por _on_camera_param_change)."""
+        self._cam_labels_pending = False
+        self._set_text(self.cam_fps_label, str(int(self.cam_fps_var.get())))
+        self._set_text(self.cam_exposure_label, str(int(self.cam_exposure_var.get())))
+        self._set_text(self.cam_gain_label, f"{self.cam_gain_var.get():.1f}")
+    
     def _on_balance_change(self, _=None):
         """Handler de mudança no Balance White Auto."""
         balance_mode = self.cam_balance_var.get()
@@ -693,11 +822,11 @@ class YOLODetectionUI:
         if auto_enabled:
             self.auto_status_label.config(text="🔄 Auto Exposição: ATIVADO - Ajustando automaticamente", foreground="green")
             # Desabilitar slider manual
-            self.cam_exposure_scale.config(state="disabled")
+            self._set_state(self.cam_exposure_scale, "disabled")
         else:
             self.auto_status_label.config(text="⚙️ Auto Exposição: DESATIVADO - Controle manual", foreground="blue")
             # Habilitar slider manual
-            self.cam_exposure_scale.config(state="normal")
+            self._set_state(self.cam_exposure_scale, "normal")
         
         # Chamar callback se disponível
         if hasattr(self, 'on_auto_camera_change'):
@@ -712,11 +841,11 @@ class YOLODetectionUI:
         if auto_enabled:
             self.auto_status_label.config(text="🔄 Auto Ganho: ATIVADO - Ajustando automaticamente", foreground="green")
             # Desabilitar slider manual
-            self.cam_gain_scale.config(state="disabled")
+            self._set_state(self.cam_gain_scale, "disabled")
         else:
             self.auto_status_label.config(text="⚙️ Auto Ganho: DESATIVADO - Controle manual", foreground="blue")
             # Habilitar slider manual
-            self.cam_gain_scale.config(state="normal")
+            self._set_state(self.cam_gain_scale, "normal")
         
         # Chamar callback se disponível
         if hasattr(self, 'on_auto_camera_change'):
@@ -727,8 +856,7 @@ class YOLODetectionUI:
     
     def _on_class_toggle(self, model_type: str, class_name: str, enabled: bool):
         """Handler de mudança em classes específicas."""
-        status = "ATIVADA" if enabled else "DESATIVADA"
-        print(f"Classe {class_name} ({model_type}): {status}")
+        logger.debug("Classe %s (%s): %s", class_name, model_type, "ATIVADA" if enabled else "DESATIVADA")
         
         # Chamar callback se disponível
         if hasattr(self, 'on_class_change'):
@@ -740,42 +868,54 @@ class YOLODetectionUI:
     
     def _enable_all_classes(self):
         """Ativa todas as classes."""
-        for var in self.roi_class_vars.values():
-            var.set(True)
-        for var in self.simbolos_class_vars.values():
-            var.set(True)
-        print("✅ Todas as classes ativadas")
+        self._set_all_classes(True)
+        logger.debug("✅ Todas as classes ativadas")
     
     def _disable_all_classes(self):
         """Desativa todas as classes."""
+        self._set_all_classes(False)
+        logger.debug("❌ Todas as classes desativadas")
+    
+    def _set_all_classes(self, enabled: bool):
+        """Aplica enabled a todas as classes e avisa o callback uma única vez (em vez de uma por classe)."""
         for var in self.roi_class_vars.values():
-            var.set(False)
+            var.set(enabled)
         for var in self.simbolos_class_vars.values():
-            var.set(False)
-        print("❌ Todas as classes desativadas")
+            var.set(enabled)
+        
+        # var.set() não dispara o command dos Checkbuttons: um único callback consolidado
+        if hasattr(self, 'on_class_change'):
+            self.on_class_change({
+                'bulk': True,
+                'enabled': enabled,
+                'classes': {
+                    'roi': list(self.roi_class_vars),
+                    'simbolos': list(self.simbolos_class_vars)
+                }
+            })
     
     def _reset_classes(self):
         """Reset para configuração padrão (todas ativas)."""
         self._enable_all_classes()
-        print("🔄 Classes resetadas para padrão")
+        logger.debug("🔄 Classes resetadas para padrão")
     
     def _on_iou_change(self, _=None):
         """Handler de mudança nos valores de IOU."""
-        smudge_iou = self.smudge_iou_var.get()
-        simbolos_iou = self.simbolos_iou_var.get()
-        blackdot_iou = self.blackdot_iou_var.get()
+        # Atualizar labels (só o do slider movido muda de fato)
+        self._set_text(self.smudge_iou_label, f"{self.smudge_iou_var.get():.2f}")
+        self._set_text(self.simbolos_iou_label, f"{self.simbolos_iou_var.get():.2f}")
+        self._set_text(self.blackdot_iou_label, f"{self.blackdot_iou_var.get():.2f}")
         
-        # Atualizar labels
-        self.smudge_iou_label.config(text=f"{smudge_iou:.2f}")
-        self.simbolos_iou_label.config(text=f"{simbolos_iou:.2f}")
-        self.blackdot_iou_label.config(text=f"{blackdot_iou:.2f}")
-        
-        # Callback para atualizar IOU no detector
+        # Callback com debounce: durante o arraste só o último valor chega ao detector
+        self._debounce("iou", 50, self._commit_iou)
+    
+    def _commit_iou(self):
+        """Envia os IOUs atuais ao callback (chamado pelo debounce)."""
         if self.on_threshold_change:
             self.on_threshold_change({
-                "smudge_iou": smudge_iou,
-                "simbolos_iou": simbolos_iou,
-                "blackdot_iou": blackdot_iou
+                "smudge_iou": self.smudge_iou_var.get(),
+                "simbolos_iou": self.simbolos_iou_var.get(),
+                "blackdot_iou": self.blackdot_iou_var.get()
             })
     
     def _on_overlay_change(self):
@@ -804,12 +944,53 @@ class YOLODetectionUI:
     
     def update_frame(self, frame: np.ndarray):
         """Atualiza o frame exibido no preview."""
-        with self.frame_lock:
-            self.current_frame = frame.copy()
+        front, reading = self._front_idx, self._reading_idx
+        idx = next(i for i in range(3) if i != front and i != reading)
+        buf = self._frame_bufs[idx]
+        if buf is None or buf.shape != frame.shape or buf.dtype != frame.dtype:
+            buf = self._frame_bufs[idx] = np.empty_like(frame)
+        np.copyto(buf, frame)
+        self._front_idx = idx
+        self._frame_seq += 1
+        self._request_redraw()
+    
+    def _acquire_preview_frame(self) -> Optional[np.ndarray]:
+        """Reserva o último frame publicado para leitura pela UI (None se não há frame novo)."""
+        seq = self._frame_seq
+        if self._front_idx < 0 or seq == self._drawn_seq:
+            return None
+        self._drawn_seq = seq
+        # Reservar o slot publicado; se um novo frame foi publicado no meio, reservar o novo
+        idx = self._front_idx
+        self._reading_idx = idx
+        while self._front_idx != idx:
+            idx = self._front_idx
+            self._reading_idx = idx
+        return self._frame_bufs[idx]
+    
+    def _release_preview_frame(self):
+        """Libera o slot reservado por _acquire_preview_frame."""
+        self._reading_idx = -1
     
     def update_stats(self, stats: Dict[str, Any]):
         """Atualiza as estatísticas exibidas."""
         self.stats.update(stats)
+        self._request_redraw()
+    
+    def _request_redraw(self):
+        """Marca a UI como desatualizada. Chamado pelo thread de processamento: só grava um flag,
+        sem nenhuma chamada Tcl (que bloquearia até o thread do Tk atendê-la, ex.: durante o join do stop)."""
+        self._ui_dirty = True
+    
+    def _poll_redraw(self):
+        """Laço no thread do Tk: redesenha quando há frame/estatística nova (no máximo ~30 vezes/s)."""
+        if self._ui_dirty:
+            self._ui_dirty = False
+            self._update_ui()
+        try:
+            self.root.after(self._redraw_interval_ms, self._poll_redraw)
+        except tk.TclError:
+            pass  # Janela já destruída
     
     def update_statistics_summary(self, summary: Dict[str, Any]):
         """
@@ -823,7 +1004,11 @@ class YOLODetectionUI:
     
     def _update_summary_display(self):
         """Atualiza a exibição do sumário na janela de estatísticas detalhadas."""
-        if not hasattr(self, 'summary_text') or not self.statistics_summary:
+        # Janela oculta: o sumário é exibido quando ela for reaberta (_open_stats_window)
+        if not self._stats_window_visible or not hasattr(self, 'summary_text') or not self.statistics_summary:
+            return
+        # Mesmo sumário já exibido neste widget: nada a reconstruir
+        if self.statistics_summary is self._rendered_summary:
             return
         
         summary = self.statistics_summary
@@ -895,85 +1080,146 @@ class YOLODetectionUI:
         
         text_content.append("=" * 70)
         
-        # Atualizar widget de texto
-        self.summary_text.delete('1.0', tk.END)
-        self.summary_text.insert('1.0', '\n'.join(text_content))
+        # Atualizar widget de texto numa única operação (replace em vez de delete + insert),
+        # só se o texto mudou (sumários novos com o mesmo conteúdo não mexem no widget)
+        text = '\n'.join(text_content)
+        if text != self._last_summary_text:
+            self.summary_text.replace('1.0', tk.END, text)
+            self._last_summary_text = text
+        self._rendered_summary = summary
+    
+    def _set_state(self, widget, state: str):
+        """Altera o state do widget só quando ele muda (evita reconfigurar o Tk à toa)."""
+        if self._widget_states.get(widget) != state:
+            widget.config(state=state)
+            self._widget_states[widget] = state
+    
+    def _set_text(self, label, text: str):
+        """Atualiza o texto do label só quando ele muda (evita reconfigurar o Tk a cada ciclo)."""
+        if self._last_text.get(label) != text:
+            label.config(text=text)
+            self._last_text[label] = text
+    
+    def _set_value(self, label, value, fmt: str):
+        """Formata e exibe value só quando o valor bruto muda (pula a formatação e o .config())."""
+        cached = self._last_values.get(label)
+        # Reaproveita o texto se valor e formato são os mesmos e ninguém reescreveu o label
+        if cached is not None and cached[0] == value and cached[1] == fmt and self._last_text.get(label) == cached[2]:
+            return
+        text = fmt.format(value)
+        self._last_values[label] = (value, fmt, text)
+        self._set_text(label, text)
+    
+    def _on_preview_configure(self, event):
+        """Guarda o tamanho atual do canvas de preview (evita winfo_* a cada atualização)."""
+        if (event.width, event.height) != self._preview_size:
+            self._preview_size = (event.width, event.height)
+            if self._placeholder_item is not None:
+                self.preview_canvas.coords(self._placeholder_item, event.width // 2, event.height // 2)
+            self._drawn_seq = -1  # Redesenhar o último frame no novo tamanho
+            self.root.after_idle(self._update_ui)
+    
+    def _preview_geometry(self, frame_hw):
+        """Tamanho, offsets e interpolação do preview (recalculados só quando o frame ou o preview mudam)."""
+        key = (frame_hw, self._preview_size)
+        if self._preview_geom_key != key:
+            h, w = frame_hw
+            label_width, label_height = self._preview_size
+            # Escala que mantém o aspect ratio (igual código de referência)
+            scale = min(label_width / w, label_height / h)
+            new_width = int(w * scale)
+            new_height = int(h * scale)
+            # Diferença de até 1 px (arredondamento): preencher o preview e dispensar as bordas pretas
+            if abs(label_width - new_width) <= 1 and abs(label_height - new_height) <= 1:
+                new_width, new_height = label_width, label_height
+            # INTER_AREA ao reduzir; ao ampliar, bilinear basta para preview ao vivo (LANCZOS4 é ~3x mais caro)
+            interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+            self._preview_geom = (new_width, new_height, (label_width - new_width) // 2,
+                                  (label_height - new_height) // 2, interpolation)
+            self._preview_geom_key = key
+        return self._preview_geom
+    
+    def _blit(self, frame: np.ndarray):
+        """Exibe um frame BGR uint8 no preview como PPM (P6) decodificado pelo próprio Tk, sem PIL."""
+        h, w = frame.shape[:2]
+        # Buffer PPM persistente (cabeçalho + pixels, realocado só quando o tamanho muda):
+        # _rgb_buf é uma view dos pixels, então a conversão BGR->RGB já escreve no PPM
+        if self._rgb_buf is None or self._rgb_buf.shape[:2] != (h, w):
+            header = b'P6\n%d %d\n255\n' % (w, h)
+            self._ppm_buf = bytearray(len(header) + h * w * 3)
+            self._ppm_buf[:len(header)] = header
+            self._rgb_buf = np.frombuffer(self._ppm_buf, dtype=np.uint8, offset=len(header)).reshape(h, w, 3)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        data = bytes(self._ppm_buf)  # Tk só aceita bytes: uma cópia, sem tobytes() + concatenação
+        if self._photo is None or self._photo_size != (w, h):
+            self._photo = tk.PhotoImage(data=data)
+            self._photo_size = (w, h)
+            # itemconfigure só quando a PhotoImage é recriada; nos demais frames basta o configure(data=)
+            self.preview_canvas.itemconfigure(self._img_item, image=self._photo)
+            if self._placeholder_item is not None:
+                self.preview_canvas.delete(self._placeholder_item)
+                self._placeholder_item = None
+        else:
+            self._photo.configure(data=data)
     
     def _start_update_loop(self):
-        """Inicia loop de atualização da UI."""
+        """Inicia o laço de atualização da UI (barato quando não há nada novo)."""
         self._update_ui()
+        self.root.after(self._redraw_interval_ms, self._poll_redraw)
     
     def _update_ui(self):
-        """Atualiza UI periodicamente - seguindo padrão do código de referência que funciona."""
-        # Atualizar preview
-        with self.frame_lock:
-            if self.current_frame is not None:
-                frame = self.current_frame.copy()
-                
-                # Seguir exatamente o padrão do código de referência para evitar deslocamento
-                h, w = frame.shape[:2]
-                label_width = self.preview_label.winfo_width()
-                label_height = self.preview_label.winfo_height()
+        """Atualiza preview e estatísticas - seguindo padrão do código de referência que funciona."""
+        # Atualizar preview (slot reservado: o processamento não o sobrescreve durante a leitura)
+        frame = self._acquire_preview_frame()
+        if frame is not None:
+            try:
+                label_width, label_height = self._preview_size
                 
                 if label_width > 10 and label_height > 10:  # Certifica que widget foi renderizado
-                    # Calcula escala para manter aspect ratio (igual código de referência)
-                    scale_w = label_width / w
-                    scale_h = label_height / h
-                    scale = min(scale_w, scale_h)  # Usa menor escala para manter proporção
-                    
-                    new_width = int(w * scale)
-                    new_height = int(h * scale)
+                    new_width, new_height, x_offset, y_offset, interpolation = self._preview_geometry(frame.shape[:2])
                     
-                    # Redimensiona com interpolação de alta qualidade (igual código de referência)
-                    if new_width > 10 and new_height > 10:
-                        frame = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_LANCZOS4)
+                    resize = new_width > 10 and new_height > 10 and (new_height, new_width) != frame.shape[:2]
                     
                     # Se a imagem não preencher completamente, adiciona padding preto centralizado
                     # (igual código de referência - isso evita deslocamento)
                     if new_width != label_width or new_height != label_height:
-                        # Cria imagem preta do tamanho do label
-                        display_frame = np.zeros((label_height, label_width, 3), dtype=np.uint8)
+                        # Fundo preto do tamanho do preview, reutilizado: as bordas só precisam ser
+                        # zeradas quando o fundo ou a posição da imagem mudam
+                        rect = (label_width, label_height, x_offset, y_offset, new_width, new_height)
+                        if self._display_buf is None or self._display_buf.shape[:2] != (label_height, label_width):
+                            self._display_buf = np.zeros((label_height, label_width, 3), dtype=np.uint8)
+                        elif self._display_rect != rect:
+                            self._display_buf.fill(0)
+                        self._display_rect = rect
+                        display_frame = self._display_buf
                         
-                        # Centraliza a imagem redimensionada (igual código de referência)
-                        y_offset = (label_height - new_height) // 2
-                        x_offset = (label_width - new_width) // 2
-                        
-                        display_frame[y_offset:y_offset+new_height, x_offset:x_offset+new_width] = frame
+                        # Redimensiona direto na área da imagem dentro do fundo (sem buffer intermediário)
+                        target = display_frame[y_offset:y_offset+new_height, x_offset:x_offset+new_width]
+                        if resize:
+                            cv2.resize(frame, (new_width, new_height), dst=target, interpolation=interpolation)
+                        else:
+                            target[...] = frame
                         frame = display_frame
+                    elif resize:
+                        # Preview sem bordas: redimensiona antes de converter/copiar para o Tk (destino reutilizado)
+                        if self._resize_buf is None or self._resize_buf.shape[:2] != (new_height, new_width):
+                            self._resize_buf = np.empty((new_height, new_width, 3), dtype=np.uint8)
+                        frame = cv2.resize(frame, (new_width, new_height), dst=self._resize_buf,
+                                           interpolation=interpolation)
                 
-                # Converter para PhotoImage
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(frame_rgb)
-                imgtk = ImageTk.PhotoImage(image=img)
-                
-                self.preview_label.configure(image=imgtk, text="")
-                self.preview_label.image = imgtk  # Manter referência
-        
-        # Atualizar estatísticas
-        self.fps_label.config(text=f"{self.stats.get('fps', 0):.1f}")
-        self.capture_fps_label.config(text=f"{self.stats.get('capture_fps', 0):.1f}")
-        self.infer_label.config(text=f"{self.stats.get('inference_ms', 0):.1f} ms")
-        self.smudge_label.config(text=str(self.stats.get('smudge', 0)))
-        self.simbolos_label.config(text=str(self.stats.get('simbolos', 0)))
-        self.blackdot_label.config(text=str(self.stats.get('blackdot', 0)))
-        self.transfer_label.config(text=str(self.stats.get('transfer_count', 0)))
-        self.avg_smudge_label.config(text=f"{self.stats.get('avg_smudge', 0):.1f}")
-        self.avg_simbolos_label.config(text=f"{self.stats.get('avg_simbolos', 0):.1f}")
-        self.avg_blackdot_label.config(text=f"{self.stats.get('avg_blackdot', 0):.1f}")
-        
-        # Atualizar estatísticas de transfer
-        self.evaluated_label.config(text=str(self.stats.get('total_evaluated', 0)))
-        self.approved_label.config(text=str(self.stats.get('total_approved', 0)))
-        self.rejected_label.config(text=str(self.stats.get('total_rejected', 0)))
-        self.approval_rate_label.config(text=f"{self.stats.get('approval_rate', 0):.1f}%")
-        
-        # Atualizar estatísticas de classes detectadas médias
-        self.avg_smudge_detected_label.config(text=f"{self.stats.get('avg_smudge_detected', 0):.1f}%")
-        self.avg_simbolos_detected_label.config(text=f"{self.stats.get('avg_simbolos_detected', 0):.1f}%")
-        self.avg_blackdot_detected_label.config(text=f"{self.stats.get('avg_blackdot_detected', 0):.1f}%")
-        
-        # Agendar próxima atualização
-        self.root.after(33, self._update_ui)  # ~30 FPS na UI
+                self._blit(frame)
+            finally:
+                self._release_preview_frame()
+        
+        # Atualizar estatísticas (valores inalterados não são nem formatados)
+        stats_get = self.stats.get
+        set_value = self._set_value
+        for label, key, fmt in self._stat_bindings:
+            set_value(label, stats_get(key, 0), fmt)
+        
+        # Janela de estatísticas detalhadas (só quando visível)
+        if self._stats_window_visible:
+            self._refresh_detailed_labels()
     
     def set_status(self, message: str, color: str = "black"):
         """Define mensagem de status."""
@@ -1051,73 +1297,82 @@ class YOLODetectionUI:
         try:
             # Transfers processados
             transfers = stats.get("transfer_count", 0)
-            self.stats_labels["transfers"].config(text=f"Transfers: {transfers}")
+            self._set_text(self.stats_labels["transfers"], f"Transfers: {transfers}")
             
             # ROI Confidence
             roi_conf = stats.get("roi_confidence", 0.0)
             if roi_conf > 0:
-                self.stats_labels["roi_conf"].config(text=f"ROI Conf: {roi_conf:.3f}")
+                self._set_text(self.stats_labels["roi_conf"], f"ROI Conf: {roi_conf:.3f}")
             else:
-                self.stats_labels["roi_conf"].config(text="ROI Conf: -")
-            
-            # Classes detectadas e quantidades
-            classes_detected = []
-            quantities = []
+                self._set_text(self.stats_labels["roi_conf"], "ROI Conf: -")
             
-            if stats.get("smudge", 0) > 0:
-                classes_detected.append("Smudge")
-                quantities.append(f"Smudge: {stats['smudge']}")
+            # Classes detectadas e quantidades (textos refeitos só quando as contagens mudam)
+            classes_key = (stats.get("smudge", 0), stats.get("simbolos", 0), stats.get("blackdot", 0))
+            if classes_key != self._last_classes_key:
+                self._last_classes_key = classes_key
+                classes_detected = []
+                quantities = []
                 
-                if stats.get("simbolos", 0) > 0:
-                    classes_detected.append("Símbolo")
-                    quantities.append(f"Símbolo: {stats['simbolos']}")
+                if stats.get("smudge", 0) > 0:
+                    classes_detected.append("Smudge")
+                    quantities.append(f"Smudge: {stats['smudge']}")
+                    
+                    if stats.get("simbolos", 0) > 0:
+                        classes_detected.append("Símbolo")
+                        quantities.append(f"Símbolo: {stats['simbolos']}")
+                    
+                    if stats.get("blackdot", 0) > 0:
+                        classes_detected.append("BlackDot")
+                        quantities.append(f"BlackDot: {stats['blackdot']}")
                 
-                if stats.get("blackdot", 0) > 0:
-                    classes_detected.append("BlackDot")
-                    quantities.append(f"BlackDot: {stats['blackdot']}")
-            
-            # Atualizar labels das classes detectadas
-            if classes_detected:
-                self.stats_labels["classes"].config(text=f"Classes: {', '.join(classes_detected)}")
-                self.stats_labels["quantities"].config(text=f"Quantidades: {' | '.join(quantities)}")
-            else:
-                self.stats_labels["classes"].config(text="Classes: Nenhuma")
-                self.stats_labels["quantities"].config(text="Quantidades: -")
+                # Atualizar labels das classes detectadas
+                if classes_detected:
+                    self._set_text(self.stats_labels["classes"], f"Classes: {', '.join(classes_detected)}")
+                    self._set_text(self.stats_labels["quantities"], f"Quantidades: {' | '.join(quantities)}")
+                else:
+                    self._set_text(self.stats_labels["classes"], "Classes: Nenhuma")
+                    self._set_text(self.stats_labels["quantities"], "Quantidades: -")
             
             # Classe predominante estabilizada (média móvel das últimas 10 frames)
             predominant_class = stats.get("predominant_class", "Nenhuma")
             predominant_confidence = stats.get("predominant_class_confidence", 0.0)
             
-            # Atualizar label da classe predominante
-            if predominant_class != "Nenhuma":
-                confidence_percent = predominant_confidence * 100
-                
-                # Exibir detalhes das classes OK/NO se disponíveis
-                ok_no_details = []
-                if stats.get("smudge_ok", 0) > 0 or stats.get("smudge_no", 0) > 0:
-                    ok_no_details.append(f"Smudge: {stats.get('smudge_ok', 0)}OK/{stats.get('smudge_no', 0)}NO")
-                if stats.get("simbolo_ok", 0) > 0 or stats.get("simbolo_no", 0) > 0:
-                    ok_no_details.append(f"Símbolo: {stats.get('simbolo_ok', 0)}OK/{stats.get('simbolo_no', 0)}NO")
-                if stats.get("blackdot_ok", 0) > 0 or stats.get("blackdot_no", 0) > 0:
-                    ok_no_details.append(f"BlackDot: {stats.get('blackdot_ok', 0)}OK/{stats.get('blackdot_no', 0)}NO")
-                # R não existe mais no modelo best.pt (removido - agora são apenas FIFA, Simbolo, String)
-                
-                if ok_no_details:
-                    details_text = " | ".join(ok_no_details)
-                    self.stats_labels["predominant_class"].config(
-                        text=f"🎯 Predominante: {predominant_class} ({confidence_percent:.1f}%) - {details_text}",
-                        foreground="#2E7D32"
-                    )
+            # Atualizar label da classe predominante (só quando classe, confiança ou OK/NO mudam)
+            pred_key = (predominant_class, predominant_confidence,
+                        stats.get("smudge_ok", 0), stats.get("smudge_no", 0),
+                        stats.get("simbolo_ok", 0), stats.get("simbolo_no", 0),
+                        stats.get("blackdot_ok", 0), stats.get("blackdot_no", 0))
+            if pred_key != self._last_pred_key:
+                self._last_pred_key = pred_key
+                if predominant_class != "Nenhuma":
+                    confidence_percent = predominant_confidence * 100
+                    
+                    # Exibir detalhes das classes OK/NO se disponíveis
+                    ok_no_details = []
+                    if stats.get("smudge_ok", 0) > 0 or stats.get("smudge_no", 0) > 0:
+                        ok_no_details.append(f"Smudge: {stats.get('smudge_ok', 0)}OK/{stats.get('smudge_no', 0)}NO")
+                    if stats.get("simbolo_ok", 0) > 0 or stats.get("simbolo_no", 0) > 0:
+                        ok_no_details.append(f"Símbolo: {stats.get('simbolo_ok', 0)}OK/{stats.get('simbolo_no', 0)}NO")
+                    if stats.get("blackdot_ok", 0) > 0 or stats.get("blackdot_no", 0) > 0:
+                        ok_no_details.append(f"BlackDot: {stats.get('blackdot_ok', 0)}OK/{stats.get('blackdot_no', 0)}NO")
+                    # R não existe mais no modelo best.pt (removido - agora são apenas FIFA, Simbolo, String)
+                    
+                    if ok_no_details:
+                        details_text = " | ".join(ok_no_details)
+                        self.stats_labels["predominant_class"].config(
+                            text=f"🎯 Predominante: {predominant_class} ({confidence_percent:.1f}%) - {details_text}",
+                            foreground="#2E7D32"
+                        )
+                    else:
+                        self.stats_labels["predominant_class"].config(
+                            text=f"🎯 Predominante: {predominant_class} ({confidence_percent:.1f}%)",
+                            foreground="#2E7D32"
+                        )
                 else:
                     self.stats_labels["predominant_class"].config(
-                        text=f"🎯 Predominante: {predominant_class} ({confidence_percent:.1f}%)",
-                        foreground="#2E7D32"
+                        text="🎯 Predominante: Nenhuma",
+                        foreground="#666666"  # Cinza para indicar ausência
                     )
-            else:
-                self.stats_labels["predominant_class"].config(
-                    text="🎯 Predominante: Nenhuma",
-                    foreground="#666666"  # Cinza para indicar ausência
-                )
             
             # Atualizar janela detalhada se estiver aberta
             self._update_detailed_stats_window(stats)
@@ -1127,34 +1382,35 @@ class YOLODetectionUI:
     
     def _update_detailed_stats_window(self, stats: dict):
         """Atualiza a janela de estatísticas detalhadas."""
-        if hasattr(self, 'detailed_labels') and self.detailed_labels:
+        # Flag mantido ao abrir/ocultar a janela: com ela oculta não há nada a atualizar
+        if self._stats_window_visible:
             try:
                 # Transfers
                 transfers = stats.get("transfer_count", 0)
-                self.detailed_labels["transfers"].config(text=f"Transfers Processados: {transfers}")
+                self._set_text(self.detailed_labels["transfers"], f"Transfers Processados: {transfers}")
                 
                 # ROI Confidence
                 roi_conf = stats.get("roi_confidence", 0.0)
                 if roi_conf > 0:
-                    self.detailed_labels["roi_conf"].config(text=f"ROI Confidence: {roi_conf:.3f}")
+                    self._set_text(self.detailed_labels["roi_conf"], f"ROI Confidence: {roi_conf:.3f}")
                 else:
-                    self.detailed_labels["roi_conf"].config(text="ROI Confidence: -")
+                    self._set_text(self.detailed_labels["roi_conf"], "ROI Confidence: -")
                 
                 # FPS
                 fps = stats.get("capture_fps", 0.0)
-                self.detailed_labels["fps"].config(text=f"FPS Câmera: {fps:.1f}")
+                self._set_text(self.detailed_labels["fps"], f"FPS Câmera: {fps:.1f}")
                 
                 # Detecções por classe
-                self.detailed_labels["smudge"].config(text=f"Smudge: {stats.get('smudge', 0)}")
-                self.detailed_labels["simbolos"].config(text=f"Símbolos: {stats.get('simbolos', 0)}")
-                self.detailed_labels["blackdot"].config(text=f"BlackDot: {stats.get('blackdot', 0)}")
+                self._set_text(self.detailed_labels["smudge"], f"Smudge: {stats.get('smudge', 0)}")
+                self._set_text(self.detailed_labels["simbolos"], f"Símbolos: {stats.get('simbolos', 0)}")
+                self._set_text(self.detailed_labels["blackdot"], f"BlackDot: {stats.get('blackdot', 0)}")
                 
                 # Performance
                 inference_time = stats.get("inference_time_ms", 0.0)
-                self.detailed_labels["inference_time"].config(text=f"Tempo de Inferência: {inference_time:.1f}ms")
+                self._set_text(self.detailed_labels["inference_time"], f"Tempo de Inferência: {inference_time:.1f}ms")
                 
                 device = stats.get("device", "cuda:0")
-                self.detailed_labels["device"].config(text=f"Device: {device}")
+                self._set_text(self.detailed_labels["device"], f"Device: {device}")
                 
             except Exception as e:
                 print(f"Erro ao atualizar janela detalhada: {e}")
@@ -1209,12 +1465,13 @@ class YOLODetectionUI:
                     if name in self.model_vars:
                         self.model_vars[name].set(enabled)
             
-            # Carregar controles de foco
-            if "focus" in state:
+            # Carregar controles de foco (só se o painel de foco existir neste layout)
+            if "focus" in state and hasattr(self, 'focus_var'):
                 focus_state = state["focus"]
-                self.focus_var.set(focus_state.get("focus", 0))
+                focus_value = focus_state.get("focus", 0)
+                self.focus_var.set(focus_value)
                 self.auto_focus_var.set(focus_state.get("auto_focus", False))
-                self.focus_label.config(text=str(self.focus_var.get()))
+                self.focus_label.config(text=str(focus_value))
             
             print("✓ Configurações dos controles carregadas com sucesso")
             
@@ -1264,95 +1521,113 @@ class YOLODetectionUI:
     
     def _beep_focus(self, value):
         """Beep sonoro para ajuste de foco com sensibilidade."""
-        try:
-            import winsound
-            # Frequência baseada no valor (200-1000 Hz) - faixa mais ampla
-            frequency = int(200 + (value * 8))
-            
-            # Duração baseada na proximidade de valores "ótimos" (25%, 50%, 75%)
-            optimal_points = [25, 50, 75]
-            distances = [abs(value - point) for point in optimal_points]
-            min_distance = min(distances)
+        if not WINSOUND_AVAILABLE:
+            print(f"\a")  # Beep do sistema
+            return
+        
+        # Frequência baseada no valor (200-1000 Hz) - faixa mais ampla
+        frequency = int(200 + (value * 8))
+        
+        # Duração baseada na proximidade de valores "ótimos" (25%, 50%, 75%)
+        min_distance = _min_distance(_FOCUS_MIN_DIST, _FOCUS_OPTIMAL_POINTS, value)
+        
+        # Duração varia com proximidade do ponto ótimo
+        if min_distance <= 5:  # Muito próximo de um ponto ótimo
+            duration = 100  # Beep mais longo
+            # Frequência ligeiramente diferente para pontos ótimos
+            frequency = int(frequency * 1.1)
+        elif min_distance <= 10:  # Próximo de um ponto ótimo
+            duration = 75
+        else:  # Longe dos pontos ótimos
+            duration = 50
             
-            # Duração varia com proximidade do ponto ótimo
-            if min_distance <= 5:  # Muito próximo de um ponto ótimo
-                duration = 100  # Beep mais longo
-                # Frequência ligeiramente diferente para pontos ótimos
-                frequency = int(frequency * 1.1)
-            elif min_distance <= 10:  # Próximo de um ponto ótimo
-                duration = 75
-            else:  # Longe dos pontos ótimos
-                duration = 50
-                
-            # Volume (intensidade) baseado na mudança de valor
-            if hasattr(self, '_last_focus_value'):
-                change = abs(value - self._last_focus_value)
-                if change > 10:  # Mudança significativa
-                    # Beep duplo para mudanças grandes
-                    winsound.Beep(frequency, duration)
-                    winsound.Beep(int(frequency * 0.8), duration // 2)
-                else:
-                    winsound.Beep(frequency, duration)
+        # Volume (intensidade) baseado na mudança de valor
+        if hasattr(self, '_last_focus_value'):
+            change = abs(value - self._last_focus_value)
+            if change > 10:  # Mudança significativa
+                # Beep duplo para mudanças grandes
+                self._play_beeps((frequency, duration), (int(frequency * 0.8), duration // 2))
             else:
-                winsound.Beep(frequency, duration)
-                
-            # Armazenar valor anterior para próxima comparação
-            self._last_focus_value = value
+                self._play_beeps((frequency, duration))
+        else:
+            self._play_beeps((frequency, duration))
             
-        except ImportError:
-            # Fallback para sistemas sem winsound
-            print(f"\a")  # Beep do sistema
+        # Armazenar valor anterior para próxima comparação
+        self._last_focus_value = value
     
     def _beep_sharpness(self, value):
         """Beep sonoro para ajuste de nitidez com sensibilidade."""
-        try:
-            import winsound
-            # Frequência diferente para nitidez (400-1200 Hz) - faixa mais ampla
-            frequency = int(400 + (value * 8))
-            
-            # Duração baseada na proximidade de valores "ótimos" (30%, 60%, 90%)
-            optimal_points = [30, 60, 90]
-            distances = [abs(value - point) for point in optimal_points]
-            min_distance = min(distances)
+        if not WINSOUND_AVAILABLE:
+            print(f"\a")  # Beep do sistema
+            return
+        
+        # Frequência diferente para nitidez (400-1200 Hz) - faixa mais ampla
+        frequency = int(400 + (value * 8))
+        
+        # Duração baseada na proximidade de valores "ótimos" (30%, 60%, 90%)
+        min_distance = _min_distance(_SHARPNESS_MIN_DIST, _SHARPNESS_OPTIMAL_POINTS, value)
+        
+        # Duração varia com proximidade do ponto ótimo
+        if min_distance <= 5:  # Muito próximo de um ponto ótimo
+            duration = 80  # Beep mais longo
+            # Frequência ligeiramente diferente para pontos ótimos
+            frequency = int(frequency * 1.05)
+        elif min_distance <= 10:  # Próximo de um ponto ótimo
+            duration = 60
+        else:  # Longe dos pontos ótimos
+            duration = 40
             
-            # Duração varia com proximidade do ponto ótimo
-            if min_distance <= 5:  # Muito próximo de um ponto ótimo
-                duration = 80  # Beep mais longo
-                # Frequência ligeiramente diferente para pontos ótimos
-                frequency = int(frequency * 1.05)
-            elif min_distance <= 10:  # Próximo de um ponto ótimo
-                duration = 60
-            else:  # Longe dos pontos ótimos
-                duration = 40
-                
-            # Volume (intensidade) baseado na mudança de valor
-            if hasattr(self, '_last_sharpness_value'):
-                change = abs(value - self._last_sharpness_value)
-                if change > 8:  # Mudança significativa
-                    # Beep duplo para mudanças grandes
-                    winsound.Beep(frequency, duration)
-                    winsound.Beep(int(frequency * 0.9), duration // 2)
-                else:
-                    winsound.Beep(frequency, duration)
+        # Volume (intensidade) baseado na mudança de valor
+        if hasattr(self, '_last_sharpness_value'):
+            change = abs(value - self._last_sharpness_value)
+            if change > 8:  # Mudança significativa
+                # Beep duplo para mudanças grandes
+                self._play_beeps((frequency, duration), (int(frequency * 0.9), duration // 2))
             else:
-                winsound.Beep(frequency, duration)
-                
-            # Armazenar valor anterior para próxima comparação
-            self._last_sharpness_value = value
+                self._play_beeps((frequency, duration))
+        else:
+            self._play_beeps((frequency, duration))
             
-        except ImportError:
-            print(f"\a")  # Beep do sistema
+        # Armazenar valor anterior para próxima comparação
+        self._last_sharpness_value = value
+    
+    def _play_beeps(self, *tones):
+        """Enfileira beeps (frequência, duração) para o thread de som; winsound.Beep bloqueia e não roda no Tk."""
+        # Pedidos a menos de 40 ms do anterior são descartados (arraste de slider)
+        now = time.monotonic()
+        if now - self._last_beep_ts < 0.04:
+            return
+        self._last_beep_ts = now
+        if self._beep_queue is None:
+            self._beep_queue = queue.Queue(maxsize=1)
+            threading.Thread(target=self._beep_worker, name="BeepWorker", daemon=True).start()
+        try:
+            self._beep_queue.put_nowait(tones)
+        except queue.Full:
+            pass  # Ainda tocando o anterior: descartar
+    
+    def _beep_worker(self):
+        """Thread de som: toca as sequências enfileiradas por _play_beeps (frequência 0 = pausa)."""
+        while True:
+            for frequency, duration in self._beep_queue.get():
+                if frequency <= 0:
+                    time.sleep(duration / 1000.0)
+                    continue
+                try:
+                    winsound.Beep(frequency, duration)
+                except RuntimeError as e:
+                    # Sem dispositivo de som: descartar o resto da sequência, mas manter a thread viva
+                    logger.debug("Beep falhou: %s", e)
+                    break
     
     def _beep_test(self):
         """Teste do beep sonoro."""
-        try:
-            import winsound
-            # Sequência de beeps para teste
-            winsound.Beep(440, 100)  # Lá
-            self.root.after(150, lambda: winsound.Beep(554, 100))  # Dó#
-            self.root.after(300, lambda: winsound.Beep(659, 100))  # Mi
-        except ImportError:
+        if not WINSOUND_AVAILABLE:
             print(f"\a\a\a")  # Três beeps do sistema
+            return
+        
+        # Sequência de beeps para teste (no thread de som: Lá, Dó#, Mi com 50 ms de pausa)
+        self._play_beeps((440, 100), (0, 50), (554, 100), (0, 50), (659, 100))
     
     def _toggle_continuous_sound(self):
         """Ativa/desativa som contínuo."""
@@ -1361,25 +1636,13 @@ class YOLODetectionUI:
         if self.continuous_sound_active:
             # Iniciar som contínuo
             self._start_continuous_sound()
-            # Atualizar botão visualmente
-            for widget in self.root.winfo_children():
-                if isinstance(widget, ttk.Frame):
-                    for child in widget.winfo_children():
-                        if isinstance(child, ttk.Frame):
-                            for btn in child.winfo_children():
-                                if isinstance(btn, ttk.Button) and btn.cget('text') == '🔁':
-                                    btn.config(text='🔴')  # Indicar ativo
         else:
             # Parar som contínuo
             self._stop_continuous_sound()
-            # Atualizar botão visualmente
-            for widget in self.root.winfo_children():
-                if isinstance(widget, ttk.Frame):
-                    for child in widget.winfo_children():
-                        if isinstance(child, ttk.Frame):
-                            for btn in child.winfo_children():
-                                if isinstance(btn, ttk.Button) and btn.cget('text') == '🔴':
-                                    btn.config(text='🔁')  # Indicar inativo
+        
+        # Atualizar botão visualmente (referência guardada na criação, sem varrer a árvore de widgets)
+        if self.continuous_sound_btn is not None:
+            self.continuous_sound_btn.config(text='🔴' if self.continuous_sound_active else '🔁')
     
     def _start_continuous_sound(self):
         """Inicia som contínuo baseado nos valores atuais."""
@@ -1388,8 +1651,14 @@ class YOLODetectionUI:
             focus_value = self.focus_var.get()
             self._continuous_beep_focus(focus_value)
             
-            # Agendar próximo som
-            self.sound_timer = self.root.after(200, self._start_continuous_sound)
+            # Agendar próximo som: 200 ms enquanto o foco muda; parado, o intervalo dobra até 1 s
+            if focus_value == self._last_continuous_focus:
+                self._focus_still_ticks += 1
+            else:
+                self._focus_still_ticks = 0
+                self._last_continuous_focus = focus_value
+            delay = min(1000, 200 << min(self._focus_still_ticks, 3))
+            self.sound_timer = self.root.after(delay, self._start_continuous_sound)
     
     def _stop_continuous_sound(self):
         """Para o som contínuo."""
@@ -1399,27 +1668,29 @@ class YOLODetectionUI:
     
     def _continuous_beep_focus(self, value):
         """Beep contínuo para foco."""
-        try:
-            import winsound
-            # Frequência baseada no valor (200-1000 Hz)
-            frequency = int(200 + (value * 8))
-            
-            # Duração mais curta para som contínuo
-            duration = 30
-            
-            # Beep mais suave para som contínuo
-            winsound.Beep(frequency, duration)
-            
-        except ImportError:
+        if not WINSOUND_AVAILABLE:
             print(f"\a")  # Beep do sistema
+            return
+        
+        # Frequência baseada no valor (200-1000 Hz)
+        frequency = int(200 + (value * 8))
+        
+        # Duração mais curta para som contínuo
+        duration = 30
+        
+        # Beep mais suave para som contínuo
+        self._play_beeps((frequency, duration))
     
     def _open_stats_window(self):
-        """Abre janela de estatísticas detalhadas."""
+        """Abre janela de estatísticas detalhadas (criada uma vez; fechar apenas a oculta)."""
+        # Enquanto visível, a janela é atualizada junto com as estatísticas principais
+        self._stats_window_visible = True
         if not hasattr(self, 'stats_window') or not self.stats_window.winfo_exists():
             self.stats_window = tk.Toplevel(self.root)
             self.stats_window.title("📊 Estatísticas Detalhadas")
             self.stats_window.geometry("700x600")  # Maior para acomodar o sumário
             self.stats_window.resizable(True, True)
+            self.stats_window.protocol("WM_DELETE_WINDOW", self._hide_stats_window)
             
             # Frame principal
             main_frame = ttk.Frame(self.stats_window, padding="10")
@@ -1430,88 +1701,91 @@ class YOLODetectionUI:
             general_frame.pack(fill=tk.X, pady=5)
             
             self.detailed_labels = {}
+            # Fontes compartilhadas pelos labels (mantidas em self: tkfont.Font apaga a fonte ao ser coletada)
+            self._stats_font = tkfont.Font(root=self.stats_window, family="Arial", size=11)
+            self._stats_bold_font = tkfont.Font(root=self.stats_window, family="Arial", size=11, weight="bold")
             
             # Transfers
-            self.detailed_labels["transfers"] = ttk.Label(general_frame, text="Transfers Processados: 0", font=("Arial", 11, "bold"))
+            self.detailed_labels["transfers"] = ttk.Label(general_frame, text="Transfers Processados: 0", font=self._stats_bold_font)
             self.detailed_labels["transfers"].pack(anchor=tk.W)
             
             # ROI Confidence
-            self.detailed_labels["roi_conf"] = ttk.Label(general_frame, text="ROI Confidence: -", font=("Arial", 11))
+            self.detailed_labels["roi_conf"] = ttk.Label(general_frame, text="ROI Confidence: -", font=self._stats_font)
             self.detailed_labels["roi_conf"].pack(anchor=tk.W)
             
             # Performance
-            self.detailed_labels["fps"] = ttk.Label(general_frame, text="FPS Câmera: -", font=("Arial", 11))
+            self.detailed_labels["fps"] = ttk.Label(general_frame, text="FPS Câmera: -", font=self._stats_font)
             self.detailed_labels["fps"].pack(anchor=tk.W)
             
-            self.detailed_labels["capture_fps"] = ttk.Label(general_frame, text="FPS Captura: -", font=("Arial", 11))
+            self.detailed_labels["capture_fps"] = ttk.Label(general_frame, text="FPS Captura: -", font=self._stats_font)
             self.detailed_labels["capture_fps"].pack(anchor=tk.W)
             
             # Estatísticas por classe
             classes_frame = ttk.LabelFrame(main_frame, text="🎯 Detecções por Classe", padding="10")
             classes_frame.pack(fill=tk.X, pady=5)
             
-            self.detailed_labels["smudge"] = ttk.Label(classes_frame, text="Smudge: 0", font=("Arial", 11))
+            self.detailed_labels["smudge"] = ttk.Label(classes_frame, text="Smudge: 0", font=self._stats_font)
             self.detailed_labels["smudge"].pack(anchor=tk.W)
             
-            self.detailed_labels["simbolos"] = ttk.Label(classes_frame, text="Símbolos: 0", font=("Arial", 11))
+            self.detailed_labels["simbolos"] = ttk.Label(classes_frame, text="Símbolos: 0", font=self._stats_font)
             self.detailed_labels["simbolos"].pack(anchor=tk.W)
             
-            self.detailed_labels["blackdot"] = ttk.Label(classes_frame, text="BlackDot: 0", font=("Arial", 11))
+            self.detailed_labels["blackdot"] = ttk.Label(classes_frame, text="BlackDot: 0", font=self._stats_font)
             self.detailed_labels["blackdot"].pack(anchor=tk.W)
             
             # Estatísticas de performance
             perf_frame = ttk.LabelFrame(main_frame, text="⚡ Performance", padding="10")
             perf_frame.pack(fill=tk.X, pady=5)
             
-            self.detailed_labels["inference_time"] = ttk.Label(perf_frame, text="Tempo de Inferência: -", font=("Arial", 11))
+            self.detailed_labels["inference_time"] = ttk.Label(perf_frame, text="Tempo de Inferência: -", font=self._stats_font)
             self.detailed_labels["inference_time"].pack(anchor=tk.W)
             
-            self.detailed_labels["device"] = ttk.Label(perf_frame, text="Device: -", font=("Arial", 11))
+            self.detailed_labels["device"] = ttk.Label(perf_frame, text="Device: -", font=self._stats_font)
             self.detailed_labels["device"].pack(anchor=tk.W)
             
             # Estatísticas de transfer
             transfer_frame = ttk.LabelFrame(main_frame, text="🔄 Estatísticas de Transfer", padding="10")
             transfer_frame.pack(fill=tk.X, pady=5)
             
-            self.detailed_labels["transfer_count"] = ttk.Label(transfer_frame, text="Transfer #: 0", font=("Arial", 11))
+            self.detailed_labels["transfer_count"] = ttk.Label(transfer_frame, text="Transfer #: 0", font=self._stats_font)
             self.detailed_labels["transfer_count"].pack(anchor=tk.W)
             
-            self.detailed_labels["total_evaluated"] = ttk.Label(transfer_frame, text="Total Avaliados: 0", font=("Arial", 11))
+            self.detailed_labels["total_evaluated"] = ttk.Label(transfer_frame, text="Total Avaliados: 0", font=self._stats_font)
             self.detailed_labels["total_evaluated"].pack(anchor=tk.W)
             
-            self.detailed_labels["total_approved"] = ttk.Label(transfer_frame, text="Total Aprovados: 0", font=("Arial", 11))
+            self.detailed_labels["total_approved"] = ttk.Label(transfer_frame, text="Total Aprovados: 0", font=self._stats_font)
             self.detailed_labels["total_approved"].pack(anchor=tk.W)
             
-            self.detailed_labels["total_rejected"] = ttk.Label(transfer_frame, text="Total Reprovados: 0", font=("Arial", 11))
+            self.detailed_labels["total_rejected"] = ttk.Label(transfer_frame, text="Total Reprovados: 0", font=self._stats_font)
             self.detailed_labels["total_rejected"].pack(anchor=tk.W)
             
-            self.detailed_labels["approval_rate"] = ttk.Label(transfer_frame, text="Taxa Aprovação: 0.0%", font=("Arial", 11))
+            self.detailed_labels["approval_rate"] = ttk.Label(transfer_frame, text="Taxa Aprovação: 0.0%", font=self._stats_font)
             self.detailed_labels["approval_rate"].pack(anchor=tk.W)
             
             # Médias por transfer
             avg_frame = ttk.LabelFrame(main_frame, text="📊 Médias por Transfer", padding="10")
             avg_frame.pack(fill=tk.X, pady=5)
             
-            self.detailed_labels["avg_smudge"] = ttk.Label(avg_frame, text="Smudge Médio: 0.0", font=("Arial", 11))
+            self.detailed_labels["avg_smudge"] = ttk.Label(avg_frame, text="Smudge Médio: 0.0", font=self._stats_font)
             self.detailed_labels["avg_smudge"].pack(anchor=tk.W)
             
-            self.detailed_labels["avg_simbolos"] = ttk.Label(avg_frame, text="Símbolo Médio: 0.0", font=("Arial", 11))
+            self.detailed_labels["avg_simbolos"] = ttk.Label(avg_frame, text="Símbolo Médio: 0.0", font=self._stats_font)
             self.detailed_labels["avg_simbolos"].pack(anchor=tk.W)
             
-            self.detailed_labels["avg_blackdot"] = ttk.Label(avg_frame, text="BlackDot Médio: 0.0", font=("Arial", 11))
+            self.detailed_labels["avg_blackdot"] = ttk.Label(avg_frame, text="BlackDot Médio: 0.0", font=self._stats_font)
             self.detailed_labels["avg_blackdot"].pack(anchor=tk.W)
             
             # Classes detectadas médias
             detected_frame = ttk.LabelFrame(main_frame, text="🎯 Classes Detectadas Médias", padding="10")
             detected_frame.pack(fill=tk.X, pady=5)
             
-            self.detailed_labels["avg_smudge_detected"] = ttk.Label(detected_frame, text="Smudge Detectado: 0.0%", font=("Arial", 11))
+            self.detailed_labels["avg_smudge_detected"] = ttk.Label(detected_frame, text="Smudge Detectado: 0.0%", font=self._stats_font)
             self.detailed_labels["avg_smudge_detected"].pack(anchor=tk.W)
             
-            self.detailed_labels["avg_simbolos_detected"] = ttk.Label(detected_frame, text="Símbolos Detectado: 0.0%", font=("Arial", 11))
+            self.detailed_labels["avg_simbolos_detected"] = ttk.Label(detected_frame, text="Símbolos Detectado: 0.0%", font=self._stats_font)
             self.detailed_labels["avg_simbolos_detected"].pack(anchor=tk.W)
             
-            self.detailed_labels["avg_blackdot_detected"] = ttk.Label(detected_frame, text="BlackDot Detectado: 0.0%", font=("Arial", 11))
+            self.detailed_labels["avg_blackdot_detected"] = ttk.Label(detected_frame, text="BlackDot Detectado: 0.0%", font=self._stats_font)
             self.detailed_labels["avg_blackdot_detected"].pack(anchor=tk.W)
             
             # Sumário final de estatísticas
@@ -1525,6 +1799,9 @@ class YOLODetectionUI:
             self.summary_text = tk.Text(summary_frame, height=10, font=("Courier", 9), 
                                        wrap=tk.WORD, yscrollcommand=summary_scroll.set)
             self.summary_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            # Widget novo: o sumário precisa ser exibido de novo
+            self._rendered_summary = None
+            self._last_summary_text = None
             summary_scroll.config(command=self.summary_text.yview)
             
             self.detailed_labels["summary_text"] = self.summary_text
@@ -1539,42 +1816,32 @@ class YOLODetectionUI:
             if self.statistics_summary:
                 self._update_summary_display()
         else:
+            self.stats_window.deiconify()
             self.stats_window.lift()
+            self._refresh_detailed_labels()
             # Atualizar se temos sumário
             if hasattr(self, 'summary_text') and self.statistics_summary:
                 self._update_summary_display()
     
+    def _hide_stats_window(self):
+        """Oculta a janela de estatísticas detalhadas (reaberta sem reconstruir os widgets)."""
+        self._stats_window_visible = False
+        self.stats_window.withdraw()
+    
+    def _refresh_detailed_labels(self):
+        """Atualiza os labels da janela detalhada a partir de self.stats (só os valores que mudaram)."""
+        labels = self.detailed_labels
+        stats_get = self.stats.get
+        set_value = self._set_value
+        for name, key, default, fmt in _DETAILED_LABEL_FORMATS:
+            set_value(labels[name], stats_get(key, default), fmt)
+    
     def _update_detailed_stats(self):
-        """Atualiza estatísticas detalhadas."""
-        if hasattr(self, 'detailed_labels'):
+        """Atualiza estatísticas detalhadas (nada a fazer com a janela oculta)."""
+        if self._stats_window_visible:
             try:
-                # Atualizar estatísticas básicas
-                self.detailed_labels["fps"].config(text=f"FPS: {self.stats.get('fps', 0):.1f}")
-                self.detailed_labels["capture_fps"].config(text=f"FPS Captura: {self.stats.get('capture_fps', 0):.1f}")
-                self.detailed_labels["inference_time"].config(text=f"Tempo de Inferência: {self.stats.get('inference_ms', 0):.1f} ms")
-                self.detailed_labels["device"].config(text=f"Device: {self.stats.get('device', 'N/A')}")
-                
-                # Atualizar estatísticas de detecção
-                self.detailed_labels["smudge"].config(text=f"FIFA: {self.stats.get('smudge', 0)}")
-                self.detailed_labels["simbolos"].config(text=f"Símbolos: {self.stats.get('simbolos', 0)}")
-                self.detailed_labels["blackdot"].config(text=f"BlackDot: {self.stats.get('blackdot', 0)}")
-                
-                # Atualizar estatísticas de transfer
-                self.detailed_labels["transfer_count"].config(text=f"Transfer #: {self.stats.get('transfer_count', 0)}")
-                self.detailed_labels["total_evaluated"].config(text=f"Total Avaliados: {self.stats.get('total_evaluated', 0)}")
-                self.detailed_labels["total_approved"].config(text=f"Total Aprovados: {self.stats.get('total_approved', 0)}")
-                self.detailed_labels["total_rejected"].config(text=f"Total Reprovados: {self.stats.get('total_rejected', 0)}")
-                self.detailed_labels["approval_rate"].config(text=f"Taxa Aprovação: {self.stats.get('approval_rate', 0):.1f}%")
-                
-                # Atualizar médias por transfer
-                self.detailed_labels["avg_smudge"].config(text=f"Smudge Médio: {self.stats.get('avg_smudge', 0):.1f}")
-                self.detailed_labels["avg_simbolos"].config(text=f"Símbolo Médio: {self.stats.get('avg_simbolos', 0):.1f}")
-                self.detailed_labels["avg_blackdot"].config(text=f"BlackDot Médio: {self.stats.get('avg_blackdot', 0):.1f}")
-                
-                # Atualizar classes detectadas médias
-                self.detailed_labels["avg_smudge_detected"].config(text=f"Smudge Detectado: {self.stats.get('avg_smudge_detected', 0):.1f}%")
-                self.detailed_labels["avg_simbolos_detected"].config(text=f"Símbolo Detectado: {self.stats.get('avg_simbolos_detected', 0):.1f}%")
-                self.detailed_labels["avg_blackdot_detected"].config(text=f"BlackDot Detectado: {self.stats.get('avg_blackdot_detected', 0):.1f}%")
+                # Atualizar estatísticas básicas, de detecção, de transfer e médias
+                self._refresh_detailed_labels()
                 
                 # Atualizar sumário se disponível
                 self._update_summary_display()
@@ -1583,6 +1850,9 @@ class YOLODetectionUI:
                 
             except Exception as e:
                 print(f"❌ Erro ao atualizar estatísticas: {e}")
-                import traceback
-                traceback.print_exc()
+                # Stack trace no máximo a cada 5 s (erros em cascata, ex.: widgets destruídos)
+                now = time.monotonic()
+                if now - self._last_trace_ts > 5.0:
+                    self._last_trace_ts = now
+                    traceback.print_exc()
 